@@ -0,0 +1,59 @@
+"""Модуль содержит async-обёртки view для работы под ASGI.
+
+Django выполняет синхронные view под ASGI в одном потоке
+(thread_sensitive=True), поэтому запросы на чтение обрабатываются
+по очереди. Обёртка переносит безопасные запросы в общий пул потоков,
+где они выполняются параллельно, а изменяющие запросы оставляет
+в основном потоке.
+"""
+import functools
+
+from asgiref.sync import sync_to_async
+from django.db import connections
+from django.urls import URLPattern
+
+from rest_framework import permissions
+
+
+def render_in_thread(view):
+    """Возвращает функцию, которая вызывает и рендерит view в потоке пула."""
+
+    def render(request, *args, **kwargs):
+        try:
+            response = view(request, *args, **kwargs)
+            if hasattr(response, "render") and callable(response.render):
+                response.render()
+            return response
+        finally:
+            connections.close_all()
+
+    return render
+
+
+def async_read_view(view):
+    """Оборачивает синхронный view в async view."""
+    read_view = sync_to_async(render_in_thread(view), thread_sensitive=False)
+    write_view = sync_to_async(view, thread_sensitive=True)
+
+    @functools.wraps(view)
+    async def wrapper(request, *args, **kwargs):
+        if request.method in permissions.SAFE_METHODS:
+            return await read_view(request, *args, **kwargs)
+        return await write_view(request, *args, **kwargs)
+
+    return wrapper
+
+
+def wrap_read_views(urlpatterns, url_names):
+    """Заменяет view с именами из url_names на async-обёртки."""
+    return [
+        URLPattern(
+            pattern.pattern,
+            async_read_view(pattern.callback),
+            pattern.default_args,
+            pattern.name,
+        )
+        if pattern.name in url_names
+        else pattern
+        for pattern in urlpatterns
+    ]
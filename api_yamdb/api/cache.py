@@ -0,0 +1,38 @@
+"""Модуль содержит версионирование кеша каталога для приложения api.
+
+Все ключи кеша каталога включают текущую версию, поэтому любое
+изменение каталога делает старые записи недоступными за одну операцию.
+"""
+import hashlib
+import time
+
+from django.core.cache import cache
+
+CATALOG_VERSION_KEY = "catalog:version"
+
+
+def get_catalog_version():
+    """Возвращает текущую версию каталога."""
+    version = cache.get(CATALOG_VERSION_KEY)
+    if version is None:
+        # Начальное значение берётся из времени, чтобы после вытеснения
+        # ключа версия не совпала с версией старых записей.
+        cache.add(CATALOG_VERSION_KEY, int(time.time() * 1000))
+        version = cache.get(CATALOG_VERSION_KEY)
+    return version
+
+
+def bump_catalog_version():
+    """Увеличивает версию каталога."""
+    try:
+        cache.incr(CATALOG_VERSION_KEY)
+    except ValueError:
+        get_catalog_version()
+
+
+def make_catalog_key(prefix, *parts):
+    """Собирает ключ кеша каталога из префикса, версии и частей."""
+    digest = hashlib.sha1(
+        "\n".join(str(part) for part in parts).encode(),
+    ).hexdigest()
+    return f"catalog:{prefix}:{get_catalog_version()}:{digest}"
@@ -0,0 +1,146 @@
+"""Модуль содержит ленту изменений для приложения api.
+
+Курсор ленты имеет вид ``<микросекунды>.<тип>.<id>`` и указывает
+на последнее полученное клиентом изменение.
+"""
+import heapq
+from datetime import datetime, timedelta, timezone
+
+from django.db.models import Q
+
+from rest_framework import serializers
+
+from api.errors import ErrorMessage
+from api.serializers import (
+    CommentSerializer,
+    ReviewSerializer,
+    TitleReadSerializer,
+)
+from reviews.models import Comment, Review, Title, Tombstone
+
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+# Наибольшее значение 64-битного целого, которое принимает БД.
+MAX_ID = 2 ** 63 - 1
+
+ACTION_UPDATE = "update"
+ACTION_DELETE = "delete"
+
+# Порядок источников задаёт порядок изменений с одинаковым временем.
+SOURCES = ("title", "review", "comment", "tombstone")
+
+
+def get_source_queryset(kind):
+    """Возвращает queryset и поле времени изменения для источника."""
+    if kind == "title":
+        return (
+            Title.objects.select_related("category").prefetch_related("genre"),
+            "updated_at",
+        )
+    if kind == "review":
+        return Review.objects.select_related("author"), "updated_at"
+    if kind == "comment":
+        return Comment.objects.select_related("author"), "updated_at"
+    return Tombstone.objects.all(), "deleted_at"
+
+
+SERIALIZERS = {
+    "title": TitleReadSerializer,
+    "review": ReviewSerializer,
+    "comment": CommentSerializer,
+}
+
+
+def encode_cursor(changed_at, kind, pk):
+    """Кодирует позицию изменения в курсор."""
+    micros = (changed_at - EPOCH) // timedelta(microseconds=1)
+    return f"{micros}.{kind}.{pk}"
+
+
+def decode_cursor(cursor):
+    """Декодирует курсор в кортеж (время, индекс источника, id).
+
+    Время должно быть не раньше EPOCH, а id помещаться в целое
+    число БД.
+    """
+    try:
+        micros, kind, pk = cursor.split(".")
+        micros, pk = int(micros), int(pk)
+        if micros < 0 or not 0 <= pk <= MAX_ID:
+            raise ValueError
+        return (
+            EPOCH + timedelta(microseconds=micros),
+            SOURCES.index(kind),
+            pk,
+        )
+    except (ValueError, OverflowError):
+        raise serializers.ValidationError(ErrorMessage.INVALID_CURSOR_ERROR)
+
+
+def fetch_source(index, position, limit):
+    """Возвращает изменения одного источника после позиции курсора."""
+    queryset, time_field = get_source_queryset(SOURCES[index])
+    if position is not None:
+        changed_at, cursor_index, pk = position
+        if index > cursor_index:
+            condition = Q(**{f"{time_field}__gte": changed_at})
+        elif index == cursor_index:
+            condition = Q(**{f"{time_field}__gt": changed_at}) | Q(
+                **{time_field: changed_at, "pk__gt": pk},
+            )
+        else:
+            condition = Q(**{f"{time_field}__gt": changed_at})
+        queryset = queryset.filter(condition)
+    return [
+        (getattr(obj, time_field), index, obj.pk, obj)
+        for obj in queryset.order_by(time_field, "pk")[:limit]
+    ]
+
+
+def represent_change(changed_at, index, obj):
+    """Возвращает представление изменения для ответа."""
+    kind = SOURCES[index]
+    if kind == "tombstone":
+        return {
+            "cursor": encode_cursor(changed_at, kind, obj.pk),
+            "type": obj.model_name,
+            "id": obj.object_id,
+            "action": ACTION_DELETE,
+            "changed_at": changed_at,
+            "data": None,
+        }
+    return {
+        "cursor": encode_cursor(changed_at, kind, obj.pk),
+        "type": kind,
+        "id": obj.pk,
+        "action": ACTION_UPDATE,
+        "changed_at": changed_at,
+        "data": SERIALIZERS[kind](obj).data,
+    }
+
+
+def get_changes(since, limit):
+    """Возвращает упорядоченную страницу изменений после курсора since.
+
+    Каждый источник отдаёт не больше limit + 1 записей по индексу
+    времени изменения, после чего записи сливаются в общий порядок.
+    """
+    position = decode_cursor(since) if since else None
+    merged = list(
+        heapq.merge(
+            *(
+                fetch_source(index, position, limit + 1)
+                for index in range(len(SOURCES))
+            ),
+            key=lambda change: change[:3],
+        ),
+    )
+    page = merged[:limit]
+    results = [
+        represent_change(changed_at, index, obj)
+        for changed_at, index, _, obj in page
+    ]
+    return {
+        "next": results[-1]["cursor"] if results else since,
+        "has_more": len(merged) > limit,
+        "results": results,
+    }
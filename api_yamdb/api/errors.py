@@ -21,3 +21,12 @@ class ErrorMessage:
     MIN_SCORE_ERROR = "Минимальная оценка не может быть ниже: "
     ONLY_ONE_REVIEW_ERROR = "Можно написать только один отзыв!"
     NO_VIEW_IN_CONTEXT_ERROR = "Ошибка при обработке запроса"
+    INVALID_CURSOR_ERROR = "Некорректный курсор ленты изменений."
+    INVALID_FACETS_ERROR = "Допустимые значения facets: "
+    INVALID_LIMIT_ERROR = "Параметр limit должен быть положительным числом."
+    IMPORT_MISSING_COLUMNS_ERROR = "Нет столбцов: "
+    IMPORT_INVALID_ID_ERROR = "Некорректный id: "
+    IMPORT_DUPLICATE_ID_ERROR = "Повторяющийся id: "
+    IMPORT_DUPLICATE_VALUE_ERROR = "Повторяющееся значение "
+    IMPORT_EXISTING_VALUE_ERROR = "Значение занято другой записью в БД "
+    IMPORT_MISSING_REFERENCE_ERROR = "Ссылка на несуществующий объект "
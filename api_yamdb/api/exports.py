@@ -0,0 +1,135 @@
+"""Модуль содержит потоковую выгрузку данных для приложения api."""
+import csv
+import json
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+
+from reviews.models import Category, Comment, Genre, GenreTitle, Review, Title
+from reviews.models import User
+
+EXPORT_FORMAT_CSV = "csv"
+EXPORT_FORMAT_NDJSON = "ndjson"
+
+EXPORT_CONTENT_TYPES = {
+    EXPORT_FORMAT_CSV: "text/csv; charset=utf-8",
+    EXPORT_FORMAT_NDJSON: "application/x-ndjson; charset=utf-8",
+}
+
+# Имя выгрузки совпадает с именем CSV-файла в static/data,
+# колонки идут в том же порядке, что и в этих файлах. Поля, которых
+# в этих файлах нет, выгружаются после них, и load_data их пропускает.
+EXPORTS = {
+    "users": (
+        User,
+        (
+            ("id", "id"),
+            ("username", "username"),
+            ("email", "email"),
+            ("role", "role"),
+            ("bio", "bio"),
+            ("first_name", "first_name"),
+            ("last_name", "last_name"),
+        ),
+    ),
+    "category": (
+        Category,
+        (("id", "id"), ("name", "name"), ("slug", "slug")),
+    ),
+    "genre": (
+        Genre,
+        (("id", "id"), ("name", "name"), ("slug", "slug")),
+    ),
+    "titles": (
+        Title,
+        (
+            ("id", "id"),
+            ("name", "name"),
+            ("year", "year"),
+            ("category", "category_id"),
+            ("description", "description"),
+        ),
+    ),
+    "genre_title": (
+        GenreTitle,
+        (("id", "id"), ("title_id", "title_id"), ("genre_id", "genre_id")),
+    ),
+    "review": (
+        Review,
+        (
+            ("id", "id"),
+            ("title_id", "title_id"),
+            ("text", "text"),
+            ("author", "author_id"),
+            ("score", "score"),
+            ("pub_date", "pub_date"),
+        ),
+    ),
+    "comments": (
+        Comment,
+        (
+            ("id", "id"),
+            ("review_id", "review_id"),
+            ("text", "text"),
+            ("author", "author_id"),
+            ("pub_date", "pub_date"),
+        ),
+    ),
+}
+
+
+class Echo:
+    """Псевдо-буфер, возвращающий записанную строку вместо хранения."""
+
+    def write(self, value):
+        """Возвращает строку, переданную csv.writer."""
+        return value
+
+
+def format_csv_value(value):
+    """Приводит значение к виду, который ожидает команда load_data."""
+    if value is None:
+        return ""
+    if hasattr(value, "isoformat"):
+        return (
+            value.isoformat(timespec="milliseconds")
+            .replace("+00:00", "Z")
+        )
+    return value
+
+
+def iterate_rows(name):
+    """Итерирует строки выгрузки серверным курсором по частям."""
+    model, columns = EXPORTS[name]
+    return (
+        model.objects.order_by("pk")
+        .values_list(*(attname for _, attname in columns))
+        .iterator(chunk_size=settings.EXPORT_CHUNK_SIZE)
+    )
+
+
+def stream_csv(name):
+    """Генерирует выгрузку в формате CSV построчно."""
+    _, columns = EXPORTS[name]
+    writer = csv.writer(Echo())
+    yield writer.writerow(tuple(column for column, _ in columns))
+    for row in iterate_rows(name):
+        yield writer.writerow(tuple(format_csv_value(value) for value in row))
+
+
+def stream_ndjson(name):
+    """Генерирует выгрузку в формате NDJSON построчно."""
+    _, columns = EXPORTS[name]
+    keys = tuple(column for column, _ in columns)
+    for row in iterate_rows(name):
+        yield json.dumps(
+            dict(zip(keys, row)),
+            cls=DjangoJSONEncoder,
+            ensure_ascii=False,
+        ) + "\n"
+
+
+EXPORT_STREAMS = {
+    EXPORT_FORMAT_CSV: stream_csv,
+    EXPORT_FORMAT_NDJSON: stream_ndjson,
+}
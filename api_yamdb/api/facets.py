@@ -0,0 +1,96 @@
+"""Модуль содержит подсчёт фасетов списка произведений."""
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Count
+
+from rest_framework import serializers
+
+from api.cache import make_catalog_key
+from api.errors import ErrorMessage
+from api.metrics import record_cache
+from api.renderers import PreEncodedJSON
+from reviews.models import GenreTitle
+
+FACET_GENRE = "genre"
+FACET_CATEGORY = "category"
+FACET_YEAR = "year"
+FACETS = (FACET_GENRE, FACET_CATEGORY, FACET_YEAR)
+
+# Параметры запроса, не влияющие на результат фильтрации.
+NON_FILTER_PARAMS = ("facets", "page", "ordering")
+
+
+def parse_facets(value):
+    """Возвращает список фасетов из параметра facets."""
+    names = tuple(
+        sorted({name.strip() for name in value.split(",") if name.strip()}),
+    )
+    if not names or any(name not in FACETS for name in names):
+        raise serializers.ValidationError(
+            f"{ErrorMessage.INVALID_FACETS_ERROR}{', '.join(FACETS)}",
+        )
+    return names
+
+
+def count_facet(name, title_ids):
+    """Считает количество произведений по значениям одного фасета."""
+    if name == FACET_GENRE:
+        rows = (
+            GenreTitle.objects.filter(title_id__in=title_ids)
+            .values_list("genre__slug")
+            .annotate(count=Count("title_id"))
+        )
+    elif name == FACET_CATEGORY:
+        rows = (
+            title_ids.model.objects.filter(
+                pk__in=title_ids,
+                category__isnull=False,
+            )
+            .values_list("category__slug")
+            .annotate(count=Count("pk"))
+        )
+    else:
+        rows = (
+            title_ids.model.objects.filter(pk__in=title_ids)
+            .values_list("year")
+            .annotate(count=Count("pk"))
+        )
+    return [
+        {"value": value, "count": count}
+        for value, count in sorted(
+            rows.order_by(),
+            key=lambda row: (-row[1], row[0]),
+        )
+    ]
+
+
+def count_facets(queryset, names):
+    """Считает фасеты queryset и кодирует их в JSON."""
+    title_ids = queryset.order_by().values("pk")
+    return PreEncodedJSON.encode(
+        {name: count_facet(name, title_ids) for name in names},
+    )
+
+
+def get_facets(queryset, names, query_params):
+    """Возвращает фасеты отфильтрованного queryset с кешированием.
+
+    Ключ кеша строится из параметров фильтрации и версии каталога.
+    Фасеты хранятся в кеше уже закодированными в JSON. Без
+    CATALOG_CACHE_ENABLED фасеты считаются при каждом запросе.
+    """
+    if not settings.CATALOG_CACHE_ENABLED:
+        return count_facets(queryset, names)
+    filters = sorted(
+        (key, value)
+        for key, values in query_params.lists()
+        if key not in NON_FILTER_PARAMS
+        for value in values
+    )
+    key = make_catalog_key("facets", names, filters)
+    facets = cache.get(key)
+    record_cache("facets", facets is not None)
+    if facets is None:
+        facets = count_facets(queryset, names)
+        cache.set(key, facets, settings.FACETS_CACHE_TIMEOUT)
+    return facets
@@ -1,21 +1,37 @@
 """Модуль содержит фильтры для приложения api."""
 from django_filters import rest_framework as filters
 
-from reviews.models import Title
+from reviews.models import GenreTitle, Title
 
 
 class TitleFilter(filters.FilterSet):
     """Фильтрует произведения по полям."""
 
-    genre = filters.CharFilter(field_name="genre__slug", lookup_expr="exact")
+    genre = filters.CharFilter(method="filter_genre")
     category = filters.CharFilter(
         field_name="category__slug",
         lookup_expr="exact",
     )
     name = filters.CharFilter(field_name="name", lookup_expr="contains")
+    year_min = filters.NumberFilter(field_name="year", lookup_expr="gte")
+    year_max = filters.NumberFilter(field_name="year", lookup_expr="lte")
+    rating_min = filters.NumberFilter(field_name="rating", lookup_expr="gte")
+    rating_max = filters.NumberFilter(field_name="rating", lookup_expr="lte")
 
     class Meta:
         """Определяет настройки фильтра TitleFilter."""
 
         model = Title
-        fields = "__all__"
+        fields = ("genre", "category", "name", "year")
+
+    def filter_genre(self, queryset, name, value):
+        """Фильтрует по точному slug жанра подзапросом к GenreTitle.
+
+        Подзапрос IN выбирает id произведений по индексу связей жанра
+        и не дублирует произведения, поэтому DISTINCT не нужен.
+        """
+        return queryset.filter(
+            pk__in=GenreTitle.objects.filter(genre__slug=value).values(
+                "title_id",
+            ),
+        )
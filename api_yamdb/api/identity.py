@@ -0,0 +1,57 @@
+"""Модуль содержит identity map объектов, загруженных за один запрос.
+
+View, сериалайзеры и permissions получают общий экземпляр через
+объект запроса, поэтому каждая строка БД загружается не более
+одного раза за запрос.
+"""
+
+
+class IdentityMap:
+    """Хранит загруженные объекты по модели и первичному ключу."""
+
+    def __init__(self):
+        """Создаёт пустую identity map."""
+        self.objects = {}
+
+    @staticmethod
+    def make_key(model, pk):
+        """Возвращает ключ объекта в identity map."""
+        model = model._meta.concrete_model
+        return model, model._meta.pk.to_python(pk)
+
+    def add(self, obj):
+        """Добавляет объект и возвращает экземпляр из identity map."""
+        return self.objects.setdefault(self.make_key(type(obj), obj.pk), obj)
+
+    def get(self, model, pk, loader):
+        """Возвращает объект из identity map или загружает его loader."""
+        key = self.make_key(model, pk)
+        if key not in self.objects:
+            self.objects[key] = loader()
+        return self.objects[key]
+
+    def attach(self, obj, *field_names):
+        """Подставляет в связи объекта уже загруженные объекты."""
+        for field_name in field_names:
+            field = obj._meta.get_field(field_name)
+            pk = getattr(obj, field.attname)
+            if pk is None or field.is_cached(obj):
+                continue
+            related = self.objects.get(self.make_key(field.related_model, pk))
+            if related is not None:
+                field.set_cached_value(obj, related)
+        return obj
+
+
+def get_identity_map(request):
+    """Возвращает identity map запроса, создавая её при первом обращении.
+
+    Аутентифицированный пользователь запроса сразу добавляется в map.
+    """
+    identity_map = getattr(request, "_identity_map", None)
+    if identity_map is None:
+        identity_map = IdentityMap()
+        if request.user.is_authenticated:
+            identity_map.add(request.user)
+        request._identity_map = identity_map
+    return identity_map
@@ -0,0 +1,59 @@
+"""Модуль содержит отправку писем для приложения api."""
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.core.mail import send_mail
+
+logger = logging.getLogger(__name__)
+
+outbox = ThreadPoolExecutor(
+    max_workers=settings.EMAIL_DISPATCH_WORKERS,
+    thread_name_prefix="email",
+)
+outbox_lock = threading.Lock()
+outbox_depth = 0
+
+
+def get_outbox_depth():
+    """Возвращает количество писем, ожидающих отправки."""
+    return outbox_depth
+
+
+def send_confirmation_code(email, confirmation_code):
+    """Отправляет письмо с confirmation code."""
+    send_mail(
+        "yamdb код подтверждения",
+        f"Код подтверждения: {confirmation_code}",
+        settings.EMAIL_BACKEND,
+        (email,),
+        fail_silently=False,
+    )
+
+
+def send_from_outbox(email, confirmation_code):
+    """Отправляет письмо из пула и уменьшает глубину очереди."""
+    global outbox_depth
+    try:
+        send_confirmation_code(email, confirmation_code)
+    except Exception:
+        logger.exception(f"Не удалось отправить письмо на {email}")
+    finally:
+        with outbox_lock:
+            outbox_depth -= 1
+
+
+def dispatch_confirmation_code(email, confirmation_code):
+    """Ставит письмо в очередь или отправляет его сразу.
+
+    В фоне письма отправляются при включённой настройке
+    EMAIL_ASYNC_DISPATCH, чтобы запрос не ждал почтовый сервер.
+    """
+    global outbox_depth
+    if not settings.EMAIL_ASYNC_DISPATCH:
+        send_confirmation_code(email, confirmation_code)
+        return
+    with outbox_lock:
+        outbox_depth += 1
+    outbox.submit(send_from_outbox, email, confirmation_code)
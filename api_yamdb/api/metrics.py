@@ -0,0 +1,475 @@
+"""Модуль содержит метрики в формате Prometheus для приложения api.
+
+Каждый процесс накапливает счётчики и гистограммы в памяти и не чаще
+раза в METRICS_FLUSH_INTERVAL секунд сохраняет их в файл <pid>.json
+каталога METRICS_DIR. Эндпоинт /metrics суммирует файлы всех
+процессов, поэтому метрики собираются со всех воркеров без внешних
+сервисов. Счётчики завершившихся процессов переносятся в общий файл
+aggregate.json, а их показатели текущего состояния отбрасываются.
+"""
+import atexit
+import json
+import os
+import tempfile
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+
+from django.conf import settings
+
+from api.mail import get_outbox_depth
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None
+
+DURATION_BUCKETS = (
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+)
+UNKNOWN_VIEW = "unknown"
+AGGREGATE_FILE = "aggregate.json"
+LOCK_FILE = ".lock"
+
+recording = ContextVar("metrics_recording", default=True)
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Имя метрики: тип и описание.
+METRICS = {
+    "yamdb_http_requests_total": (
+        "counter",
+        "Количество обработанных запросов.",
+    ),
+    "yamdb_http_request_duration_seconds": (
+        "histogram",
+        "Время обработки запроса в секундах.",
+    ),
+    "yamdb_db_queries_total": (
+        "counter",
+        "Количество SQL-запросов.",
+    ),
+    "yamdb_db_query_duration_seconds_total": (
+        "counter",
+        "Суммарное время SQL-запросов в секундах.",
+    ),
+    "yamdb_cache_requests_total": (
+        "counter",
+        "Количество обращений к кешу по результату.",
+    ),
+    "yamdb_cache_hit_ratio": (
+        "gauge",
+        "Доля попаданий в кеш.",
+    ),
+    "yamdb_email_outbox_depth": (
+        "gauge",
+        "Количество писем, ожидающих отправки.",
+    ),
+    "yamdb_process_resident_memory_bytes": (
+        "gauge",
+        "Резидентная память процесса в байтах.",
+    ),
+}
+
+
+def make_key(name, labels):
+    """Возвращает ключ метрики с упорядоченными метками."""
+    return name, tuple(sorted(labels.items()))
+
+
+def get_resident_memory():
+    """Возвращает резидентную память процесса или None."""
+    try:
+        with open("/proc/self/statm") as statm:
+            pages = int(statm.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def is_alive(pid):
+    """Проверяет, что процесс с этим pid существует."""
+    if pid == os.getpid():
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except OSError:
+        return True
+    return True
+
+
+class MetricsStore:
+    """Хранит метрики процесса и сохраняет их в файл."""
+
+    def __init__(self):
+        """Создаёт пустое хранилище."""
+        self.exit_registered = False
+        self.reset()
+
+    def reset(self):
+        """Начинает хранилище заново.
+
+        Вызывается и в дочернем процессе после fork, чтобы он не
+        записывал счётчики родителя в свой файл.
+        """
+        self.lock = threading.Lock()
+        self.flush_lock = threading.Lock()
+        self.started = time.time()
+        self.counters = {}
+        self.histograms = {}
+        self.flushed = 0
+        self.restored = False
+
+    def clear(self):
+        """Удаляет накопленные значения."""
+        with self.lock:
+            self.counters.clear()
+            self.histograms.clear()
+            self.flushed = 0
+
+    def inc(self, name, labels, value=1):
+        """Увеличивает счётчик."""
+        key = make_key(name, labels)
+        with self.lock:
+            self.counters[key] = self.counters.get(key, 0) + value
+
+    def observe(self, name, labels, value):
+        """Добавляет значение в гистограмму."""
+        key = make_key(name, labels)
+        with self.lock:
+            histogram = self.histograms.get(key)
+            if histogram is None:
+                histogram = self.histograms[key] = {
+                    "buckets": [0] * (len(DURATION_BUCKETS) + 1),
+                    "sum": 0,
+                }
+            histogram["buckets"][bisect_left(DURATION_BUCKETS, value)] += 1
+            histogram["sum"] += value
+
+    def get_path(self):
+        """Возвращает путь к файлу метрик процесса."""
+        return Path(settings.METRICS_DIR) / f"{os.getpid()}.json"
+
+    def restore(self, path):
+        """Добавляет счётчики прежнего процесса с тем же pid.
+
+        Так суммы по всем процессам не уменьшаются после
+        переиспользования pid.
+        """
+        self.restored = True
+        with lock_directory(path.parent):
+            previous = read_metrics_file(path)
+        if previous is None or previous["started"] == self.started:
+            return
+        with self.lock:
+            merge(previous, self.counters, self.histograms)
+
+    def snapshot(self):
+        """Возвращает метрики процесса для записи в файл."""
+        with self.lock:
+            return {
+                "pid": os.getpid(),
+                "started": self.started,
+                **dump(self.counters, self.histograms),
+                "gauges": [
+                    [name, {}, value]
+                    for name, value in (
+                        ("yamdb_email_outbox_depth", get_outbox_depth()),
+                        (
+                            "yamdb_process_resident_memory_bytes",
+                            get_resident_memory(),
+                        ),
+                    )
+                    if value is not None
+                ],
+            }
+
+    def flush(self, force=False):
+        """Сохраняет метрики в файл, если прошёл интервал записи."""
+        now = time.monotonic()
+        if not force and now - self.flushed < settings.METRICS_FLUSH_INTERVAL:
+            return
+        if not self.exit_registered:
+            self.exit_registered = True
+            atexit.register(self.flush_at_exit)
+        with self.flush_lock:
+            self.flushed = now
+            path = self.get_path()
+            path.parent.mkdir(parents=True, exist_ok=True)
+            if not self.restored:
+                self.restore(path)
+            write_metrics_file(path, self.snapshot())
+
+    def flush_at_exit(self):
+        """Сохраняет метрики при завершении процесса, если они есть.
+
+        Обработчик наследуется дочерними процессами после fork,
+        поэтому процессы без запросов файл не создают.
+        """
+        if self.counters or self.histograms:
+            self.flush(force=True)
+
+
+store = MetricsStore()
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=store.reset)
+
+
+def dump(counters, histograms):
+    """Возвращает счётчики и гистограммы в виде списков для JSON."""
+    return {
+        "counters": [
+            [name, dict(labels), value]
+            for (name, labels), value in counters.items()
+        ],
+        "histograms": [
+            [name, dict(labels), histogram["buckets"], histogram["sum"]]
+            for (name, labels), histogram in histograms.items()
+        ],
+    }
+
+
+@contextmanager
+def lock_directory(directory):
+    """Блокирует каталог метрик между процессами на время чтения."""
+    if fcntl is None:  # pragma: no cover
+        yield
+        return
+    directory.mkdir(parents=True, exist_ok=True)
+    with open(directory / LOCK_FILE, "w") as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock, fcntl.LOCK_UN)
+
+
+def write_metrics_file(path, data):
+    """Атомарно записывает файл метрик."""
+    descriptor, temporary = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    with os.fdopen(descriptor, "w") as file:
+        json.dump(data, file)
+    os.replace(temporary, path)
+
+
+def read_metrics_file(path):
+    """Читает файл метрик процесса или возвращает None."""
+    try:
+        with open(path) as file:
+            return json.load(file)
+    except (OSError, ValueError):
+        return None
+
+
+def merge(data, counters, histograms):
+    """Добавляет счётчики и гистограммы файла к словарям."""
+    for name, labels, value in data["counters"]:
+        key = make_key(name, labels)
+        counters[key] = counters.get(key, 0) + value
+    for name, labels, buckets, total in data["histograms"]:
+        key = make_key(name, labels)
+        histogram = histograms.setdefault(
+            key,
+            {"buckets": [0] * len(buckets), "sum": 0},
+        )
+        histogram["buckets"] = [
+            current + added
+            for current, added in zip(histogram["buckets"], buckets)
+        ]
+        histogram["sum"] += total
+
+
+def collect():
+    """Суммирует метрики всех процессов.
+
+    Возвращает словари счётчиков, гистограмм и показателей.
+    """
+    store.flush(force=True)
+    directory = Path(settings.METRICS_DIR)
+    counters, histograms, gauges = {}, {}, {}
+    with lock_directory(directory):
+        dead = []
+        for path in sorted(directory.glob("*.json")):
+            data = read_metrics_file(path)
+            if data is None:
+                continue
+            merge(data, counters, histograms)
+            if path.name == AGGREGATE_FILE:
+                continue
+            if not is_alive(data["pid"]):
+                dead.append((path, data))
+                continue
+            add_gauges(data, gauges)
+        if dead:
+            compact(directory, dead)
+    add_hit_ratios(counters, gauges)
+    return counters, histograms, gauges
+
+
+def add_gauges(data, gauges):
+    """Добавляет показатели текущего состояния процесса."""
+    for name, labels, value in data["gauges"]:
+        if name == "yamdb_process_resident_memory_bytes":
+            labels = {"pid": str(data["pid"])}
+        key = make_key(name, labels)
+        gauges[key] = gauges.get(key, 0) + value
+
+
+def compact(directory, dead):
+    """Переносит счётчики завершившихся процессов в общий файл.
+
+    Так число файлов в METRICS_DIR не растёт с каждым перезапуском
+    воркеров. Вызывается под блокировкой каталога.
+    """
+    path = directory / AGGREGATE_FILE
+    counters, histograms = {}, {}
+    aggregate = read_metrics_file(path)
+    for data in (aggregate, *(data for _, data in dead)):
+        if data is not None:
+            merge(data, counters, histograms)
+    write_metrics_file(path, dump(counters, histograms))
+    for dead_path, _ in dead:
+        dead_path.unlink(missing_ok=True)
+
+
+def add_hit_ratios(counters, gauges):
+    """Добавляет доли попаданий в кеш по счётчикам обращений."""
+    totals = {}
+    for (name, labels), value in counters.items():
+        if name != "yamdb_cache_requests_total":
+            continue
+        labels = dict(labels)
+        hits, total = totals.get(labels["cache"], (0, 0))
+        if labels["result"] == "hit":
+            hits += value
+        totals[labels["cache"]] = hits, total + value
+    for cache_name, (hits, total) in totals.items():
+        gauges[make_key("yamdb_cache_hit_ratio", {"cache": cache_name})] = (
+            hits / total
+        )
+
+
+def format_labels(labels):
+    """Возвращает метки в формате Prometheus."""
+    if not labels:
+        return ""
+    escaped = (
+        (name, str(value).replace("\\", r"\\").replace('"', r"\"").replace(
+            "\n",
+            r"\n",
+        ))
+        for name, value in labels
+    )
+    return "{" + ",".join(f'{name}="{value}"' for name, value in escaped) + "}"
+
+
+def format_value(value):
+    """Возвращает значение в формате Prometheus."""
+    return str(value) if isinstance(value, int) else repr(float(value))
+
+
+def render_metrics():
+    """Возвращает метрики всех процессов в текстовом формате Prometheus."""
+    counters, histograms, gauges = collect()
+    lines = []
+    for name, (kind, description) in METRICS.items():
+        lines.append(f"# HELP {name} {description}")
+        lines.append(f"# TYPE {name} {kind}")
+        if kind == "histogram":
+            for (_, labels), histogram in sorted(
+                item for item in histograms.items() if item[0][0] == name
+            ):
+                lines.extend(format_histogram(name, labels, histogram))
+            continue
+        values = counters if kind == "counter" else gauges
+        for (_, labels), value in sorted(
+            item for item in values.items() if item[0][0] == name
+        ):
+            lines.append(
+                f"{name}{format_labels(labels)} {format_value(value)}",
+            )
+    return "\n".join(lines) + "\n"
+
+
+def format_histogram(name, labels, histogram):
+    """Возвращает строки гистограммы с накопленными корзинами."""
+    count = 0
+    bounds = (*(repr(bound) for bound in DURATION_BUCKETS), "+Inf")
+    for bound, bucket in zip(bounds, histogram["buckets"]):
+        count += bucket
+        bucket_labels = format_labels((*labels, ("le", bound)))
+        yield f"{name}_bucket{bucket_labels} {count}"
+    yield f"{name}_sum{format_labels(labels)} {format_value(histogram['sum'])}"
+    yield f"{name}_count{format_labels(labels)} {count}"
+
+
+def get_view_labels(request):
+    """Возвращает метки представления и действия viewset запроса."""
+    method = request.method.lower()
+    match = getattr(request, "resolver_match", None)
+    if match is None:
+        return {"view": UNKNOWN_VIEW, "action": method}
+    actions = getattr(match.func, "actions", None) or {}
+    return {
+        "view": match.url_name or UNKNOWN_VIEW,
+        "action": actions.get(method, method),
+    }
+
+
+@contextmanager
+def pause_recording():
+    """Не учитывает обращения к кешу внутри блока."""
+    token = recording.set(False)
+    try:
+        yield
+    finally:
+        recording.reset(token)
+
+
+def record_cache(cache_name, hit):
+    """Учитывает обращение к кешу."""
+    if not recording.get():
+        return
+    store.inc(
+        "yamdb_cache_requests_total",
+        {"cache": cache_name, "result": "hit" if hit else "miss"},
+    )
+
+
+def record_request(request, status_code, duration, queries):
+    """Учитывает обработанный запрос и его SQL-запросы."""
+    labels = get_view_labels(request)
+    store.inc(
+        "yamdb_http_requests_total",
+        {**labels, "status": str(status_code)},
+    )
+    store.observe("yamdb_http_request_duration_seconds", labels, duration)
+    for alias, (count, seconds) in queries.items():
+        query_labels = {**labels, "alias": alias}
+        store.inc("yamdb_db_queries_total", query_labels, count)
+        store.inc(
+            "yamdb_db_query_duration_seconds_total",
+            query_labels,
+            seconds,
+        )
+    store.flush()
+
+
+class QueryCounter:
+    """Наблюдатель SQL-запросов, считающий их количество и время."""
+
+    def __init__(self):
+        """Создаёт пустые счётчики по подключениям к БД."""
+        self.lock = threading.Lock()
+        self.queries = {}
+
+    def __call__(self, sql, params, many, context, duration):
+        """Учитывает выполненный запрос."""
+        alias = context["connection"].alias
+        with self.lock:
+            count, seconds = self.queries.get(alias, (0, 0))
+            self.queries[alias] = (count + 1, seconds + duration)
@@ -0,0 +1,238 @@
+"""Модуль содержит middleware приложения api."""
+import cProfile
+import random
+import re
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.utils.cache import patch_vary_headers
+from django.utils.text import compress_string
+
+from rest_framework.exceptions import AuthenticationFailed
+
+from api.cache import make_catalog_key
+from api.metrics import (
+    QueryCounter,
+    pause_recording,
+    record_cache,
+    record_request,
+)
+from api.profiling import UNKNOWN_URL_NAME, save_profile
+from api.query_hooks import observe_iterator, observe_queries
+from api.slow_queries import SlowQueryRecorder
+from api_yamdb.routers import use_primary
+
+ACCEPTS_GZIP = re.compile(r"\bgzip\b")
+CACHE_STATUS_HEADER = "X-Catalog-Cache"
+PROFILE_REQUEST_HEADER = "HTTP_X_PROFILE"
+PROFILE_RESPONSE_HEADER = "X-Profile"
+# Ключ окружения WSGI запросов прогрева из api_yamdb.startup. Клиент
+# не может его передать: заголовки попадают в окружение с префиксом HTTP_.
+WARM_UP_MARKER = "yamdb.warm_up"
+# Заголовки, которые зависят от выбранного варианта тела ответа.
+BODY_HEADERS = ("content-encoding", "content-length", "content-type")
+
+
+class CatalogCacheMiddleware:
+    """Кеширует ответы каталога вместе со сжатым gzip вариантом.
+
+    Ответ сжимается один раз при сохранении в кеш, если он не меньше
+    CATALOG_CACHE_GZIP_MIN_LENGTH байт, а вариант выбирается
+    по заголовку Accept-Encoding. Кешируются только анонимные
+    GET-запросы к CATALOG_CACHE_URL_NAMES и только при
+    CATALOG_CACHE_ENABLED. Ответ для кеша читается из основной БД.
+    """
+
+    def __init__(self, get_response):
+        """Сохраняет следующий обработчик цепочки middleware."""
+        self.get_response = get_response
+
+    def __call__(self, request):
+        """Сохраняет в кеш ответ, если его можно кешировать."""
+        response = self.get_response(request)
+        key = getattr(request, "_catalog_cache_key", None)
+        if (
+            key is None
+            or response.status_code != 200
+            or response.streaming
+            or response.has_header("Set-Cookie")
+        ):
+            return response
+        content = response.content
+        entry = {
+            "content": content,
+            "gzip": (
+                compress_string(content)
+                if len(content) >= settings.CATALOG_CACHE_GZIP_MIN_LENGTH
+                else None
+            ),
+            "content_type": response["Content-Type"],
+            "headers": [
+                (header, value)
+                for header, value in response.items()
+                if header.lower() not in BODY_HEADERS
+            ],
+        }
+        cache.set(key, entry, settings.CATALOG_CACHE_TIMEOUT)
+        return self.build_response(request, entry, "MISS")
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        """Возвращает ответ из кеша или помечает запрос для кеширования."""
+        if (
+            not settings.CATALOG_CACHE_ENABLED
+            or request.method != "GET"
+            or request.resolver_match.url_name
+            not in settings.CATALOG_CACHE_URL_NAMES
+            or "HTTP_AUTHORIZATION" in request.META
+        ):
+            return None
+        key = make_catalog_key(
+            "response",
+            request.scheme,
+            request.get_host(),
+            request.path,
+            sorted(request.GET.lists()),
+            request.META.get("HTTP_ACCEPT", ""),
+        )
+        entry = cache.get(key)
+        record_cache("catalog_response", entry is not None)
+        if entry is not None:
+            return self.build_response(request, entry, "HIT")
+        # Ответ сохраняется под новой версией каталога, поэтому он
+        # не должен строиться по отстающей реплике.
+        use_primary()
+        request._catalog_cache_key = key
+        return None
+
+    def build_response(self, request, entry, status):
+        """Собирает ответ из записи кеша с учётом Accept-Encoding."""
+        accepts_gzip = ACCEPTS_GZIP.search(
+            request.META.get("HTTP_ACCEPT_ENCODING", ""),
+        )
+        if entry["gzip"] is not None and accepts_gzip:
+            response = HttpResponse(
+                entry["gzip"],
+                content_type=entry["content_type"],
+            )
+            response["Content-Encoding"] = "gzip"
+        else:
+            response = HttpResponse(
+                entry["content"],
+                content_type=entry["content_type"],
+            )
+        for header, value in entry["headers"]:
+            response[header] = value
+        response["Content-Length"] = str(len(response.content))
+        response[CACHE_STATUS_HEADER] = status
+        patch_vary_headers(response, ("Accept", "Accept-Encoding"))
+        return response
+
+
+def is_admin_request(request):
+    """Проверяет, что запрос отправлен администратором с JWT-токеном."""
+    # simplejwt нужен только запросам с X-Profile и не загружается
+    # вместе с middleware.
+    from rest_framework_simplejwt.authentication import JWTAuthentication
+
+    try:
+        authenticated = JWTAuthentication().authenticate(request)
+    except AuthenticationFailed:
+        return False
+    if authenticated is None:
+        return False
+    user = authenticated[0]
+    return user.is_superuser or user.is_admin
+
+
+def is_warm_up_request(request):
+    """Проверяет, что запрос выполняется прогревом при запуске."""
+    return request.META.get(WARM_UP_MARKER, False)
+
+
+class ProfilingMiddleware:
+    """Профилирует долю запросов и запросы администраторов с X-Profile.
+
+    Доля задаётся PROFILING_SAMPLE_RATE. Путь к сохранённому профилю
+    возвращается в заголовке X-Profile ответа.
+    """
+
+    def __init__(self, get_response):
+        """Сохраняет следующий обработчик цепочки middleware."""
+        self.get_response = get_response
+
+    def __call__(self, request):
+        """Выполняет запрос под профилировщиком, если он выбран."""
+        if not self.should_profile(request):
+            return self.get_response(request)
+        profiler = cProfile.Profile()
+        profiler.enable()
+        try:
+            response = self.get_response(request)
+        finally:
+            profiler.disable()
+        resolver_match = getattr(request, "resolver_match", None)
+        url_name = (
+            resolver_match.url_name if resolver_match else None
+        ) or UNKNOWN_URL_NAME
+        name = save_profile(profiler, url_name)
+        response[PROFILE_RESPONSE_HEADER] = f"{url_name}/{name}"
+        return response
+
+    def should_profile(self, request):
+        """Проверяет, нужно ли профилировать запрос."""
+        if is_warm_up_request(request):
+            return False
+        if PROFILE_REQUEST_HEADER in request.META:
+            return is_admin_request(request)
+        rate = settings.PROFILING_SAMPLE_RATE
+        return rate > 0 and random.random() < rate
+
+
+class SlowQueryMiddleware:
+    """Записывает медленные SQL-запросы всех подключений к БД.
+
+    Учитываются и запросы, выполненные при чтении потокового ответа.
+    """
+
+    def __init__(self, get_response):
+        """Сохраняет следующий обработчик цепочки middleware."""
+        self.get_response = get_response
+
+    def __call__(self, request):
+        """Выполняет запрос с наблюдением за SQL-запросами."""
+        recorder = SlowQueryRecorder(request)
+        with observe_queries(recorder):
+            response = self.get_response(request)
+        if response.streaming:
+            response.streaming_content = observe_iterator(
+                response.streaming_content,
+                recorder,
+            )
+        return response
+
+
+class MetricsMiddleware:
+    """Собирает метрики запросов и их SQL-запросов для /metrics."""
+
+    def __init__(self, get_response):
+        """Сохраняет следующий обработчик цепочки middleware."""
+        self.get_response = get_response
+
+    def __call__(self, request):
+        """Выполняет запрос и учитывает его время и SQL-запросы."""
+        if is_warm_up_request(request):
+            with pause_recording():
+                return self.get_response(request)
+        queries = QueryCounter()
+        started = time.perf_counter()
+        with observe_queries(queries):
+            response = self.get_response(request)
+        record_request(
+            request,
+            response.status_code,
+            time.perf_counter() - started,
+            queries.queries,
+        )
+        return response
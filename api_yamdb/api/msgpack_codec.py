@@ -0,0 +1,226 @@
+"""Модуль содержит кодирование MessagePack на чистом Python.
+
+Используется, если библиотека msgpack не установлена. Поддерживает
+типы, которые возвращают сериалайзеры: None, bool, int, float, str,
+bytes, списки и словари.
+"""
+import struct
+
+
+class MessagePackError(ValueError):
+    """Ошибка кодирования или разбора MessagePack."""
+
+
+# Максимальная вложенность массивов и словарей при разборе: глубже
+# разбор упирается в предел рекурсии Python.
+MAX_DEPTH = 64
+
+
+# Форматы целых чисел: (минимум, максимум, код типа, формат struct).
+INT_FORMATS = (
+    (0, 0x7F, None, "B"),
+    (-0x20, -1, None, "b"),
+    (0, 0xFF, 0xCC, ">B"),
+    (0, 0xFFFF, 0xCD, ">H"),
+    (0, 0xFFFFFFFF, 0xCE, ">I"),
+    (0, 0xFFFFFFFFFFFFFFFF, 0xCF, ">Q"),
+    (-0x80, -1, 0xD0, ">b"),
+    (-0x8000, -1, 0xD1, ">h"),
+    (-0x80000000, -1, 0xD2, ">i"),
+    (-0x8000000000000000, -1, 0xD3, ">q"),
+)
+
+
+def pack_int(value, chunks):
+    """Кодирует целое число в самом коротком формате."""
+    for low, high, code, fmt in INT_FORMATS:
+        if low <= value <= high:
+            if code is not None:
+                chunks.append(struct.pack("B", code))
+            chunks.append(struct.pack(fmt, value))
+            return
+    raise MessagePackError(f"Integer out of range: {value}")
+
+
+def pack_header(size, fix, fix_limit, codes, chunks):
+    """Кодирует заголовок строки, массива или словаря длины size."""
+    if fix is not None and size < fix_limit:
+        chunks.append(struct.pack("B", fix | size))
+    elif codes[0] is not None and size <= 0xFF:
+        chunks.append(struct.pack(">BB", codes[0], size))
+    elif size <= 0xFFFF:
+        chunks.append(struct.pack(">BH", codes[1], size))
+    elif size <= 0xFFFFFFFF:
+        chunks.append(struct.pack(">BI", codes[2], size))
+    else:
+        raise MessagePackError(f"Object too large: {size}")
+
+
+def pack_scalar(obj, chunks):
+    """Кодирует скалярное значение, для других типов возвращает False."""
+    if obj is None:
+        chunks.append(b"\xc0")
+    elif isinstance(obj, bool):
+        chunks.append(b"\xc3" if obj else b"\xc2")
+    elif isinstance(obj, int):
+        pack_int(obj, chunks)
+    elif isinstance(obj, float):
+        chunks.append(struct.pack(">Bd", 0xCB, obj))
+    elif isinstance(obj, str):
+        data = obj.encode()
+        pack_header(len(data), 0xA0, 32, (0xD9, 0xDA, 0xDB), chunks)
+        chunks.append(data)
+    elif isinstance(obj, (bytes, bytearray, memoryview)):
+        data = bytes(obj)
+        pack_header(len(data), None, 0, (0xC4, 0xC5, 0xC6), chunks)
+        chunks.append(data)
+    else:
+        return False
+    return True
+
+
+def pack(obj, chunks, default):
+    """Добавляет в chunks закодированный объект."""
+    if pack_scalar(obj, chunks):
+        return
+    if isinstance(obj, (list, tuple)):
+        pack_header(len(obj), 0x90, 16, (None, 0xDC, 0xDD), chunks)
+        for item in obj:
+            pack(item, chunks, default)
+    elif isinstance(obj, dict):
+        pack_header(len(obj), 0x80, 16, (None, 0xDE, 0xDF), chunks)
+        for key, value in obj.items():
+            pack(key, chunks, default)
+            pack(value, chunks, default)
+    elif default is not None:
+        pack(default(obj), chunks, None)
+    else:
+        raise MessagePackError(f"Cannot serialize {type(obj).__name__}")
+
+
+def packb(obj, default=None):
+    """Кодирует объект в MessagePack.
+
+    default вызывается для неподдерживаемых типов и должен вернуть
+    значение поддерживаемого типа.
+    """
+    chunks = []
+    pack(obj, chunks, default)
+    return b"".join(chunks)
+
+
+class Unpacker:
+    """Разбирает MessagePack из байтов."""
+
+    def __init__(self, data, max_depth=MAX_DEPTH):
+        """Сохраняет данные, начальную позицию и предел вложенности."""
+        self.data = memoryview(data)
+        self.position = 0
+        self.depth = 0
+        self.max_depth = max_depth
+
+    def read(self, size):
+        """Возвращает следующие size байт."""
+        end = self.position + size
+        if end > len(self.data):
+            raise MessagePackError("Unexpected end of data")
+        chunk = self.data[self.position:end]
+        self.position = end
+        return chunk
+
+    def read_struct(self, fmt):
+        """Разбирает следующее значение по формату struct."""
+        return struct.unpack(fmt, self.read(struct.calcsize(fmt)))[0]
+
+    def read_str(self, size):
+        """Разбирает строку UTF-8 длины size."""
+        try:
+            return str(self.read(size), "utf-8")
+        except UnicodeDecodeError as error:
+            raise MessagePackError(str(error))
+
+    def enter(self):
+        """Учитывает вход во вложенный массив или словарь."""
+        self.depth += 1
+        if self.depth > self.max_depth:
+            raise MessagePackError(
+                f"Nesting deeper than {self.max_depth} levels",
+            )
+
+    def read_array(self, size):
+        """Разбирает массив из size элементов."""
+        self.enter()
+        result = [self.unpack() for _ in range(size)]
+        self.depth -= 1
+        return result
+
+    def read_map(self, size):
+        """Разбирает словарь из size пар."""
+        self.enter()
+        result = {}
+        for _ in range(size):
+            key = self.unpack()
+            try:
+                result[key] = self.unpack()
+            except TypeError:
+                raise MessagePackError("Unhashable map key")
+        self.depth -= 1
+        return result
+
+    def unpack(self):
+        """Разбирает следующий объект."""
+        code = self.read_struct("B")
+        if code <= 0x7F:
+            return code
+        if code >= 0xE0:
+            return code - 0x100
+        if 0xA0 <= code <= 0xBF:
+            return self.read_str(code & 0x1F)
+        if 0x90 <= code <= 0x9F:
+            return self.read_array(code & 0x0F)
+        if 0x80 <= code <= 0x8F:
+            return self.read_map(code & 0x0F)
+        if code in FIXED:
+            return FIXED[code]
+        if code in NUMBERS:
+            return self.read_struct(NUMBERS[code])
+        if code in SIZED:
+            read, fmt = SIZED[code]
+            return read(self, self.read_struct(fmt))
+        raise MessagePackError(f"Unsupported type code: {code:#x}")
+
+
+FIXED = {0xC0: None, 0xC2: False, 0xC3: True}
+NUMBERS = {
+    0xCA: ">f",
+    0xCB: ">d",
+    0xCC: ">B",
+    0xCD: ">H",
+    0xCE: ">I",
+    0xCF: ">Q",
+    0xD0: ">b",
+    0xD1: ">h",
+    0xD2: ">i",
+    0xD3: ">q",
+}
+SIZED = {
+    0xC4: (lambda unpacker, size: bytes(unpacker.read(size)), ">B"),
+    0xC5: (lambda unpacker, size: bytes(unpacker.read(size)), ">H"),
+    0xC6: (lambda unpacker, size: bytes(unpacker.read(size)), ">I"),
+    0xD9: (Unpacker.read_str, ">B"),
+    0xDA: (Unpacker.read_str, ">H"),
+    0xDB: (Unpacker.read_str, ">I"),
+    0xDC: (Unpacker.read_array, ">H"),
+    0xDD: (Unpacker.read_array, ">I"),
+    0xDE: (Unpacker.read_map, ">H"),
+    0xDF: (Unpacker.read_map, ">I"),
+}
+
+
+def unpackb(data):
+    """Разбирает один объект MessagePack из байтов."""
+    unpacker = Unpacker(data)
+    result = unpacker.unpack()
+    if unpacker.position != len(unpacker.data):
+        raise MessagePackError("Extra data after object")
+    return result
@@ -0,0 +1,12 @@
+"""Модуль содержит классы пагинации для приложения api."""
+from rest_framework.pagination import CursorPagination
+
+
+class UserReviewsPagination(CursorPagination):
+    """Пагинирует отзывы пользователя курсором по дате публикации.
+
+    Курсор не использует OFFSET, поэтому глубокие страницы читаются
+    по индексу (author_id, pub_date) так же быстро, как первая.
+    """
+
+    ordering = "-pub_date"
@@ -1,6 +1,32 @@
 """Модуль содержит определения permissions для приложения api."""
+from collections import namedtuple
+
 from rest_framework import permissions
 
+Role = namedtuple(
+    "Role",
+    ("pk", "is_authenticated", "is_admin", "is_staff", "is_superuser"),
+)
+ANONYMOUS_ROLE = Role(None, False, False, False, False)
+
+
+def get_role(request):
+    """Возвращает роль пользователя, вычисленную один раз за запрос."""
+    role = getattr(request, "_role", None)
+    if role is None:
+        user = request.user
+        role = ANONYMOUS_ROLE
+        if user.is_authenticated:
+            role = Role(
+                user.pk,
+                True,
+                user.is_admin,
+                user.is_staff,
+                user.is_superuser,
+            )
+        request._role = role
+    return role
+
 
 class IsAdminOrReadOnly(permissions.BasePermission):
     """Ограничмвает использование 'опасных' запросов.
@@ -10,9 +36,9 @@ class IsAdminOrReadOnly(permissions.BasePermission):
 
     def has_permission(self, request, view):
         """Проверяет запрос на соответствие ограничениям."""
-        return request.method in permissions.SAFE_METHODS or (
-            request.user.is_authenticated
-            and request.user.is_admin
+        return (
+            request.method in permissions.SAFE_METHODS
+            or get_role(request).is_admin
         )
 
 
@@ -24,11 +50,13 @@ class IsAuthorOrStaffOrReadOnly(permissions.BasePermission):
 
     def has_object_permission(self, request, view, obj):
         """Проверяет доступ к объекту на соответствие ограничениям."""
+        if request.method in permissions.SAFE_METHODS:
+            return True
+        role = get_role(request)
         return (
-            request.method in permissions.SAFE_METHODS
-            or obj.author == request.user
-            or request.user.is_staff
-            or request.user.is_admin
+            (role.is_authenticated and obj.author_id == role.pk)
+            or role.is_staff
+            or role.is_admin
         )
 
 
@@ -40,10 +68,8 @@ class IsAdminOnly(permissions.BasePermission):
 
     def has_permission(self, request, view):
         """Проверяет запрос на соответствие ограничениям."""
-        return (
-            request.user.is_superuser
-            or request.user.is_admin
-        )
+        role = get_role(request)
+        return role.is_superuser or role.is_admin
 
 
 class IsAdminUserOrReadOnly(permissions.BasePermission):
@@ -56,6 +82,4 @@ class IsAdminUserOrReadOnly(permissions.BasePermission):
         """Проверяет запрос на соответствие ограничениям."""
         if request.method in permissions.SAFE_METHODS:
             return True
-        if request.user.is_authenticated:
-            return request.user.is_admin
-        return False
+        return get_role(request).is_admin
@@ -0,0 +1,83 @@
+"""Модуль содержит хранение профилей запросов для приложения api.
+
+Профили cProfile сохраняются в PROFILING_DIR в подкаталог
+с именем url запроса, для каждого url хранятся только
+PROFILING_MAX_FILES последних профилей.
+"""
+import os
+import re
+import time
+import uuid
+from pathlib import Path
+
+from django.conf import settings
+
+PROFILE_SUFFIX = ".prof"
+PROFILE_NAME = re.compile(r"^\w[\w.-]*$")
+UNKNOWN_URL_NAME = "unknown"
+
+
+def get_profile_dir(url_name):
+    """Возвращает каталог профилей url или None для некорректного имени."""
+    if not url_name or not PROFILE_NAME.match(url_name):
+        return None
+    return Path(settings.PROFILING_DIR) / url_name
+
+
+def save_profile(profiler, url_name):
+    """Сохраняет профиль запроса и удаляет самые старые профили url.
+
+    Возвращает имя файла профиля.
+    """
+    directory = get_profile_dir(url_name) or get_profile_dir(
+        UNKNOWN_URL_NAME,
+    )
+    directory.mkdir(parents=True, exist_ok=True)
+    name = (
+        f"{int(time.time() * 1000)}-{os.getpid()}-{uuid.uuid4().hex[:8]}"
+        f"{PROFILE_SUFFIX}"
+    )
+    profiler.dump_stats(directory / name)
+    for path in list_profile_paths(directory)[settings.PROFILING_MAX_FILES:]:
+        path.unlink(missing_ok=True)
+    return name
+
+
+def list_profile_paths(directory):
+    """Возвращает профили каталога от новых к старым."""
+    if not directory.is_dir():
+        return []
+    return sorted(
+        directory.glob(f"*{PROFILE_SUFFIX}"),
+        key=lambda path: path.name,
+        reverse=True,
+    )
+
+
+def list_profiles():
+    """Возвращает словарь url и имён их профилей от новых к старым."""
+    root = Path(settings.PROFILING_DIR)
+    if not root.is_dir():
+        return {}
+    return {
+        directory.name: [
+            path.name for path in list_profile_paths(directory)
+        ]
+        for directory in sorted(root.iterdir())
+        if directory.is_dir()
+    }
+
+
+def get_profile_path(url_name, name):
+    """Возвращает путь к существующему профилю или None."""
+    directory = get_profile_dir(url_name) or get_profile_dir(
+        UNKNOWN_URL_NAME,
+    )
+    if (
+        directory is None
+        or not PROFILE_NAME.match(name)
+        or not name.endswith(PROFILE_SUFFIX)
+    ):
+        return None
+    path = directory / name
+    return path if path.is_file() else None
@@ -0,0 +1,74 @@
+"""Модуль содержит наблюдение за SQL-запросами для middleware api.
+
+connection.execute_wrapper() действует только на подключение текущего
+потока, поэтому не видит запросы view, выполняемых под ASGI в пуле
+потоков (api.async_views), и запросы при чтении потокового ответа
+после выхода из middleware. Здесь обёртка устанавливается в каждое
+подключение при его создании, а наблюдатели текущего запроса
+передаются через contextvars, которые asgiref копирует в потоки
+sync_to_async.
+"""
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.db import connections
+from django.db.backends.signals import connection_created
+
+current_observers = ContextVar("query_observers", default=())
+
+
+def observe_query(execute, sql, params, many, context):
+    """Выполняет запрос и передаёт его время наблюдателям запроса."""
+    observers = current_observers.get()
+    if not observers:
+        return execute(sql, params, many, context)
+    started = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        duration = time.perf_counter() - started
+        for observer in observers:
+            observer(sql, params, many, context, duration)
+
+
+def install(connection, **kwargs):
+    """Добавляет обёртку в подключение, если её там ещё нет."""
+    if observe_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(observe_query)
+
+
+connection_created.connect(install, dispatch_uid="api.query_hooks.install")
+
+
+@contextmanager
+def observe_queries(*observers):
+    """Передаёт наблюдателям SQL-запросы, выполненные внутри блока.
+
+    Учитываются запросы всех потоков, куда копируется текущий
+    контекст, в том числе потоков sync_to_async.
+    """
+    # Подключения текущего потока могли быть созданы до импорта модуля.
+    for connection in connections.all():
+        install(connection)
+    token = current_observers.set(current_observers.get() + observers)
+    try:
+        yield
+    finally:
+        current_observers.reset(token)
+
+
+def observe_iterator(iterator, *observers):
+    """Передаёт наблюдателям SQL-запросы, выполненные при чтении iterator.
+
+    Потоковый ответ читается после выхода из middleware, поэтому
+    наблюдатели включаются на время получения каждой части.
+    """
+    iterator = iter(iterator)
+    while True:
+        with observe_queries(*observers):
+            try:
+                item = next(iterator)
+            except StopIteration:
+                return
+        yield item
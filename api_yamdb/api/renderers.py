@@ -0,0 +1,209 @@
+"""Модуль содержит renderer и parser для приложения api.
+
+Если установлен orjson, кодирование и разбор JSON выполняет он,
+иначе используется стандартный модуль json. Уже закодированные
+фрагменты PreEncodedJSON вставляются в ответ без повторного
+кодирования. Для компактных ответов поддерживается MessagePack:
+через библиотеку msgpack или, без неё, через api.msgpack_codec.
+"""
+import json
+import uuid
+
+from django.conf import settings
+
+from rest_framework import renderers
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import BaseParser, JSONParser
+from rest_framework.utils import encoders
+
+from api import msgpack_codec
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+MESSAGEPACK_MEDIA_TYPE = "application/msgpack"
+
+
+class PreEncodedJSON:
+    """Хранит закодированный JSON-фрагмент для вставки в ответ."""
+
+    __slots__ = ("content",)
+
+    def __init__(self, content):
+        """Сохраняет закодированный фрагмент в байтах."""
+        self.content = content
+
+    @classmethod
+    def encode(cls, data):
+        """Кодирует данные во фрагмент."""
+        return cls(dumps(data))
+
+    def decode(self):
+        """Возвращает данные фрагмента."""
+        return loads(self.content)
+
+
+def dumps(data, default=None, indent=None):
+    """Кодирует данные в JSON в байтах без лишних пробелов."""
+    encoder = encoders.JSONEncoder()
+
+    def encode_default(obj):
+        if default is not None:
+            value = default(obj)
+            if value is not None:
+                return value
+        return encoder.default(obj)
+
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, default=encode_default, option=option)
+    return json.dumps(
+        data,
+        default=encode_default,
+        ensure_ascii=False,
+        allow_nan=False,
+        indent=indent,
+        separators=(",", ": ") if indent else (",", ":"),
+    ).encode()
+
+
+def reject_constant(value):
+    """Запрещает NaN и Infinity, как и JSONParser."""
+    raise ValueError(f"Out of range float values are not permitted: {value}")
+
+
+def loads(content):
+    """Разбирает JSON из байтов или строки."""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content, parse_constant=reject_constant)
+
+
+class FastJSONRenderer(renderers.JSONRenderer):
+    """Renderer JSON на orjson со вставкой закодированных фрагментов.
+
+    Отступы добавляются только в режиме DEBUG.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        """Кодирует данные ответа в JSON."""
+        if data is None:
+            return b""
+        indent = None
+        if settings.DEBUG:
+            indent = self.get_indent(
+                accepted_media_type or "",
+                renderer_context or {},
+            )
+        token = uuid.uuid4().hex
+        fragments = []
+
+        def default(obj):
+            if isinstance(obj, PreEncodedJSON):
+                fragments.append(obj.content)
+                return f"{token}:{len(fragments) - 1}"
+            return None
+
+        content = dumps(data, default=default, indent=indent)
+        for index, fragment in enumerate(fragments):
+            content = content.replace(
+                f'"{token}:{index}"'.encode(),
+                fragment,
+                1,
+            )
+        # Как и JSONRenderer, экранирует разделители строк для JavaScript.
+        return content.replace(b"\xe2\x80\xa8", b"\\u2028").replace(
+            b"\xe2\x80\xa9",
+            b"\\u2029",
+        )
+
+
+class FastJSONParser(JSONParser):
+    """Parser JSON на orjson."""
+
+    renderer_class = FastJSONRenderer
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        """Разбирает тело запроса в JSON."""
+        try:
+            return loads(stream.read() if stream is not None else b"")
+        except ValueError as error:
+            raise ParseError(f"JSON parse error - {error}")
+
+
+def msgpack_default(obj):
+    """Приводит объект к типу, который поддерживает MessagePack."""
+    if isinstance(obj, PreEncodedJSON):
+        return obj.decode()
+    return encoders.JSONEncoder().default(obj)
+
+
+def msgpack_dumps(data):
+    """Кодирует данные в MessagePack."""
+    if msgpack is not None:
+        return msgpack.packb(data, default=msgpack_default, use_bin_type=True)
+    return msgpack_codec.packb(data, default=msgpack_default)
+
+
+def msgpack_loads(content):
+    """Разбирает данные из MessagePack."""
+    if msgpack is not None:
+        return msgpack.unpackb(content, raw=False)
+    return msgpack_codec.unpackb(content)
+
+
+class MessagePackRenderer(renderers.BaseRenderer):
+    """Renderer MessagePack с теми же схемами данных, что и у JSON."""
+
+    media_type = MESSAGEPACK_MEDIA_TYPE
+    format = "msgpack"
+    charset = None
+    render_style = "binary"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        """Кодирует данные ответа в MessagePack."""
+        if data is None:
+            return b""
+        return msgpack_dumps(data)
+
+
+class MessagePackParser(BaseParser):
+    """Parser тела запроса в формате MessagePack."""
+
+    media_type = MESSAGEPACK_MEDIA_TYPE
+    renderer_class = MessagePackRenderer
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        """Разбирает тело запроса в MessagePack."""
+        try:
+            return msgpack_loads(stream.read() if stream is not None else b"")
+        except (ValueError, TypeError) as error:
+            raise ParseError(f"MessagePack parse error - {error}")
+
+
+class PrometheusRenderer(renderers.BaseRenderer):
+    """Renderer текстового формата метрик Prometheus.
+
+    Ответы с ошибками выводятся строками комментариев.
+    """
+
+    media_type = "text/plain"
+    format = "prometheus"
+    charset = "utf-8"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        """Кодирует метрики или ошибку в текст."""
+        if not isinstance(data, str):
+            data = "".join(
+                f"# {key}: {value}\n" for key, value in (data or {}).items()
+            )
+        return data.encode(self.charset)
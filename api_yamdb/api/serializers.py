@@ -1,7 +1,6 @@
 """Модуль содержит описание serializers для приложения api."""
 from django.conf import settings
 from django.contrib.auth import get_user_model
-from django.shortcuts import get_object_or_404
 from django.utils import timezone
 
 from rest_framework import serializers
@@ -101,6 +100,7 @@ class TitleReadSerializer(serializers.ModelSerializer):
             "name",
             "year",
             "rating",
+            "reviews_count",
             "description",
             "genre",
             "category",
@@ -171,9 +171,7 @@ class ReviewSerializer(serializers.ModelSerializer):
             raise serializers.ValidationError(
                 ErrorMessage.NO_VIEW_IN_CONTEXT_ERROR,
             )
-        title_id = view.kwargs.get("title_id")
-
-        title = get_object_or_404(Title, pk=title_id)
+        title = view.get_title()
         if (
             request.method == "POST"
             and Review.objects.filter(title=title, author=author).exists()
@@ -184,6 +182,35 @@ class ReviewSerializer(serializers.ModelSerializer):
         return data
 
 
+class TitleSummarySerializer(serializers.ModelSerializer):
+    """Сериалайзер краткого описания модели Title."""
+
+    class Meta:
+        """Определяет настройки сериалайзера TitleSummarySerializer."""
+
+        model = Title
+        fields = ("id", "name", "year")
+
+
+class UserReviewSerializer(serializers.ModelSerializer):
+    """Сериалайзер отзывов пользователя с кратким описанием произведения."""
+
+    title = TitleSummarySerializer(read_only=True)
+
+    class Meta:
+        """Определяет настройки сериалайзера UserReviewSerializer."""
+
+        model = Review
+        fields = (
+            "id",
+            "title",
+            "text",
+            "score",
+            "comments_count",
+            "pub_date",
+        )
+
+
 class CommentSerializer(serializers.ModelSerializer):
     """Сериалайзер модели Comment."""
 
@@ -0,0 +1,23 @@
+"""Модуль содержит обработчики сигналов приложения api."""
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+
+from api.cache import bump_catalog_version
+from reviews.models import Category, Genre, GenreTitle, Review, Title
+
+CATALOG_MODELS = (Category, Genre, GenreTitle, Review, Title)
+
+
+@receiver(post_save)
+@receiver(post_delete)
+def bump_catalog_version_on_change(sender, **kwargs):
+    """Сбрасывает кеш каталога при изменении его моделей."""
+    if sender in CATALOG_MODELS:
+        bump_catalog_version()
+
+
+@receiver(m2m_changed, sender=Title.genre.through)
+def bump_catalog_version_on_genre_change(sender, action, **kwargs):
+    """Сбрасывает кеш каталога при изменении жанров произведения."""
+    if action.startswith("post_"):
+        bump_catalog_version()
@@ -0,0 +1,156 @@
+"""Модуль содержит журнал медленных SQL-запросов для приложения api.
+
+Запросы дольше SLOW_QUERY_THRESHOLD_MS попадают в кольцевой буфер
+процесса и в ротируемый лог-файл SLOW_QUERY_LOG_FILE вместе
+с именем url запроса и местом вызова в коде проекта.
+"""
+import logging
+import re
+import sys
+import threading
+from collections import deque
+from datetime import datetime, timezone
+from logging.handlers import RotatingFileHandler
+from pathlib import Path
+
+from django.conf import settings
+
+from api.renderers import dumps
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+logger.propagate = False
+
+STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+PLACEHOLDERS = re.compile(r"\((?:\s*(?:%s|\?)\s*,)+\s*(?:%s|\?)\s*\)")
+WHITESPACE = re.compile(r"\s+")
+# Обёртки выполнения запросов не считаются местом вызова.
+WRAPPER_MODULES = (__name__, "api.query_hooks")
+
+buffer_lock = threading.Lock()
+slow_queries = deque(maxlen=settings.SLOW_QUERY_BUFFER_SIZE)
+handler_lock = threading.Lock()
+handler_path = None
+
+
+def normalize_sql(sql):
+    """Заменяет значения в SQL на ? и сворачивает списки параметров."""
+    sql = STRING_LITERAL.sub("?", sql)
+    sql = NUMBER_LITERAL.sub("?", sql)
+    sql = sql.replace("%s", "?")
+    sql = PLACEHOLDERS.sub("(...)", sql)
+    return WHITESPACE.sub(" ", sql).strip()
+
+
+def is_project_file(filename):
+    """Проверяет, что файл относится к коду проекта."""
+    return (
+        filename.startswith(str(settings.BASE_DIR))
+        and "site-packages" not in filename
+    )
+
+
+def is_project_class(cls):
+    """Проверяет, что класс объявлен в модуле проекта."""
+    module = sys.modules.get(cls.__module__)
+    return is_project_file(getattr(module, "__file__", None) or "")
+
+
+def get_call_site(frame):
+    """Возвращает первое место вызова в коде проекта.
+
+    Внутри кода библиотек место вызова определяется по классу
+    объекта self, если класс объявлен в проекте, например
+    ``api.serializers.TitleReadSerializer.to_representation``.
+    """
+    while frame is not None:
+        code = frame.f_code
+        if frame.f_globals.get("__name__") in WRAPPER_MODULES:
+            frame = frame.f_back
+            continue
+        if is_project_file(code.co_filename):
+            name = getattr(code, "co_qualname", code.co_name)
+            module = frame.f_globals.get("__name__", "")
+            return f"{module}.{name}:{frame.f_lineno}"
+        owner = frame.f_locals.get("self")
+        if owner is not None and is_project_class(type(owner)):
+            cls = type(owner)
+            return f"{cls.__module__}.{cls.__qualname__}.{code.co_name}"
+        frame = frame.f_back
+    return None
+
+
+def get_file_handler():
+    """Создаёт обработчик лог-файла при первой записи или смене пути."""
+    global handler_path
+    path = Path(settings.SLOW_QUERY_LOG_FILE)
+    with handler_lock:
+        if handler_path != path:
+            for handler in list(logger.handlers):
+                logger.removeHandler(handler)
+                handler.close()
+            path.parent.mkdir(parents=True, exist_ok=True)
+            handler = RotatingFileHandler(
+                path,
+                maxBytes=settings.SLOW_QUERY_LOG_MAX_BYTES,
+                backupCount=settings.SLOW_QUERY_LOG_BACKUP_COUNT,
+                encoding="utf-8",
+            )
+            logger.addHandler(handler)
+            handler_path = path
+
+
+def record(entry):
+    """Добавляет запись в буфер и лог-файл."""
+    with buffer_lock:
+        slow_queries.append(entry)
+    get_file_handler()
+    logger.info(dumps(entry).decode())
+
+
+def get_slow_queries(limit=None):
+    """Возвращает записи буфера от новых к старым."""
+    with buffer_lock:
+        entries = list(slow_queries)
+    entries.reverse()
+    return entries[:limit]
+
+
+class SlowQueryRecorder:
+    """Наблюдатель SQL-запросов, записывающий медленные запросы."""
+
+    def __init__(self, request):
+        """Сохраняет запрос, во время которого выполняются SQL-запросы."""
+        self.request = request
+
+    def __call__(self, sql, params, many, context, duration):
+        """Записывает SQL-запрос, если он медленный."""
+        duration_ms = duration * 1000
+        if duration_ms >= settings.SLOW_QUERY_THRESHOLD_MS:
+            self.record(
+                sql,
+                params,
+                many,
+                duration_ms,
+                context["connection"],
+            )
+
+    def record(self, sql, params, many, duration, connection):
+        """Записывает медленный запрос."""
+        resolver_match = getattr(self.request, "resolver_match", None)
+        if many:
+            params_count = sum(len(item) for item in params)
+        else:
+            params_count = len(params or ())
+        record({
+            "time": datetime.now(timezone.utc).isoformat(),
+            "duration_ms": round(duration, 3),
+            "sql": normalize_sql(sql),
+            "params_count": params_count,
+            "many": many,
+            "alias": connection.alias,
+            "method": self.request.method,
+            "url_name": resolver_match.url_name if resolver_match else None,
+            "call_site": get_call_site(sys._getframe(1)),
+        })
@@ -1,8 +1,10 @@
 """Модуль, в котором содержатся url для приложения api."""
-from django.urls import include, path
+from django.conf import settings
+from django.urls import include, path, re_path
 
 from rest_framework.routers import SimpleRouter
 
+from api.async_views import wrap_read_views
 from api.views import (
     CategoryViewSet,
     CommentViewSet,
@@ -10,7 +12,16 @@ from api.views import (
     ReviewViewSet,
     TitleViewSet,
 )
-from api.views import UserViewSet, get_token, sign_up
+from api.views import (
+    UserViewSet,
+    changes,
+    download_profile,
+    export_data,
+    get_token,
+    profiles,
+    sign_up,
+    slow_query_log,
+)
 
 app_name = "api"
 
@@ -42,10 +53,27 @@ router.register(
     basename="comments",
 )
 
+router_urls = router.urls
+if settings.ASYNC_VIEWS:
+    router_urls = wrap_read_views(router_urls, settings.ASYNC_READ_URL_NAMES)
+
 v1 = [
-    path("", include(router.urls)),
+    path("", include(router_urls)),
     path("auth/token/", get_token, name="token_obtain"),
     path("auth/signup/", sign_up, name="sign_up"),
+    path("changes/", changes, name="changes"),
+    re_path(
+        r"^export/(?P<resource>\w+)\.(?P<export_format>csv|ndjson)$",
+        export_data,
+        name="export",
+    ),
+    path("profiles/", profiles, name="profiles"),
+    re_path(
+        r"^profiles/(?P<url_name>[\w.-]+)/(?P<name>[\w.-]+\.prof)$",
+        download_profile,
+        name="profile",
+    ),
+    path("slow-queries/", slow_query_log, name="slow_queries"),
 ]
 
 urlpatterns = (path("v1/", include(v1)),)
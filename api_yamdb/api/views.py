@@ -2,20 +2,34 @@
 from django.contrib.auth import get_user_model
 from django.contrib.auth.tokens import default_token_generator
 from django.conf import settings
-from django.core.mail import send_mail
-from django.db.models import Avg
+from django.db.models import Prefetch
+from django.http import FileResponse, Http404, StreamingHttpResponse
 from django.shortcuts import get_object_or_404
 
 from django_filters.rest_framework import DjangoFilterBackend
 
 from rest_framework import permissions, status, serializers, viewsets
-from rest_framework.decorators import action, api_view, permission_classes
-from rest_framework.filters import SearchFilter
+from rest_framework.decorators import (
+    action,
+    api_view,
+    permission_classes,
+    renderer_classes,
+)
+from rest_framework.filters import OrderingFilter, SearchFilter
 from rest_framework.pagination import PageNumberPagination
 from rest_framework.response import Response
-from rest_framework_simplejwt.tokens import RefreshToken
 
+from api.changes import get_changes
+from api.exports import EXPORT_CONTENT_TYPES, EXPORT_STREAMS, EXPORTS
+from api.facets import get_facets, parse_facets
 from api.filters import TitleFilter
+from api.identity import get_identity_map
+from api.mail import dispatch_confirmation_code
+from api.metrics import CONTENT_TYPE, render_metrics
+from api.pagination import UserReviewsPagination
+from api.profiling import get_profile_path, list_profiles
+from api.renderers import PrometheusRenderer
+from api.slow_queries import get_slow_queries
 from api.mixins import ListCreateDestroyViewSet
 from api.permissions import (
     IsAdminOrReadOnly,
@@ -31,10 +45,16 @@ from api.serializers import (
     SignupSerializer,
     TitleReadSerializer,
     TitleWriteSerializer,
+    UserReviewSerializer,
     UserSerializer,
     ENDPOINT_ME,
 )
 from api.errors import ErrorMessage
+from reviews.deletion import (
+    bulk_delete_reviews,
+    bulk_delete_titles,
+    bulk_delete_users,
+)
 from reviews.models import Category, Genre, Review, Title
 
 User = get_user_model()
@@ -68,10 +88,43 @@ class UserViewSet(viewsets.ModelViewSet):
 
     def get_permissions(self):
         """Определяет permissions в зависимости от метода."""
-        if self.action == ENDPOINT_ME:
+        if self.action in (ENDPOINT_ME, "me_reviews"):
             return (permissions.IsAuthenticated(),)
+        if self.action == "reviews":
+            return (permissions.AllowAny(),)
         return super().get_permissions()
 
+    def perform_destroy(self, instance):
+        """Удаляет пользователя с отзывами и комментариями частями."""
+        bulk_delete_users(User.objects.filter(pk=instance.pk))
+
+    def list_reviews(self, author_id):
+        """Возвращает страницу отзывов автора с кратким описанием произведений.
+
+        Произведения страницы загружаются одним дополнительным запросом.
+        """
+        queryset = Review.objects.filter(author_id=author_id).prefetch_related(
+            Prefetch(
+                "title",
+                queryset=Title.objects.only("id", "name", "year"),
+            ),
+        )
+        paginator = UserReviewsPagination()
+        page = paginator.paginate_queryset(queryset, self.request, view=self)
+        serializer = UserReviewSerializer(page, many=True)
+        return paginator.get_paginated_response(serializer.data)
+
+    @action((HTTPMethod.GET,), detail=True)
+    def reviews(self, request, username=None):
+        """Функция для обработки 'users/{username}/reviews' endpoint."""
+        user = get_object_or_404(User.objects.only("pk"), username=username)
+        return self.list_reviews(user.pk)
+
+    @action((HTTPMethod.GET,), detail=False, url_path="me/reviews")
+    def me_reviews(self, request):
+        """Функция для обработки 'users/me/reviews' endpoint."""
+        return self.list_reviews(request.user.pk)
+
     @action(
         (HTTPMethod.GET, HTTPMethod.PATCH, HTTPMethod.DELETE),
         detail=False,
@@ -121,17 +174,15 @@ class TitleViewSet(viewsets.ModelViewSet):
     """Вьюсет для произведений."""
 
     queryset = (
-        Title.objects.annotate(
-            rating=Avg(
-                "reviews__score",
-            ),
-        )
-        .all()
+        Title.objects.select_related("category")
+        .prefetch_related("genre")
         .order_by("id")
     )
     serializer_class = TitleWriteSerializer
-    filter_backends = (DjangoFilterBackend,)
+    filter_backends = (DjangoFilterBackend, OrderingFilter)
     filterset_class = TitleFilter
+    ordering_fields = ("id", "name", "year", "rating")
+    ordering = ("id",)
     permission_classes = (IsAdminOrReadOnly,)
 
     def get_serializer_class(self):
@@ -140,6 +191,23 @@ class TitleViewSet(viewsets.ModelViewSet):
             return TitleReadSerializer
         return TitleWriteSerializer
 
+    def list(self, request, *args, **kwargs):
+        """Добавляет к списку фасеты, перечисленные в параметре facets."""
+        facets = request.query_params.get("facets")
+        names = parse_facets(facets) if facets is not None else None
+        response = super().list(request, *args, **kwargs)
+        if names:
+            response.data["facets"] = get_facets(
+                self.filter_queryset(self.get_queryset()),
+                names,
+                request.query_params,
+            )
+        return response
+
+    def perform_destroy(self, instance):
+        """Удаляет произведение с зависимыми записями частями."""
+        bulk_delete_titles(Title.objects.filter(pk=instance.pk))
+
 
 @api_view(("POST",))
 @permission_classes((permissions.AllowAny,))
@@ -158,6 +226,10 @@ def get_token(request):
             ErrorMessage.INVALID_CONFIRMATION_CODE_ERROR,
         )
 
+    # Токены simplejwt загружают модели чёрного списка, поэтому
+    # импортируются при первой выдаче токена, а не вместе с URLconf.
+    from rest_framework_simplejwt.tokens import RefreshToken
+
     token = RefreshToken.for_user(user)
 
     return Response(
@@ -175,18 +247,101 @@ def sign_up(request):
     user, created = User.objects.get_or_create(
         **serializer.validated_data,
     )
-    confirmation_code = default_token_generator.make_token(user)
-    send_mail(
-        "yamdb код подтверждения",
-        f"Код подтверждения: {confirmation_code}",
-        settings.EMAIL_BACKEND,
-        (user.email,),
-        fail_silently=False,
+    dispatch_confirmation_code(
+        user.email,
+        default_token_generator.make_token(user),
     )
 
     return Response(serializer.data, status=status.HTTP_200_OK)
 
 
+@api_view(("GET",))
+@permission_classes((permissions.IsAuthenticated, IsAdminOnly))
+def export_data(request, resource, export_format):
+    """Функция потоковой выгрузки данных в формате CSV или NDJSON."""
+    if resource not in EXPORTS:
+        raise Http404
+    response = StreamingHttpResponse(
+        EXPORT_STREAMS[export_format](resource),
+        content_type=EXPORT_CONTENT_TYPES[export_format],
+    )
+    response["Content-Disposition"] = (
+        f'attachment; filename="{resource}.{export_format}"'
+    )
+    return response
+
+
+@api_view(("GET",))
+@permission_classes((permissions.IsAuthenticated, IsAdminOnly))
+def profiles(request):
+    """Функция списка сохранённых профилей запросов по url."""
+    return Response(list_profiles())
+
+
+@api_view(("GET",))
+@permission_classes((permissions.IsAuthenticated, IsAdminOnly))
+def download_profile(request, url_name, name):
+    """Функция выгрузки файла профиля запроса для pstats."""
+    path = get_profile_path(url_name, name)
+    if path is None:
+        raise Http404
+    return FileResponse(
+        open(path, "rb"),
+        as_attachment=True,
+        filename=name,
+        content_type="application/octet-stream",
+    )
+
+
+@api_view(("GET",))
+@permission_classes((permissions.IsAuthenticated, IsAdminOnly))
+@renderer_classes((PrometheusRenderer,))
+def metrics(request):
+    """Функция метрик всех процессов в формате Prometheus."""
+    return Response(
+        render_metrics(),
+        status=status.HTTP_200_OK,
+        content_type=CONTENT_TYPE,
+    )
+
+
+@api_view(("GET",))
+@permission_classes((permissions.IsAuthenticated, IsAdminOnly))
+def slow_query_log(request):
+    """Функция последних медленных SQL-запросов процесса."""
+    limit = request.query_params.get(
+        "limit",
+        settings.SLOW_QUERY_BUFFER_SIZE,
+    )
+    try:
+        limit = int(limit)
+    except (TypeError, ValueError):
+        raise serializers.ValidationError(ErrorMessage.INVALID_LIMIT_ERROR)
+    if limit < 1:
+        raise serializers.ValidationError(ErrorMessage.INVALID_LIMIT_ERROR)
+    return Response(get_slow_queries(limit), status=status.HTTP_200_OK)
+
+
+@api_view(("GET",))
+@permission_classes((permissions.AllowAny,))
+def changes(request):
+    """Функция ленты изменений произведений, отзывов и комментариев."""
+    limit = request.query_params.get("limit", settings.CHANGES_PAGE_SIZE)
+    try:
+        limit = int(limit)
+    except (TypeError, ValueError):
+        raise serializers.ValidationError(ErrorMessage.INVALID_LIMIT_ERROR)
+    if limit < 1:
+        raise serializers.ValidationError(ErrorMessage.INVALID_LIMIT_ERROR)
+    return Response(
+        get_changes(
+            request.query_params.get("since"),
+            min(limit, settings.CHANGES_MAX_PAGE_SIZE),
+        ),
+        status=status.HTTP_200_OK,
+    )
+
+
 class ReviewViewSet(viewsets.ModelViewSet):
     """Viewset для просмотра и редактирования Отзывов."""
 
@@ -198,11 +353,23 @@ class ReviewViewSet(viewsets.ModelViewSet):
 
     def get_title(self):
         """Определяет функцию для получения title_id из url."""
-        return get_object_or_404(Title, pk=self.kwargs.get("title_id"))
+        title_id = self.kwargs.get("title_id")
+        return get_identity_map(self.request).get(
+            Title,
+            title_id,
+            lambda: get_object_or_404(Title, pk=title_id),
+        )
 
     def get_queryset(self):
         """Переопределяет queryset в зависимости от title_id."""
-        return self.get_title().reviews.all()
+        return self.get_title().reviews.select_related("author")
+
+    def get_object(self):
+        """Подставляет в отзыв автора из identity map запроса."""
+        return get_identity_map(self.request).attach(
+            super().get_object(),
+            "author",
+        )
 
     def perform_create(self, serializer):
         """Переопределяет действия при создания записи.
@@ -212,6 +379,10 @@ class ReviewViewSet(viewsets.ModelViewSet):
         """
         serializer.save(author=self.request.user, title=self.get_title())
 
+    def perform_destroy(self, instance):
+        """Удаляет отзыв с комментариями частями."""
+        bulk_delete_reviews(Review.objects.filter(pk=instance.pk))
+
 
 class CommentViewSet(viewsets.ModelViewSet):
     """Viewset для создания и редактирования комментариев."""
@@ -224,15 +395,27 @@ class CommentViewSet(viewsets.ModelViewSet):
 
     def get_review(self):
         """Определяет функцию для получения title_id и review_id."""
-        return get_object_or_404(
+        review_id = self.kwargs.get("review_id")
+        return get_identity_map(self.request).get(
             Review,
-            id=self.kwargs.get("review_id"),
-            title__id=self.kwargs.get("title_id"),
+            review_id,
+            lambda: get_object_or_404(
+                Review,
+                id=review_id,
+                title__id=self.kwargs.get("title_id"),
+            ),
         )
 
     def get_queryset(self):
         """Переопределяет queryset в зависимости от review_id."""
-        return self.get_review().comments.all()
+        return self.get_review().comments.select_related("author")
+
+    def get_object(self):
+        """Подставляет в комментарий автора из identity map запроса."""
+        return get_identity_map(self.request).attach(
+            super().get_object(),
+            "author",
+        )
 
     def perform_create(self, serializer):
         """
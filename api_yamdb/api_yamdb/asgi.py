@@ -9,8 +9,17 @@ https://docs.djangoproject.com/en/3.2/howto/deployment/asgi/
 
 import os
 
+from django.conf import settings
 from django.core.asgi import get_asgi_application
 
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "api_yamdb.settings")
+os.environ.setdefault("YAMDB_ASYNC_VIEWS", "True")
 
 application = get_asgi_application()
+
+if settings.WARM_UP_ON_STARTUP:
+    # Модуль прогрева использует настройки DRF, поэтому импортируется
+    # после инициализации Django.
+    from api_yamdb.startup import warm_up
+
+    warm_up()
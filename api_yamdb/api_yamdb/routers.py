@@ -0,0 +1,93 @@
+"""Модуль содержит маршрутизацию запросов к репликам БД.
+
+Безопасные запросы читают данные из реплик, остальные запросы
+работают с основной БД. После записи клиент на время
+REPLICA_PIN_SECONDS закрепляется за основной БД, чтобы сразу
+видеть свои изменения. Закрепление хранится в подписанной cookie,
+поэтому его видят все процессы, а клиент не может его продлить.
+"""
+import random
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS
+
+SAFE_METHODS = ("GET", "HEAD", "OPTIONS")
+PIN_COOKIE_NAME = "replica_pin"
+PIN_COOKIE_SALT = "api_yamdb.routers.replica_pin"
+
+# Реплика, выбранная для чтения в текущем запросе, или None.
+replica_alias = ContextVar("replica_alias", default=None)
+
+
+def is_pinned(request):
+    """Проверяет, что клиент недавно выполнял запись."""
+    return request.get_signed_cookie(
+        PIN_COOKIE_NAME,
+        default=None,
+        salt=PIN_COOKIE_SALT,
+        max_age=settings.REPLICA_PIN_SECONDS,
+    ) is not None
+
+
+def pin(request, response):
+    """Закрепляет клиента за основной БД на REPLICA_PIN_SECONDS."""
+    response.set_signed_cookie(
+        PIN_COOKIE_NAME,
+        "1",
+        salt=PIN_COOKIE_SALT,
+        max_age=settings.REPLICA_PIN_SECONDS,
+        secure=request.is_secure(),
+        httponly=True,
+        samesite="Lax",
+    )
+
+
+def use_primary():
+    """Направляет чтение до конца запроса в основную БД."""
+    replica_alias.set(None)
+
+
+class ReplicaRouter:
+    """Направляет чтение в реплики, а запись в основную БД."""
+
+    def db_for_read(self, model, **hints):
+        """Возвращает реплику, выбранную для безопасного запроса."""
+        return replica_alias.get() or DEFAULT_DB_ALIAS
+
+    def db_for_write(self, model, **hints):
+        """Возвращает основную БД для записи."""
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        """Разрешает связи между объектами из основной БД и реплик."""
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        """Разрешает миграции только в основной БД."""
+        return db == DEFAULT_DB_ALIAS
+
+
+class ReplicaRoutingMiddleware:
+    """Включает чтение из реплик для безопасных запросов клиента."""
+
+    def __init__(self, get_response):
+        """Сохраняет следующий обработчик цепочки middleware."""
+        self.get_response = get_response
+
+    def __call__(self, request):
+        """Выбирает БД для запроса и закрепляет клиента после записи."""
+        is_safe = request.method in SAFE_METHODS
+        alias = None
+        if is_safe and settings.REPLICA_DATABASES and not is_pinned(request):
+            # Одна реплика на запрос, чтобы COUNT и строки страницы
+            # читались из одного снимка.
+            alias = random.choice(settings.REPLICA_DATABASES)
+        token = replica_alias.set(alias)
+        try:
+            response = self.get_response(request)
+        finally:
+            replica_alias.reset(token)
+        if not is_safe:
+            pin(request, response)
+        return response
@@ -32,12 +32,17 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
+    "api.middleware.ProfilingMiddleware",
+    "api.middleware.MetricsMiddleware",
+    "api.middleware.SlowQueryMiddleware",
+    "api_yamdb.routers.ReplicaRoutingMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
+    "api.middleware.CatalogCacheMiddleware",
 ]
 
 ROOT_URLCONF = "api_yamdb.urls"
@@ -71,6 +76,23 @@ DATABASES = {
     },
 }
 
+# Пути к копиям БД только для чтения через os.pathsep, например
+# YAMDB_REPLICA_DATABASES=/var/lib/yamdb/replica.sqlite3.
+for index, path in enumerate(
+    filter(None, os.getenv("YAMDB_REPLICA_DATABASES", "").split(os.pathsep)),
+):
+    DATABASES[f"replica_{index}"] = {
+        "ENGINE": "django.db.backends.sqlite3",
+        "NAME": path,
+        "TEST": {"MIRROR": "default"},
+    }
+REPLICA_DATABASES = tuple(
+    alias for alias in DATABASES if alias.startswith("replica_")
+)
+DATABASE_ROUTERS = ("api_yamdb.routers.ReplicaRouter",)
+# Сколько секунд после записи клиент читает из основной БД.
+REPLICA_PIN_SECONDS = 5
+
 
 # Password validation
 
@@ -118,6 +140,17 @@ REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": [
         "rest_framework_simplejwt.authentication.JWTAuthentication",
     ],
+    "DEFAULT_RENDERER_CLASSES": [
+        "api.renderers.FastJSONRenderer",
+        "api.renderers.MessagePackRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ],
+    "DEFAULT_PARSER_CLASSES": [
+        "api.renderers.FastJSONParser",
+        "api.renderers.MessagePackParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
+    ],
     "DEFAULT_PAGINATION_CLASS": "rest_framework.pagination.PageNumberPagination",
     "PAGE_SIZE": 5,
 }
@@ -131,5 +164,101 @@ EMAIL_BACKEND = "django.core.mail.backends.filebased.EmailBackend"
 EMAIL_FILE_PATH = os.path.join(BASE_DIR, "sent_emails")
 DEBUG_EMAIL = "yamdb@yamdb.com"
 
+# Включается в asgi.py: запросы на чтение из ASYNC_READ_URL_NAMES
+# выполняются параллельно в пуле потоков, письма отправляются в фоне.
+ASYNC_VIEWS = os.getenv("YAMDB_ASYNC_VIEWS", "False") == "True"
+ASYNC_READ_URL_NAMES = (
+    "titles-list",
+    "titles-detail",
+    "reviews-list",
+    "comments-list",
+)
+EMAIL_ASYNC_DISPATCH = ASYNC_VIEWS
+EMAIL_DISPATCH_WORKERS = 2
+
 MAX_SCORE = 10
 MIN_SCORE = 1
+
+EXPORT_CHUNK_SIZE = 2000
+
+# Зависимые записи удаляемых произведений, отзывов и пользователей
+# удаляются частями такого размера.
+DELETION_CHUNK_SIZE = 500
+
+# Начиная с этого количества строк админка показывает оценку из статистики
+# БД вместо COUNT(*) по всей таблице.
+ADMIN_ESTIMATED_COUNT_THRESHOLD = 100000
+
+# Страница подтверждения удаления в админке перечисляет не больше
+# такого количества удаляемых записей.
+ADMIN_DELETED_OBJECTS_LIMIT = 100
+
+# Кеш задаётся через окружение, например
+# YAMDB_CACHE_BACKEND=django.core.cache.backends.memcached.PyMemcacheCache
+# YAMDB_CACHE_LOCATION=127.0.0.1:11211.
+CACHES = {
+    "default": {
+        "BACKEND": os.getenv(
+            "YAMDB_CACHE_BACKEND",
+            "django.core.cache.backends.locmem.LocMemCache",
+        ),
+        "LOCATION": os.getenv("YAMDB_CACHE_LOCATION", ""),
+    },
+}
+PROCESS_LOCAL_CACHE_BACKENDS = (
+    "django.core.cache.backends.locmem.LocMemCache",
+    "django.core.cache.backends.dummy.DummyCache",
+)
+# Версия каталога хранится в кеше по умолчанию. В кеше процесса
+# её изменение не видят другие воркеры, и они отдают устаревший каталог,
+# поэтому кеш каталога и фасетов включается только с общим кешем
+# или явно для одного процесса через YAMDB_SINGLE_PROCESS=True.
+CATALOG_CACHE_ENABLED = (
+    CACHES["default"]["BACKEND"] not in PROCESS_LOCAL_CACHE_BACKENDS
+    or os.getenv("YAMDB_SINGLE_PROCESS", "False") == "True"
+)
+
+FACETS_CACHE_TIMEOUT = 300
+
+# Анонимные GET-ответы каталога хранятся в кеше вместе с gzip-вариантом.
+CATALOG_CACHE_URL_NAMES = (
+    "titles-list",
+    "titles-detail",
+    "genres-list",
+    "categories-list",
+)
+CATALOG_CACHE_TIMEOUT = 300
+# Ответы короче этого размера в байтах не сжимаются.
+CATALOG_CACHE_GZIP_MIN_LENGTH = 1024
+
+# Доля профилируемых запросов от 0 до 1; администратор может
+# запросить профиль заголовком X-Profile.
+PROFILING_SAMPLE_RATE = float(os.getenv("YAMDB_PROFILING_SAMPLE_RATE", "0"))
+PROFILING_DIR = BASE_DIR / "profiles"
+# Сколько последних профилей хранится для каждого url.
+PROFILING_MAX_FILES = 50
+
+# SQL-запросы дольше порога в миллисекундах попадают в буфер и лог.
+SLOW_QUERY_THRESHOLD_MS = float(os.getenv("YAMDB_SLOW_QUERY_MS", "100"))
+SLOW_QUERY_BUFFER_SIZE = 500
+SLOW_QUERY_LOG_FILE = BASE_DIR / "logs" / "slow_queries.log"
+SLOW_QUERY_LOG_MAX_BYTES = 10 * 2 ** 20
+SLOW_QUERY_LOG_BACKUP_COUNT = 5
+
+# Каждый процесс сохраняет свои метрики в файл этого каталога не чаще
+# раза в METRICS_FLUSH_INTERVAL секунд, /metrics суммирует все файлы.
+METRICS_DIR = Path(os.getenv("YAMDB_METRICS_DIR", BASE_DIR / "metrics"))
+METRICS_FLUSH_INTERVAL = 5
+
+# При YAMDB_WARM_UP=True wsgi.py и asgi.py при запуске прогревают проект
+# и выполняют GET-запросы к WARM_UP_PATHS, чтобы первые запросы не были
+# медленными. Запросы прогрева не попадают в метрики и профили.
+WARM_UP_ON_STARTUP = os.getenv("YAMDB_WARM_UP", "False") == "True"
+WARM_UP_PATHS = (
+    "/api/v1/titles/",
+    "/api/v1/genres/",
+    "/api/v1/categories/",
+)
+
+CHANGES_PAGE_SIZE = 100
+CHANGES_MAX_PAGE_SIZE = 1000
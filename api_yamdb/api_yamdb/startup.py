@@ -0,0 +1,89 @@
+"""Модуль содержит прогрев проекта перед первым запросом.
+
+Вызывается из wsgi.py и asgi.py при включённой настройке
+WARM_UP_ON_STARTUP, чтобы ленивая инициализация URLconf, админки,
+классов DRF и simplejwt выполнялась до первого запроса пользователя.
+"""
+import logging
+import time
+from wsgiref.util import setup_testing_defaults
+
+from django.conf import settings
+from django.core.handlers.wsgi import WSGIHandler
+from django.urls import URLResolver, get_resolver
+
+from rest_framework.settings import api_settings
+from rest_framework_simplejwt.settings import (
+    api_settings as simplejwt_settings,
+)
+
+from api.middleware import WARM_UP_MARKER
+
+logger = logging.getLogger(__name__)
+
+
+def compile_patterns(resolver):
+    """Компилирует регулярные выражения всех url."""
+    for pattern in resolver.url_patterns:
+        pattern.pattern.regex
+        if isinstance(pattern, URLResolver):
+            compile_patterns(pattern)
+
+
+def import_setting_classes():
+    """Импортирует классы из настроек DRF и simplejwt."""
+    for setting_classes in (api_settings, simplejwt_settings):
+        for name in setting_classes.import_strings:
+            getattr(setting_classes, name)
+
+
+def get_host():
+    """Возвращает разрешённое имя хоста для запросов прогрева."""
+    for host in settings.ALLOWED_HOSTS:
+        if host != "*" and not host.startswith("."):
+            return host
+    return "localhost"
+
+
+def request(handler, path):
+    """Выполняет GET-запрос через обработчик WSGI и возвращает статус.
+
+    Запрос помечается WARM_UP_MARKER, чтобы middleware не учитывали
+    его в метриках и профилях.
+    """
+    environ = {
+        "PATH_INFO": path,
+        "HTTP_HOST": get_host(),
+        WARM_UP_MARKER: True,
+    }
+    setup_testing_defaults(environ)
+    statuses = []
+    response = handler(
+        environ,
+        lambda status, headers: statuses.append(status),
+    )
+    try:
+        b"".join(response)
+    finally:
+        response.close()
+    return statuses[0]
+
+
+def warm_up():
+    """Загружает URLconf и классы настроек и выполняет запросы прогрева."""
+    started = time.perf_counter()
+    resolver = get_resolver()
+    compile_patterns(resolver)
+    resolver.reverse_dict
+    import_setting_classes()
+    handler = WSGIHandler()
+    for path in settings.WARM_UP_PATHS:
+        try:
+            status = request(handler, path)
+        except Exception:
+            logger.exception(f"Не удалось выполнить прогрев {path}")
+            continue
+        logger.info(f"Прогрев {path}: {status}")
+    logger.info(
+        f"Прогрев выполнен за {(time.perf_counter() - started) * 1000:.1f} мс",
+    )
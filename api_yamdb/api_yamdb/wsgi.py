@@ -9,8 +9,16 @@ https://docs.djangoproject.com/en/3.2/howto/deployment/wsgi/
 
 import os
 
+from django.conf import settings
 from django.core.wsgi import get_wsgi_application
 
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "api_yamdb.settings")
 
 application = get_wsgi_application()
+
+if settings.WARM_UP_ON_STARTUP:
+    # Модуль прогрева использует настройки DRF, поэтому импортируется
+    # после инициализации Django.
+    from api_yamdb.startup import warm_up
+
+    warm_up()
@@ -1,10 +1,136 @@
 """Модуль содержит настройки для панели администратора приложения reviews."""
+from django.conf import settings
 from django.contrib import admin
+from django.core.paginator import Paginator
+from django.db import connection
+from django.db.models import QuerySet
+from django.utils.functional import cached_property
 
+from reviews.deletion import BULK_DELETES, count_dependents
 from reviews.models import Comment, Category, Genre, Review, Title, User
 
 
-class UserAdmin(admin.ModelAdmin):
+def estimate_count(model):
+    """Возвращает оценку количества строк таблицы из статистики БД.
+
+    Возвращает None, если статистика недоступна.
+    """
+    table = model._meta.db_table
+    with connection.cursor() as cursor:
+        if connection.vendor == "postgresql":
+            cursor.execute(
+                "SELECT reltuples::bigint FROM pg_class "
+                "WHERE oid = %s::regclass",
+                (table,),
+            )
+        elif connection.vendor == "mysql":
+            cursor.execute(
+                "SELECT table_rows FROM information_schema.tables "
+                "WHERE table_schema = DATABASE() AND table_name = %s",
+                (table,),
+            )
+        elif connection.vendor == "sqlite":
+            cursor.execute(
+                "SELECT 1 FROM sqlite_master WHERE name = 'sqlite_stat1'",
+            )
+            if cursor.fetchone() is None:
+                return None
+            cursor.execute(
+                "SELECT stat FROM sqlite_stat1 WHERE tbl = %s LIMIT 1",
+                (table,),
+            )
+            row = cursor.fetchone()
+            return int(row[0].split()[0]) if row else None
+        else:
+            return None
+        row = cursor.fetchone()
+    return int(row[0]) if row and row[0] is not None else None
+
+
+class EstimatedCountPaginator(Paginator):
+    """Пагинатор, не считающий COUNT(*) по большой таблице без фильтров."""
+
+    @cached_property
+    def count(self):
+        """Возвращает оценку количества строк или точное значение."""
+        if not self.object_list.query.where:
+            estimate = estimate_count(self.object_list.model)
+            if (
+                estimate is not None
+                and estimate >= settings.ADMIN_ESTIMATED_COUNT_THRESHOLD
+            ):
+                return estimate
+        return super().count
+
+
+class ScoreFilter(admin.SimpleListFilter):
+    """Фильтр по оценке с фиксированным набором значений."""
+
+    title = "оценка"
+    parameter_name = "score"
+
+    def lookups(self, request, model_admin):
+        """Возвращает допустимые оценки без запроса к БД."""
+        return tuple(
+            (str(score), str(score))
+            for score in range(settings.MIN_SCORE, settings.MAX_SCORE + 1)
+        )
+
+    def queryset(self, request, queryset):
+        """Фильтрует отзывы по выбранной оценке."""
+        if self.value():
+            return queryset.filter(score=self.value())
+        return queryset
+
+
+class BulkDeleteMixin:
+    """Удаляет записи с зависимыми записями через reviews.deletion."""
+
+    def delete_model(self, request, obj):
+        """Удаляет запись с зависимыми записями частями."""
+        BULK_DELETES[self.model](self.model.objects.filter(pk=obj.pk))
+
+    def delete_queryset(self, request, queryset):
+        """Удаляет выбранные записи с зависимыми записями частями."""
+        BULK_DELETES[self.model](queryset)
+
+    def get_deleted_objects(self, objs, request):
+        """Возвращает удаляемые записи и количество зависимых записей.
+
+        Зависимые записи не загружаются, а только подсчитываются,
+        а из удаляемых выводятся не больше ADMIN_DELETED_OBJECTS_LIMIT.
+        """
+        if isinstance(objs, QuerySet):
+            ids = objs.values("pk")
+            total = objs.count()
+        else:
+            ids = [obj.pk for obj in objs]
+            total = len(objs)
+        dependents = count_dependents(self.model, ids)
+        counts = {self.model: total, **dependents}
+        registry = self.admin_site._registry
+        perms_needed = {
+            model._meta.verbose_name
+            for model in counts
+            if model in registry
+            and not registry[model].has_delete_permission(request)
+        }
+        limit = settings.ADMIN_DELETED_OBJECTS_LIMIT
+        deleted_objects = [str(obj) for obj in objs[:limit]]
+        if total > limit:
+            deleted_objects.append(f"и ещё {total - limit}")
+        deleted_objects += [
+            f"{model._meta.verbose_name_plural}: {count}"
+            for model, count in dependents.items()
+        ]
+        model_count = {
+            model._meta.verbose_name_plural: count
+            for model, count in counts.items()
+        }
+        return deleted_objects, model_count, perms_needed, []
+
+
+class UserAdmin(BulkDeleteMixin, admin.ModelAdmin):
     """Настройки для панели администратора модели User."""
 
     list_display = (
@@ -37,7 +163,7 @@ class GenreAdmin(admin.ModelAdmin):
     list_filter = ("name",)
 
 
-class TitleAdmin(admin.ModelAdmin):
+class TitleAdmin(BulkDeleteMixin, admin.ModelAdmin):
     """Настройки для панели администратора модели Title."""
 
     list_display = ("name", "year", "description", "category")
@@ -54,18 +180,16 @@ class CommentAdmin(admin.ModelAdmin):
         "author",
         "pub_date",
     )
-    search_fields = (
-        "text",
-        "author",
-    )
-    list_filter = (
-        "text",
-        "author",
-        "pub_date",
-    )
+    list_select_related = ("author",)
+    search_fields = ("=author__username",)
+    date_hierarchy = "pub_date"
+    autocomplete_fields = ("author",)
+    raw_id_fields = ("review",)
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
 
 
-class ReviewAdmin(admin.ModelAdmin):
+class ReviewAdmin(BulkDeleteMixin, admin.ModelAdmin):
     """Настройки админ-панели для отзывов."""
 
     list_display = (
@@ -75,16 +199,13 @@ class ReviewAdmin(admin.ModelAdmin):
         "score",
         "pub_date",
     )
-    search_fields = (
-        "text",
-        "author",
-        "pub_date",
-    )
-    list_filter = (
-        "text",
-        "author",
-        "pub_date",
-    )
+    list_select_related = ("author",)
+    search_fields = ("=author__username",)
+    list_filter = (ScoreFilter,)
+    date_hierarchy = "pub_date"
+    autocomplete_fields = ("author", "title")
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
 
 
 admin.site.register(User, UserAdmin)
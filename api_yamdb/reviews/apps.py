@@ -7,3 +7,7 @@ class ReviewsConfig(AppConfig):
 
     default_auto_field = "django.db.models.BigAutoField"
     name = "reviews"
+
+    def ready(self):
+        """Подключает обработчики сигналов приложения."""
+        from reviews import signals  # noqa: F401
@@ -0,0 +1,128 @@
+"""Модуль содержит счётчики и рейтинг произведений приложения reviews."""
+from django.db.models import Avg, Count, Exists, F, OuterRef, Q, Subquery
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from reviews.models import Comment, Review, Title
+
+
+def rating_subquery():
+    """Возвращает подзапрос средней оценки произведения."""
+    return Subquery(
+        Review.objects.filter(title=OuterRef("pk"))
+        .order_by()
+        .values("title")
+        .annotate(avg=Avg("score"))
+        .values("avg"),
+    )
+
+
+def change_reviews_count(title_id, delta):
+    """Изменяет счётчик отзывов на delta и пересчитывает рейтинг."""
+    queryset = Title.objects.filter(pk=title_id)
+    if delta < 0:
+        queryset = queryset.filter(reviews_count__gte=-delta)
+    queryset.update(
+        reviews_count=F("reviews_count") + delta,
+        rating=rating_subquery(),
+        updated_at=timezone.now(),
+    )
+
+
+def refresh_rating(title_id):
+    """Пересчитывает рейтинг произведения."""
+    Title.objects.filter(pk=title_id).update(
+        rating=rating_subquery(),
+        updated_at=timezone.now(),
+    )
+
+
+def change_comments_count(review_id, delta):
+    """Изменяет счётчик комментариев отзыва на delta."""
+    queryset = Review.objects.filter(pk=review_id)
+    if delta < 0:
+        queryset = queryset.filter(comments_count__gte=-delta)
+    queryset.update(
+        comments_count=F("comments_count") + delta,
+        updated_at=timezone.now(),
+    )
+
+
+def count_subquery(model, field):
+    """Возвращает подзапрос количества записей model по полю field."""
+    return Coalesce(
+        Subquery(
+            model.objects.filter(**{field: OuterRef("pk")})
+            .order_by()
+            .values(field)
+            .annotate(count=Count("pk"))
+            .values("count"),
+        ),
+        0,
+    )
+
+
+def refresh_title_stats(title_ids):
+    """Пересчитывает счётчик отзывов и рейтинг произведений."""
+    Title.objects.filter(pk__in=title_ids).update(
+        reviews_count=count_subquery(Review, "title"),
+        rating=rating_subquery(),
+        updated_at=timezone.now(),
+    )
+
+
+def refresh_comments_count(review_ids):
+    """Пересчитывает счётчик комментариев отзывов."""
+    Review.objects.filter(pk__in=review_ids).update(
+        comments_count=count_subquery(Comment, "review"),
+        updated_at=timezone.now(),
+    )
+
+
+def rating_drift():
+    """Возвращает условие расхождения рейтинга с оценками отзывов."""
+    has_reviews = Exists(Review.objects.filter(title=OuterRef("pk")))
+    return (
+        ~Q(rating=rating_subquery())
+        | Q(has_reviews, rating__isnull=True)
+        | Q(~has_reviews, rating__isnull=False)
+    )
+
+
+def get_stats():
+    """Возвращает поля статистики, их значения и условия расхождения."""
+    reviews_count = count_subquery(Review, "title")
+    comments_count = count_subquery(Comment, "review")
+    return (
+        (
+            Title,
+            "reviews_count",
+            reviews_count,
+            ~Q(reviews_count=reviews_count),
+        ),
+        (Title, "rating", rating_subquery(), rating_drift()),
+        (
+            Review,
+            "comments_count",
+            comments_count,
+            ~Q(comments_count=comments_count),
+        ),
+    )
+
+
+def reconcile_counters(dry_run=False):
+    """Исправляет расхождения статистики одним запросом на поле.
+
+    Возвращает словарь с количеством исправленных записей
+    для каждого поля.
+    """
+    drift = {}
+    for model, field, actual, condition in get_stats():
+        queryset = model.objects.filter(condition)
+        if dry_run:
+            drift[field] = queryset.count()
+        else:
+            drift[field] = queryset.update(
+                **{field: actual, "updated_at": timezone.now()},
+            )
+    return drift
@@ -0,0 +1,194 @@
+"""Модуль содержит быстрое каскадное удаление для приложения reviews.
+
+Обычное удаление загружает в память все зависимые отзывы, комментарии
+и связи с жанрами и обрабатывает сигналы каждой записи. Здесь
+зависимые записи удаляются SQL-запросами частями по
+DELETION_CHUNK_SIZE: для них создаются отметки удаления ленты
+изменений, а счётчики и рейтинг оставшихся записей пересчитываются
+одним запросом на часть. Отзывы удаляются так же, а произведения
+и пользователи затем удаляются обычным delete(), которому уже
+нечего загружать.
+
+Каждая часть удаляемых записей удаляется в своей транзакции,
+чтобы не держать блокировку записи SQLite всё время удаления.
+При ошибке уже удалённые части остаются удалёнными, но данные
+остаются согласованными: часть удаляется вместе с зависимыми
+записями и пересчётом счётчиков.
+"""
+from collections import Counter
+
+from django.conf import settings
+from django.db import router, transaction
+from django.db.models import Q
+
+from api.cache import bump_catalog_version
+from reviews.counters import refresh_comments_count, refresh_title_stats
+from reviews.models import Comment, GenreTitle, Review, Title, Tombstone
+from reviews.models import User
+
+
+def iter_chunks(queryset, *fields):
+    """Возвращает строки (pk, *fields) queryset частями по возрастанию pk."""
+    rows = queryset.order_by("pk").values_list("pk", *fields)
+    last_pk = None
+    while True:
+        chunk = rows if last_pk is None else rows.filter(pk__gt=last_pk)
+        chunk = list(chunk[:settings.DELETION_CHUNK_SIZE])
+        if not chunk:
+            return
+        yield chunk
+        last_pk = chunk[-1][0]
+
+
+def raw_delete(model, ids, model_name=None):
+    """Удаляет записи по id одним запросом без сигналов.
+
+    Для model_name создаёт отметки удаления ленты изменений.
+    Возвращает количество удалённых записей.
+    """
+    if model_name is not None:
+        Tombstone.objects.bulk_create(
+            Tombstone(model_name=model_name, object_id=pk) for pk in ids
+        )
+    using = router.db_for_write(model)
+    return model._base_manager.using(using).filter(
+        pk__in=ids,
+    )._raw_delete(using)
+
+
+def delete_comments(queryset, refresh=True):
+    """Удаляет комментарии и пересчитывает счётчики их отзывов."""
+    deleted = 0
+    for rows in iter_chunks(queryset, "review_id"):
+        deleted += raw_delete(
+            Comment,
+            [pk for pk, _ in rows],
+            Tombstone.MODEL_COMMENT,
+        )
+        if refresh:
+            refresh_comments_count({review_id for _, review_id in rows})
+    return deleted
+
+
+def delete_reviews(queryset, refresh=True):
+    """Удаляет отзывы с комментариями и пересчитывает их произведения.
+
+    Возвращает количество удалённых отзывов и комментариев.
+    """
+    deleted = Counter()
+    for rows in iter_chunks(queryset, "title_id"):
+        ids = [pk for pk, _ in rows]
+        deleted[Comment._meta.label] += delete_comments(
+            Comment.objects.filter(review_id__in=ids),
+            refresh=False,
+        )
+        deleted[Review._meta.label] += raw_delete(
+            Review,
+            ids,
+            Tombstone.MODEL_REVIEW,
+        )
+        if refresh:
+            refresh_title_stats({title_id for _, title_id in rows})
+    return deleted
+
+
+def delete_roots(model, ids):
+    """Удаляет сами записи обычным delete() и возвращает его счётчики."""
+    _, deleted = model.objects.filter(pk__in=ids).delete()
+    return Counter(deleted)
+
+
+def to_result(deleted):
+    """Возвращает результат удаления в формате QuerySet.delete()."""
+    deleted = {label: count for label, count in deleted.items() if count}
+    return sum(deleted.values()), deleted
+
+
+def bulk_delete_reviews(queryset):
+    """Удаляет отзывы из queryset вместе с комментариями."""
+    deleted = Counter()
+    for rows in iter_chunks(queryset):
+        with transaction.atomic():
+            deleted += delete_reviews(
+                Review.objects.filter(pk__in=[pk for pk, in rows]),
+            )
+            transaction.on_commit(bump_catalog_version)
+    return to_result(deleted)
+
+
+def bulk_delete_titles(queryset):
+    """Удаляет произведения из queryset вместе с зависимыми записями."""
+    deleted = Counter()
+    for rows in iter_chunks(queryset):
+        ids = [pk for pk, in rows]
+        with transaction.atomic():
+            deleted += delete_reviews(
+                Review.objects.filter(title_id__in=ids),
+                refresh=False,
+            )
+            for links in iter_chunks(
+                GenreTitle.objects.filter(title_id__in=ids),
+            ):
+                deleted[GenreTitle._meta.label] += raw_delete(
+                    GenreTitle,
+                    [pk for pk, in links],
+                )
+            deleted += delete_roots(Title, ids)
+            transaction.on_commit(bump_catalog_version)
+    return to_result(deleted)
+
+
+def bulk_delete_users(queryset):
+    """Удаляет пользователей из queryset вместе с отзывами и комментариями.
+
+    Счётчики и рейтинг отзывов и произведений других пользователей
+    пересчитываются.
+    """
+    deleted = Counter()
+    for rows in iter_chunks(queryset):
+        ids = [pk for pk, in rows]
+        with transaction.atomic():
+            deleted += delete_reviews(Review.objects.filter(author_id__in=ids))
+            deleted[Comment._meta.label] += delete_comments(
+                Comment.objects.filter(author_id__in=ids),
+            )
+            deleted += delete_roots(User, ids)
+            transaction.on_commit(bump_catalog_version)
+    return to_result(deleted)
+
+
+def get_dependents(model, ids):
+    """Возвращает queryset зависимых записей, удаляемых вместе с model."""
+    if model is Title:
+        return (
+            Review.objects.filter(title_id__in=ids),
+            Comment.objects.filter(review__title_id__in=ids),
+            GenreTitle.objects.filter(title_id__in=ids),
+        )
+    if model is Review:
+        return (Comment.objects.filter(review_id__in=ids),)
+    if model is User:
+        return (
+            Review.objects.filter(author_id__in=ids),
+            Comment.objects.filter(
+                Q(author_id__in=ids) | Q(review__author_id__in=ids),
+            ),
+        )
+    return ()
+
+
+def count_dependents(model, ids):
+    """Возвращает количество зависимых записей по моделям без их загрузки."""
+    counts = {}
+    for queryset in get_dependents(model, ids):
+        count = queryset.count()
+        if count:
+            counts[queryset.model] = count
+    return counts
+
+
+BULK_DELETES = {
+    Review: bulk_delete_reviews,
+    Title: bulk_delete_titles,
+    User: bulk_delete_users,
+}
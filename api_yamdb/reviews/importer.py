@@ -0,0 +1,476 @@
+"""Модуль содержит этапы загрузки данных приложения reviews из CSV-файлов.
+
+Файлы разбираются независимо друг от друга, а запись в БД идёт
+волнами, в которых этап зависит только от этапов предыдущих волн.
+"""
+import os
+import time
+from csv import DictReader
+
+from django.core.exceptions import ValidationError
+from django.core.management.color import no_style
+from django.db import connection, models
+
+from api.errors import ErrorMessage
+from reviews.models import (
+    Category,
+    Comment,
+    Genre,
+    GenreTitle,
+    Review,
+    Title,
+    User,
+)
+
+# Этап: (файл, модель, ((столбец CSV, поле модели), ...)).
+# Первым всегда идёт столбец id.
+STAGES = {
+    "users": (
+        "users.csv",
+        User,
+        (
+            ("id", "id"),
+            ("username", "username"),
+            ("email", "email"),
+            ("role", "role"),
+            ("bio", "bio"),
+            ("first_name", "first_name"),
+            ("last_name", "last_name"),
+        ),
+    ),
+    "category": (
+        "category.csv",
+        Category,
+        (("id", "id"), ("name", "name"), ("slug", "slug")),
+    ),
+    "genre": (
+        "genre.csv",
+        Genre,
+        (("id", "id"), ("name", "name"), ("slug", "slug")),
+    ),
+    "titles": (
+        "titles.csv",
+        Title,
+        (
+            ("id", "id"),
+            ("name", "name"),
+            ("year", "year"),
+            ("category", "category_id"),
+        ),
+    ),
+    "genre_title": (
+        "genre_title.csv",
+        GenreTitle,
+        (("id", "id"), ("title_id", "title_id"), ("genre_id", "genre_id")),
+    ),
+    "review": (
+        "review.csv",
+        Review,
+        (
+            ("id", "id"),
+            ("title_id", "title_id"),
+            ("text", "text"),
+            ("author", "author_id"),
+            ("score", "score"),
+            ("pub_date", "pub_date"),
+        ),
+    ),
+    "comments": (
+        "comments.csv",
+        Comment,
+        (
+            ("id", "id"),
+            ("review_id", "review_id"),
+            ("text", "text"),
+            ("author", "author_id"),
+            ("pub_date", "pub_date"),
+        ),
+    ),
+}
+
+# Коды ошибок, которые БД не проверяет и которые выводятся
+# как предупреждения: SQLite не ограничивает длину varchar.
+LENIENT_ERROR_CODES = {"sqlite": ("max_length",)}
+
+# Волны этапов в порядке зависимостей по внешним ключам.
+WAVES = (
+    ("users", "category", "genre"),
+    ("titles",),
+    ("genre_title", "review"),
+    ("comments",),
+)
+
+
+def get_field(model, attname):
+    """Возвращает поле модели по имени атрибута."""
+    return next(
+        field
+        for field in model._meta.concrete_fields
+        if field.attname == attname
+    )
+
+
+def get_existing_ids(model, ids, batch_size, **filters):
+    """Возвращает множество id, которые уже есть в таблице модели."""
+    existing = set()
+    for start in range(0, len(ids), batch_size):
+        existing.update(
+            model.objects.filter(
+                pk__in=ids[start:start + batch_size],
+                **filters,
+            ).values_list("pk", flat=True),
+        )
+    return existing
+
+
+def set_staff_flags(users, existing, batch_size):
+    """Выставляет is_staff по роли пользователя, как User.save().
+
+    bulk_create и bulk_update не вызывают save(), поэтому флаг
+    выставляется до записи. Суперпользователи сохраняют доступ.
+    """
+    superusers = get_existing_ids(
+        User,
+        [user.pk for user in users if user.pk in existing],
+        batch_size,
+        is_superuser=True,
+    )
+    for user in users:
+        user.is_staff = (
+            user.is_admin or user.is_moderator or user.pk in superusers
+        )
+
+
+def upsert_stage(name, rows, batch_size):
+    """Создаёт новые и обновляет существующие записи этапа по id.
+
+    Возвращает количество созданных и обновлённых записей.
+    """
+    _, model, columns = STAGES[name]
+    fields = [get_field(model, attname) for _, attname in columns]
+    objects = [
+        model(**{field.attname: value for field, value in zip(fields, row)})
+        for row in rows
+    ]
+    existing = get_existing_ids(
+        model,
+        [obj.pk for obj in objects],
+        batch_size,
+    )
+    update_fields = [field.name for field in fields if not field.primary_key]
+    if model is User:
+        set_staff_flags(objects, existing, batch_size)
+        update_fields.append("is_staff")
+    created = [obj for obj in objects if obj.pk not in existing]
+    updated = [obj for obj in objects if obj.pk in existing]
+    # bulk_create подставляет текущее время в поля auto_now_add,
+    # поэтому даты из файла восстанавливаются отдельным обновлением.
+    auto_now_add = [
+        field.attname
+        for field in fields
+        if getattr(field, "auto_now_add", False)
+    ]
+    dates = [
+        [getattr(obj, attname) for attname in auto_now_add]
+        for obj in created
+    ]
+    model.objects.bulk_create(created, batch_size=batch_size)
+    if created and auto_now_add:
+        for obj, values in zip(created, dates):
+            for attname, value in zip(auto_now_add, values):
+                setattr(obj, attname, value)
+        model.objects.bulk_update(created, auto_now_add, batch_size)
+    if updated:
+        model.objects.bulk_update(updated, update_fields, batch_size)
+    return len(created), len(updated)
+
+
+def reset_sequences(names):
+    """Сдвигает последовательности id после вставки явных id."""
+    models = [STAGES[name][1] for name in names]
+    with connection.cursor() as cursor:
+        for sql in connection.ops.sequence_reset_sql(no_style(), models):
+            cursor.execute(sql)
+
+
+class IdSet:
+    """Компактное множество положительных id на битовых картах.
+
+    id делятся на блоки по 2 ** CHUNK_BITS значений, и карта
+    создаётся только для блоков, в которых есть id. Поэтому память
+    зависит от количества id, а не от самого большого из них.
+    """
+
+    CHUNK_BITS = 16
+
+    def __init__(self, ids=()):
+        """Создаёт множество из последовательности id."""
+        self.chunks = {}
+        for pk in ids:
+            self.add(pk)
+
+    def add(self, pk):
+        """Добавляет id в множество."""
+        chunk = self.chunks.get(pk >> self.CHUNK_BITS)
+        if chunk is None:
+            chunk = self.chunks[pk >> self.CHUNK_BITS] = bytearray(
+                (1 << self.CHUNK_BITS) // 8,
+            )
+        index, bit = divmod(pk & ((1 << self.CHUNK_BITS) - 1), 8)
+        chunk[index] |= 1 << bit
+
+    def __contains__(self, pk):
+        """Проверяет, есть ли id в множестве."""
+        chunk = self.chunks.get(pk >> self.CHUNK_BITS)
+        if chunk is None:
+            return False
+        index, bit = divmod(pk & ((1 << self.CHUNK_BITS) - 1), 8)
+        return bool(chunk[index] >> bit & 1)
+
+
+def get_unique_columns(model, columns):
+    """Возвращает наборы столбцов CSV с уникальными значениями."""
+    by_name = {
+        get_field(model, attname).name: column for column, attname in columns
+    }
+    unique = [
+        (by_name[field.name],)
+        for field in model._meta.concrete_fields
+        if field.unique and not field.primary_key and field.name in by_name
+    ]
+    for constraint in model._meta.constraints:
+        if isinstance(constraint, models.UniqueConstraint) and all(
+            name in by_name for name in constraint.fields
+        ):
+            unique.append(tuple(by_name[name] for name in constraint.fields))
+    return unique
+
+
+def validate_row(row, fields):
+    """Возвращает значения строки, ошибки и предупреждения в её полях."""
+    values, errors, warnings = {}, [], []
+    lenient = LENIENT_ERROR_CODES.get(connection.vendor, ())
+    for column, field in fields:
+        try:
+            if field.is_relation:
+                values[column] = field.to_python(row[column])
+            else:
+                values[column] = field.clean(row[column], None)
+        except ValidationError as error:
+            for item in error.error_list:
+                target = warnings if item.code in lenient else errors
+                target.append(f"{column}: {' '.join(item.messages)}")
+            # Значение с одними предупреждениями БД всё равно примет.
+            if all(item.code in lenient for item in error.error_list):
+                values[column] = field.to_python(row[column])
+    return values, errors, warnings
+
+
+def check_id(pk, seen):
+    """Возвращает ошибки id строки и добавляет его в множество."""
+    if pk is None:
+        return []
+    if pk < 1:
+        return [f"{ErrorMessage.IMPORT_INVALID_ID_ERROR}{pk}"]
+    errors = []
+    if pk in seen:
+        errors.append(f"{ErrorMessage.IMPORT_DUPLICATE_ID_ERROR}{pk}")
+    seen.add(pk)
+    return errors
+
+
+def check_references(values, fields, known):
+    """Возвращает ошибки ссылок строки на несуществующие объекты."""
+    errors = []
+    for column, field in fields:
+        value = values.get(column)
+        if (
+            field.is_relation
+            and value is not None
+            and value not in known[field.related_model]
+        ):
+            errors.append(
+                f"{ErrorMessage.IMPORT_MISSING_REFERENCE_ERROR}"
+                f"{column}={value}",
+            )
+    return errors
+
+
+def check_unique(row, unique):
+    """Возвращает ошибки повторяющихся уникальных значений строки."""
+    errors = []
+    for key, seen_values in unique.items():
+        value = tuple(row[column] for column in key)
+        if value in seen_values:
+            errors.append(
+                f"{ErrorMessage.IMPORT_DUPLICATE_VALUE_ERROR}"
+                f"{', '.join(key)}={', '.join(value)}",
+            )
+        seen_values.add(value)
+    return errors
+
+
+def parse_stage(name, path):
+    """Разбирает и построчно проверяет CSV-файл этапа.
+
+    Проверяются значения полей, id и уникальные значения внутри
+    файла. Возвращает имя этапа, кортежи значений полей, места строк
+    в файле, ошибки, предупреждения и время разбора в секундах.
+    Функция выполняется в дочернем процессе.
+    """
+    started = time.perf_counter()
+    filename, model, columns = STAGES[name]
+    fields = [
+        (column, get_field(model, attname)) for column, attname in columns
+    ]
+    unique = {key: set() for key in get_unique_columns(model, columns)}
+    seen = IdSet()
+    rows, locations, errors, warnings = [], [], [], []
+    with open(os.path.join(path, filename), encoding="utf-8") as csv_file:
+        reader = DictReader(csv_file)
+        missing = [
+            column
+            for column, _ in columns
+            if column not in (reader.fieldnames or ())
+        ]
+        if missing:
+            errors.append(
+                f"{filename}:1: {ErrorMessage.IMPORT_MISSING_COLUMNS_ERROR}"
+                f"{', '.join(missing)}",
+            )
+            return name, rows, locations, errors, warnings, 0
+        line = reader.line_num
+        for row in reader:
+            location = f"{filename}:{line + 1}"
+            line = reader.line_num
+            values, row_errors, row_warnings = validate_row(row, fields)
+            row_errors += check_id(values.get("id"), seen)
+            row_errors += check_unique(row, unique)
+            rows.append(tuple(values.get(column) for column, _ in columns))
+            locations.append(location)
+            errors.extend(f"{location}: {error}" for error in row_errors)
+            warnings.extend(
+                f"{location}: {warning}" for warning in row_warnings
+            )
+    return (
+        name,
+        rows,
+        locations,
+        errors,
+        warnings,
+        time.perf_counter() - started,
+    )
+
+
+def check_stage_references(name, rows, locations, known):
+    """Возвращает ошибки ссылок строк этапа и дополняет множества id.
+
+    known содержит множества id моделей, на которые ссылаются этапы.
+    """
+    _, model, columns = STAGES[name]
+    fields = [
+        (column, get_field(model, attname)) for column, attname in columns
+    ]
+    errors = []
+    for row, location in zip(rows, locations):
+        pk = row[0]
+        if model in known and pk is not None and pk > 0:
+            known[model].add(pk)
+        values = dict(zip((column for column, _ in columns), row))
+        errors.extend(
+            f"{location}: {error}"
+            for error in check_references(values, fields, known)
+        )
+    return errors
+
+
+def check_existing_unique(name, rows, locations, batch_size):
+    """Возвращает ошибки уникальных значений, занятых записями БД.
+
+    Значение может повторяться только у записи с тем же id,
+    которую загрузка обновит.
+    """
+    _, model, columns = STAGES[name]
+    positions = {column: index for index, (column, _) in enumerate(columns)}
+    errors = []
+    for key in get_unique_columns(model, columns):
+        attnames = [columns[positions[column]][1] for column in key]
+        keyed = [
+            (tuple(row[positions[column]] for column in key), row[0], place)
+            for row, place in zip(rows, locations)
+        ]
+        keyed = [item for item in keyed if None not in item[0]]
+        step = max(1, batch_size // len(key))
+        for start in range(0, len(keyed), step):
+            batch = keyed[start:start + step]
+            lookup = models.Q()
+            for value, _, _ in batch:
+                lookup |= models.Q(**dict(zip(attnames, value)))
+            taken = {
+                tuple(found[:-1]): found[-1]
+                for found in model.objects.filter(lookup).values_list(
+                    *attnames,
+                    "pk",
+                )
+            }
+            errors.extend(
+                f"{place}: {ErrorMessage.IMPORT_EXISTING_VALUE_ERROR}"
+                f"{', '.join(key)}={', '.join(map(str, value))}"
+                for value, pk, place in batch
+                if taken.get(value, pk) != pk
+            )
+    return errors
+
+
+def validate_stages(names, path, executor, batch_size):
+    """Разбирает файлы выбранных этапов и проверяет их целостность.
+
+    Файлы разбираются в пуле процессов executor, а ссылки и
+    уникальность значений относительно записей БД проверяются
+    в текущем процессе. Множества id заполняются из БД, поэтому
+    ссылки на записи пропущенных этапов тоже проверяются.
+    Возвращает словарь этапов со строками и временем разбора,
+    списки ошибок и предупреждений.
+    """
+    parsed = {name: executor.submit(parse_stage, name, path) for name in names}
+    referenced = {
+        field.related_model
+        for name in names
+        for field in STAGES[name][1]._meta.concrete_fields
+        if field.is_relation
+    }
+    known = {
+        model: IdSet(
+            model.objects.values_list("pk", flat=True).iterator(),
+        )
+        for model in referenced
+    }
+    stages, errors, warnings = {}, [], []
+    for wave in WAVES:
+        for name in wave:
+            if name not in parsed:
+                continue
+            (
+                _,
+                rows,
+                locations,
+                stage_errors,
+                stage_warnings,
+                parse_seconds,
+            ) = parsed[name].result()
+            stage_errors += check_stage_references(
+                name,
+                rows,
+                locations,
+                known,
+            )
+            stage_errors += check_existing_unique(
+                name,
+                rows,
+                locations,
+                batch_size,
+            )
+            stages[name] = rows, parse_seconds
+            errors.extend(stage_errors)
+            warnings.extend(stage_warnings)
+    return stages, errors, warnings
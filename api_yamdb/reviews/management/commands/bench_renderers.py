@@ -0,0 +1,120 @@
+"""Команда Django для замера скорости renderer на страницах API.
+
+Создаёт синтетический каталог в транзакции, которая затем
+откатывается, сериализует страницы произведений и отзывов
+и сравнивает размер ответа (без сжатия и с gzip) и скорость
+кодирования в байтах в секунду для каждого renderer.
+
+Пример использования:
+python manage.py bench_renderers --page-size 100 --repeat 200
+"""
+import gzip
+import logging
+import statistics
+import time
+
+from django.core.management import BaseCommand
+from django.db import transaction
+
+from rest_framework.renderers import JSONRenderer
+
+from api.renderers import FastJSONRenderer, MessagePackRenderer
+from api.serializers import ReviewSerializer, TitleReadSerializer
+from reviews.management.commands.bench_title_filters import seed_catalog
+from reviews.models import Review, Title, User
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+ch = logging.StreamHandler()
+ch.setLevel(logging.INFO)
+
+logger.addHandler(ch)
+
+RENDERERS = (
+    ("json", JSONRenderer),
+    ("fast-json", FastJSONRenderer),
+    ("msgpack", MessagePackRenderer),
+)
+
+
+def seed_reviews(titles, authors_count):
+    """Создаёт синтетических авторов и их отзывы на произведения."""
+    User.objects.bulk_create(
+        User(username=f"bench{index}", email=f"bench{index}@yamdb.fake")
+        for index in range(authors_count)
+    )
+    authors = list(User.objects.filter(username__startswith="bench"))
+    Review.objects.bulk_create(
+        Review(
+            title=title,
+            author=author,
+            text=f"Отзыв {author.username} на «{title.name}»",
+            score=1 + (title.pk + author.pk) % 10,
+        )
+        for title in titles
+        for author in authors
+    )
+
+
+def get_pages(page_size):
+    """Возвращает сериализованные страницы произведений и отзывов."""
+    titles = (
+        Title.objects.select_related("category")
+        .prefetch_related("genre")
+        .order_by("id")[:page_size]
+    )
+    reviews = Review.objects.select_related("author").order_by("id")[
+        :page_size
+    ]
+    return (
+        ("titles", TitleReadSerializer(titles, many=True).data),
+        ("reviews", ReviewSerializer(reviews, many=True).data),
+    )
+
+
+def measure(renderer, data, repeat):
+    """Возвращает размеры ответа без сжатия и с gzip и медиану времени."""
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        content = renderer.render(data)
+        timings.append(time.perf_counter() - started)
+    return (
+        len(content),
+        len(gzip.compress(content)),
+        statistics.median(timings),
+    )
+
+
+class Command(BaseCommand):
+    """Команда сравнивает скорость renderer."""
+
+    def add_arguments(self, parser):
+        """Добавляет аргументы команды."""
+        parser.add_argument("--page-size", type=int, default=100)
+        parser.add_argument("--repeat", type=int, default=200)
+
+    def handle(self, *args, **options):
+        """Содержит код замера."""
+        page_size = options["page_size"]
+        with transaction.atomic():
+            logger.info("Создаю синтетический каталог...")
+            seed_catalog(page_size, 10)
+            seed_reviews(
+                Title.objects.order_by("id")[: max(1, page_size // 10)],
+                10,
+            )
+            for page, data in get_pages(page_size):
+                for name, renderer_class in RENDERERS:
+                    size, gzip_size, seconds = measure(
+                        renderer_class(),
+                        data,
+                        options["repeat"],
+                    )
+                    logger.info(
+                        f"{page} {name}: {size} байт, "
+                        f"gzip {gzip_size} байт, "
+                        f"{seconds * 1000:.3f} мс, "
+                        f"{size / seconds / 2 ** 20:.1f} МБ/с",
+                    )
+            transaction.set_rollback(True)
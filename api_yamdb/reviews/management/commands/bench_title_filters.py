@@ -0,0 +1,103 @@
+"""Команда Django для замера фильтрации произведений по жанру.
+
+Создаёт синтетический каталог в транзакции, которая затем
+откатывается, и сравнивает фильтр через join с GenreTitle
+с подзапросом из TitleFilter.
+
+Пример использования:
+python manage.py bench_title_filters --titles 100000 --genres 30
+"""
+import logging
+import random
+import statistics
+import time
+
+from django.conf import settings
+from django.core.management import BaseCommand
+from django.db import transaction
+
+from api.filters import TitleFilter
+from reviews.models import Genre, GenreTitle, Title
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+ch = logging.StreamHandler()
+ch.setLevel(logging.INFO)
+
+logger.addHandler(ch)
+
+BATCH_SIZE = 5000
+
+
+def seed_catalog(titles_count, genres_count):
+    """Создаёт синтетические жанры, произведения и связи между ними."""
+    Genre.objects.bulk_create(
+        Genre(name=f"bench genre {index}", slug=f"bench-genre-{index}")
+        for index in range(genres_count)
+    )
+    genres = list(Genre.objects.filter(slug__startswith="bench-genre-"))
+    randomizer = random.Random(0)
+    for start in range(0, titles_count, BATCH_SIZE):
+        chosen = [
+            randomizer.sample(genres, randomizer.randint(1, 3))
+            for _ in range(min(BATCH_SIZE, titles_count - start))
+        ]
+        titles = Title.objects.bulk_create(
+            Title(
+                name=f"bench title {start + index}",
+                year=1900 + (start + index) % 120,
+            )
+            for index in range(len(chosen))
+        )
+        if titles[0].pk is None:
+            titles = Title.objects.filter(
+                name__startswith="bench title ",
+            ).order_by("-pk")[: len(chosen)][::-1]
+        GenreTitle.objects.bulk_create(
+            GenreTitle(title=title, genre=genre)
+            for title, title_genres in zip(titles, chosen)
+            for genre in title_genres
+        )
+    return genres
+
+
+def measure(queryset, repeat):
+    """Возвращает медиану времени выборки страницы и count в мс."""
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        queryset.count()
+        list(queryset[: settings.REST_FRAMEWORK["PAGE_SIZE"]])
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings)
+
+
+class Command(BaseCommand):
+    """Команда сравнивает задержку фильтрации по жанру."""
+
+    def add_arguments(self, parser):
+        """Добавляет аргументы команды."""
+        parser.add_argument("--titles", type=int, default=100000)
+        parser.add_argument("--genres", type=int, default=30)
+        parser.add_argument("--repeat", type=int, default=20)
+
+    def handle(self, *args, **options):
+        """Содержит код замера."""
+        with transaction.atomic():
+            logger.info("Создаю синтетический каталог...")
+            genres = seed_catalog(options["titles"], options["genres"])
+            queryset = Title.objects.order_by("id")
+            slug = genres[0].slug
+            join_ms = measure(
+                queryset.filter(genre__slug=slug),
+                options["repeat"],
+            )
+            subquery_ms = measure(
+                TitleFilter().filter_genre(queryset, "genre", slug),
+                options["repeat"],
+            )
+            logger.info(
+                f"titles={options['titles']} genres={options['genres']} "
+                f"join={join_ms:.1f}ms subquery={subquery_ms:.1f}ms",
+            )
+            transaction.set_rollback(True)
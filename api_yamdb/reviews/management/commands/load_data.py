@@ -1,13 +1,34 @@
 """Команда Django для загрузки данных в базу данных из CSV-файлов.
 
+Файлы разбираются и построчно проверяются параллельно в пуле
+процессов, затем проверяются ссылочная целостность и уникальность
+значений с учётом записей в БД. Разобранные строки сохраняются
+в одной транзакции волнами в порядке зависимостей по внешним
+ключам. Повторный запуск обновляет уже загруженные записи по id.
+
 Пример использования:
 python manage.py load_data
+python manage.py load_data --only review comments --workers 2
+python manage.py load_data --dry-run
 """
 import logging
-from csv import DictReader
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import django
+from django.conf import settings
+from django.core.management import BaseCommand, CommandError
+from django.db import transaction
 
-from django.core.management import BaseCommand
-from reviews.models import Category, Comment, Genre, Review, Title, User
+from api.cache import bump_catalog_version
+from reviews.counters import reconcile_counters
+from reviews.importer import (
+    STAGES,
+    WAVES,
+    reset_sequences,
+    upsert_stage,
+    validate_stages,
+)
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
@@ -20,83 +41,83 @@ logger.addHandler(ch)
 class Command(BaseCommand):
     """Команда загружает данные для следующих моделей."""
 
+    def add_arguments(self, parser):
+        """Добавляет аргументы команды."""
+        parser.add_argument(
+            "--path",
+            default=str(settings.BASE_DIR / "static" / "data"),
+        )
+        parser.add_argument("--only", nargs="+", choices=tuple(STAGES))
+        parser.add_argument(
+            "--skip",
+            nargs="+",
+            choices=tuple(STAGES),
+            default=(),
+        )
+        parser.add_argument("--workers", type=int, default=None)
+        parser.add_argument("--batch-size", type=int, default=1000)
+        parser.add_argument("--dry-run", action="store_true")
+
     def handle(self, *args, **options):
         """Содержит код для загрузки в БД."""
-        logger.info("Загружаю данные в базу...")
-
-        for row in DictReader(
-            open("./static/data/users.csv", encoding="utf-8"),
-        ):
-            user = User(
-                id=row["id"],
-                username=row["username"],
-                email=row["email"],
-                first_name=row["first_name"],
-                last_name=row["last_name"],
-                bio=row["bio"],
-                role=row["role"],
-            )
-            user.save()
-        for row in DictReader(
-            open("./static/data/category.csv", encoding="utf-8"),
-        ):
-            category = Category(
-                id=row["id"],
-                name=row["name"],
-                slug=row["slug"],
-            )
-            category.save()
-
-        for row in DictReader(
-            open("./static/data/genre.csv", encoding="utf-8"),
-        ):
-            genre = Genre(
-                id=row["id"],
-                name=row["name"],
-                slug=row["slug"],
+        selected = [
+            name
+            for name in options["only"] or STAGES
+            if name not in options["skip"]
+        ]
+        if not selected:
+            raise CommandError("Не выбрано ни одного этапа загрузки.")
+        started = time.perf_counter()
+        logger.info("Проверяю файлы...")
+        with ProcessPoolExecutor(
+            max_workers=options["workers"],
+            initializer=django.setup,
+        ) as executor:
+            stages, errors, warnings = validate_stages(
+                selected,
+                options["path"],
+                executor,
+                options["batch_size"],
             )
-            genre.save()
-
-        for row in DictReader(
-            open("./static/data/titles.csv", encoding="utf-8"),
-        ):
-            title = Title(
-                id=row["id"],
-                name=row["name"],
-                year=row["year"],
-                category_id=row["category"],
-            )
-            title.save()
-
-        for row in DictReader(
-            open("./static/data/genre_title.csv", encoding="utf-8"),
-        ):
-            title = Title.objects.get(id=row["title_id"])
-            title.genre.add(row["genre_id"])
-            title.save()
-
-        for row in DictReader(
-            open("./static/data/review.csv", encoding="utf-8"),
-        ):
-            review = Review(
-                id=row["id"],
-                title_id=row["title_id"],
-                text=row["text"],
-                author_id=row["author"],
-                score=row["score"],
-                pub_date=row["pub_date"],
-            )
-            review.save()
+        for warning in warnings:
+            logger.warning(warning)
+        for error in errors:
+            logger.error(error)
+        if errors:
+            raise CommandError(f"Найдено ошибок: {len(errors)}.")
+        logger.info(
+            f"Файлы проверены за {time.perf_counter() - started:.2f} с.",
+        )
+        if options["dry_run"]:
+            return
+        logger.info("Загружаю данные в базу...")
+        started = time.perf_counter()
+        with transaction.atomic():
+            for wave in WAVES:
+                for name in wave:
+                    if name in stages:
+                        self.load_stage(
+                            name,
+                            *stages[name],
+                            options["batch_size"],
+                        )
+            reset_sequences(selected)
+            # Массовые операции не вызывают сигналы, поэтому статистика
+            # пересчитывается в той же транзакции.
+            drift = reconcile_counters()
+        bump_catalog_version()
+        logger.info(
+            f"Пересчитана статистика: {drift}. "
+            f"Данные успешно загружены за "
+            f"{time.perf_counter() - started:.2f} с.",
+        )
 
-        for row in DictReader(
-            open("./static/data/comments.csv", encoding="utf-8"),
-        ):
-            comment = Comment(
-                id=row["id"],
-                review_id=row["review_id"],
-                text=row["text"],
-                author_id=row["author"],
-                pub_date=row["pub_date"],
-            )
-            comment.save()
-        logger.info("Данные успешно загружены.")
+    def load_stage(self, name, rows, parse_seconds, batch_size):
+        """Сохраняет записи этапа и выводит время его выполнения."""
+        started = time.perf_counter()
+        created, updated = upsert_stage(name, rows, batch_size)
+        logger.info(
+            f"{name}: создано {created}, обновлено {updated}, "
+            f"разбор {parse_seconds:.2f} с, "
+            f"запись {time.perf_counter() - started:.2f} с.",
+        )
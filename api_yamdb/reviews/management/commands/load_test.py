@@ -0,0 +1,91 @@
+"""Команда Django для нагрузочного тестирования запущенного API.
+
+Запускается против WSGI- и ASGI-развёртывания по очереди,
+чтобы сравнить пропускную способность при росте конкурентности.
+
+Пример использования:
+gunicorn api_yamdb.wsgi -w 1 --threads 8
+python manage.py load_test http://127.0.0.1:8000/api/v1/titles/ --label wsgi
+uvicorn api_yamdb.asgi:application --workers 1
+python manage.py load_test http://127.0.0.1:8000/api/v1/titles/ --label asgi
+"""
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.error import URLError
+from urllib.request import urlopen
+
+from django.core.management import BaseCommand
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+ch = logging.StreamHandler()
+ch.setLevel(logging.INFO)
+
+logger.addHandler(ch)
+
+
+def fetch(url, timeout):
+    """Выполняет запрос и возвращает длительность или None при ошибке."""
+    started = time.perf_counter()
+    try:
+        with urlopen(url, timeout=timeout) as response:
+            response.read()
+    except (URLError, OSError):
+        return None
+    return time.perf_counter() - started
+
+
+def percentile(values, fraction):
+    """Возвращает перцентиль отсортированного списка."""
+    if not values:
+        return 0.0
+    return values[min(len(values) - 1, int(len(values) * fraction))]
+
+
+class Command(BaseCommand):
+    """Команда измеряет задержки и RPS на разных уровнях конкурентности."""
+
+    def add_arguments(self, parser):
+        """Добавляет аргументы команды."""
+        parser.add_argument("urls", nargs="+", help="Адреса для запросов")
+        parser.add_argument(
+            "--concurrency",
+            default="1,8,32,64",
+            help="Уровни конкурентности через запятую",
+        )
+        parser.add_argument(
+            "--requests",
+            type=int,
+            default=500,
+            help="Количество запросов на каждом уровне",
+        )
+        parser.add_argument("--timeout", type=float, default=10.0)
+        parser.add_argument("--label", default="", help="Метка прогона")
+
+    def handle(self, *args, **options):
+        """Содержит код нагрузочного теста."""
+        urls = options["urls"]
+        total = options["requests"]
+        for level in options["concurrency"].split(","):
+            level = int(level)
+            targets = (urls[index % len(urls)] for index in range(total))
+            started = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=level) as executor:
+                results = list(
+                    executor.map(
+                        lambda url: fetch(url, options["timeout"]),
+                        targets,
+                    ),
+                )
+            elapsed = time.perf_counter() - started
+            durations = sorted(result for result in results if result)
+            errors = total - len(durations)
+            logger.info(
+                f"{options['label']} concurrency={level} "
+                f"rps={len(durations) / elapsed:.1f} "
+                f"p50={percentile(durations, 0.5) * 1000:.1f}ms "
+                f"p95={percentile(durations, 0.95) * 1000:.1f}ms "
+                f"p99={percentile(durations, 0.99) * 1000:.1f}ms "
+                f"errors={errors}",
+            )
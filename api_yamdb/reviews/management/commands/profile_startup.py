@@ -0,0 +1,159 @@
+"""Команда Django для измерения времени холодного старта.
+
+Запускает новый процесс Python с ``-X importtime`` и измеряет этапы
+django.setup(), создания обработчика WSGI с middleware, загрузки
+URLconf, прогрева и первого запроса. Для каждого этапа выводится
+время и самые долгие импорты.
+
+Пример использования:
+python manage.py profile_startup --path /api/v1/titles/ --limit 15
+"""
+import json
+import os
+import subprocess
+import sys
+from collections import defaultdict
+
+from django.conf import settings
+from django.core.management import BaseCommand, CommandError
+
+PHASE_MARKER = "startup-phase:"
+# Код дочернего процесса: перед каждым этапом в stderr пишется маркер,
+# чтобы отнести строки -X importtime к этапам.
+CHILD_SCRIPT = """
+import json
+import sys
+import time
+
+phase_name = None
+phase_started = None
+timings = []
+
+
+def start(name):
+    global phase_name, phase_started
+    finish()
+    print("{marker}", name, file=sys.stderr, flush=True)
+    phase_name, phase_started = name, time.perf_counter()
+
+
+def finish():
+    if phase_name is not None:
+        timings.append((phase_name, time.perf_counter() - phase_started))
+
+
+def request(handler, path):
+    from wsgiref.util import setup_testing_defaults
+
+    environ = {{"PATH_INFO": path}}
+    setup_testing_defaults(environ)
+    statuses = []
+    response = handler(environ, lambda status, headers: statuses.append(
+        status,
+    ))
+    b"".join(response)
+    response.close()
+    return statuses[0]
+
+
+start("setup")
+import django
+django.setup()
+start("handler")
+from django.core.handlers.wsgi import WSGIHandler
+handler = WSGIHandler()
+start("urlconf")
+from django.urls import get_resolver
+get_resolver().url_patterns
+if {warm_up}:
+    start("warm_up")
+    from api_yamdb.startup import warm_up
+    warm_up()
+start("first_request")
+status = request(handler, {path!r})
+start("second_request")
+request(handler, {path!r})
+finish()
+print(json.dumps({{"timings": timings, "status": status}}))
+"""
+
+
+def parse_import_times(stderr):
+    """Разбирает вывод -X importtime по этапам.
+
+    Возвращает словарь этапа со списком пар модуль и суммарное время
+    импорта в микросекундах.
+    """
+    imports = defaultdict(list)
+    phase = None
+    for line in stderr.splitlines():
+        if line.startswith(PHASE_MARKER):
+            phase = line[len(PHASE_MARKER):].strip()
+            continue
+        if not line.startswith("import time:") or phase is None:
+            continue
+        try:
+            _, cumulative, module = line[len("import time:"):].split("|")
+            imports[phase].append((module[1:].rstrip(), int(cumulative)))
+        except ValueError:
+            continue
+    return imports
+
+
+class Command(BaseCommand):
+    """Команда измеряет этапы холодного старта."""
+
+    def add_arguments(self, parser):
+        """Добавляет аргументы команды."""
+        parser.add_argument("--path", default="/api/v1/titles/")
+        parser.add_argument("--limit", type=int, default=10)
+        parser.add_argument(
+            "--warm-up",
+            action="store_true",
+            help="Выполнить прогрев из api_yamdb.startup перед запросом.",
+        )
+
+    def handle(self, *args, **options):
+        """Содержит код измерения."""
+        script = CHILD_SCRIPT.format(
+            marker=PHASE_MARKER,
+            warm_up=options["warm_up"],
+            path=options["path"],
+        )
+        environment = {
+            **os.environ,
+            "DJANGO_SETTINGS_MODULE": settings.SETTINGS_MODULE,
+            "PYTHONPATH": os.pathsep.join(
+                filter(None, (str(settings.BASE_DIR),
+                              os.environ.get("PYTHONPATH"))),
+            ),
+        }
+        result = subprocess.run(
+            (sys.executable, "-X", "importtime", "-c", script),
+            capture_output=True,
+            cwd=settings.BASE_DIR,
+            env=environment,
+            text=True,
+        )
+        if result.returncode:
+            raise CommandError(
+                f"Процесс завершился с ошибкой:\n{result.stderr[-2000:]}",
+            )
+        report = json.loads(result.stdout.splitlines()[-1])
+        imports = parse_import_times(result.stderr)
+        self.stdout.write(f"Статус первого запроса: {report['status']}")
+        for phase, seconds in report["timings"]:
+            self.write_phase(phase, seconds, imports[phase], options["limit"])
+
+    def write_phase(self, phase, seconds, imports, limit):
+        """Выводит время этапа и его самые долгие импорты."""
+        self.stdout.write(
+            f"{phase}: {seconds * 1000:.1f} мс, "
+            f"импортировано модулей: {len(imports)}",
+        )
+        for module, cumulative in sorted(
+            imports,
+            key=lambda item: item[1],
+            reverse=True,
+        )[:limit]:
+            self.stdout.write(f"  {cumulative / 1000:9.1f} мс {module}")
@@ -0,0 +1,47 @@
+"""Команда Django для вывода самых затратных функций по профилям запросов.
+
+Объединяет сохранённые ProfilingMiddleware профили всех или
+выбранных url и выводит статистику pstats.
+
+Пример использования:
+python manage.py profile_stats --url-name titles-list --limit 20
+"""
+import io
+import pstats
+
+from django.core.management import BaseCommand, CommandError
+
+from api.profiling import get_profile_dir, list_profile_paths, list_profiles
+
+SORT_KEYS = ("cumulative", "tottime", "calls")
+
+
+class Command(BaseCommand):
+    """Команда выводит объединённую статистику профилей."""
+
+    def add_arguments(self, parser):
+        """Добавляет аргументы команды."""
+        parser.add_argument("--url-name", action="append", default=[])
+        parser.add_argument("--sort", choices=SORT_KEYS, default="cumulative")
+        parser.add_argument("--limit", type=int, default=30)
+
+    def handle(self, *args, **options):
+        """Содержит код вывода статистики."""
+        url_names = options["url_name"] or list(list_profiles())
+        paths = []
+        for url_name in url_names:
+            directory = get_profile_dir(url_name)
+            if directory is None:
+                raise CommandError(f"Некорректное имя url: {url_name}")
+            paths.extend(str(path) for path in list_profile_paths(directory))
+        if not paths:
+            raise CommandError("Профили не найдены.")
+        output = io.StringIO()
+        stats = pstats.Stats(*paths, stream=output)
+        stats.strip_dirs().sort_stats(options["sort"]).print_stats(
+            options["limit"],
+        )
+        self.stdout.write(
+            f"Профилей: {len(paths)}, url: {', '.join(url_names)}",
+        )
+        self.stdout.write(output.getvalue())
@@ -0,0 +1,38 @@
+"""Команда Django для исправления счётчиков и рейтинга произведений.
+
+Пример использования:
+python manage.py reconcile_counters --dry-run
+"""
+import logging
+
+from django.core.management import BaseCommand
+
+from reviews.counters import reconcile_counters
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+ch = logging.StreamHandler()
+ch.setLevel(logging.INFO)
+
+logger.addHandler(ch)
+
+
+class Command(BaseCommand):
+    """Команда пересчитывает reviews_count, rating и comments_count."""
+
+    def add_arguments(self, parser):
+        """Добавляет аргументы команды."""
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Только показать количество расхождений",
+        )
+
+    def handle(self, *args, **options):
+        """Содержит код для исправления счётчиков."""
+        drift = reconcile_counters(dry_run=options["dry_run"])
+        for counter, count in drift.items():
+            if options["dry_run"]:
+                logger.info(f"{counter}: найдено расхождений {count}")
+            else:
+                logger.info(f"{counter}: исправлено записей {count}")
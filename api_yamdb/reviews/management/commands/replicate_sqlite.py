@@ -0,0 +1,124 @@
+"""Команда Django для копирования SQLite БД на реплики только для чтения.
+
+Снимок основной БД делается через online backup API SQLite
+порциями страниц, поэтому запись в основную БД не блокируется
+на всё время копирования. Готовый снимок атомарно заменяет
+файлы реплик через os.replace.
+
+Пример использования:
+python manage.py replicate_sqlite --interval 5
+python manage.py replicate_sqlite --once --target /srv/replica.sqlite3
+"""
+import logging
+import os
+import shutil
+import sqlite3
+import tempfile
+import time
+
+from django.conf import settings
+from django.core.management import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS, connections
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+ch = logging.StreamHandler()
+ch.setLevel(logging.INFO)
+
+logger.addHandler(ch)
+
+
+def take_snapshot(source, snapshot, pages):
+    """Копирует БД в файл snapshot и возвращает количество страниц.
+
+    source содержит параметры подключения к основной БД.
+    """
+    total_pages = 0
+
+    def progress(status, remaining, total):
+        nonlocal total_pages
+        total_pages = total
+
+    src = sqlite3.connect(source["database"], uri=source.get("uri", False))
+    dst = sqlite3.connect(snapshot)
+    try:
+        src.backup(dst, pages=pages, progress=progress, sleep=0.001)
+        # Реплика открывается без WAL, чтобы рядом с заменяемым
+        # файлом не оставался журнал от предыдущего снимка.
+        dst.execute("PRAGMA journal_mode=DELETE")
+    finally:
+        dst.close()
+        src.close()
+    return total_pages
+
+
+def publish(snapshot, target):
+    """Атомарно заменяет файл реплики копией снимка.
+
+    Возвращает время замены файла.
+    """
+    fd, temp_path = tempfile.mkstemp(
+        dir=os.path.dirname(os.path.abspath(target)),
+        suffix=".tmp",
+    )
+    os.close(fd)
+    try:
+        shutil.copyfile(snapshot, temp_path)
+        os.replace(temp_path, target)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+    return time.time()
+
+
+class Command(BaseCommand):
+    """Команда по расписанию копирует основную БД на реплики."""
+
+    def add_arguments(self, parser):
+        """Добавляет аргументы команды."""
+        parser.add_argument("--target", action="append", default=[])
+        parser.add_argument("--interval", type=float, default=5.0)
+        parser.add_argument("--pages", type=int, default=1024)
+        parser.add_argument("--once", action="store_true")
+
+    def handle(self, *args, **options):
+        """Содержит код репликации."""
+        connection = connections[DEFAULT_DB_ALIAS]
+        if connection.vendor != "sqlite":
+            raise CommandError("Команда работает только с SQLite.")
+        source = connection.get_connection_params()
+        targets = options["target"] or [
+            str(settings.DATABASES[alias]["NAME"])
+            for alias in settings.REPLICA_DATABASES
+        ]
+        if not targets:
+            raise CommandError(
+                "Не указаны реплики: задайте --target "
+                "или YAMDB_REPLICA_DATABASES.",
+            )
+        while True:
+            self.replicate(source, targets, options["pages"])
+            if options["once"]:
+                return
+            time.sleep(options["interval"])
+
+    def replicate(self, source, targets, pages):
+        """Делает снимок основной БД и публикует его на реплики.
+
+        Отставание реплики считается от начала снимка до замены её
+        файла: данные в снимке не старше его начала.
+        """
+        started = time.time()
+        with tempfile.TemporaryDirectory() as directory:
+            snapshot = os.path.join(directory, "snapshot.sqlite3")
+            total_pages = take_snapshot(source, snapshot, pages)
+            snapshot_seconds = time.time() - started
+            for target in targets:
+                copy_started = time.time()
+                replaced = publish(snapshot, target)
+                logger.info(
+                    f"{target}: страниц {total_pages}, "
+                    f"снимок {snapshot_seconds:.3f} с, "
+                    f"копирование {replaced - copy_started:.3f} с, "
+                    f"отставание {replaced - started:.3f} с.",
+                )
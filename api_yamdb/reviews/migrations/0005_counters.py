@@ -0,0 +1,46 @@
+# Generated by Django 3.2 on 2026-10-19 12:26
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def fill_counters(apps, schema_editor):
+    Title = apps.get_model('reviews', 'Title')
+    Review = apps.get_model('reviews', 'Review')
+    Comment = apps.get_model('reviews', 'Comment')
+    for model, counter, related_model, field in (
+        (Title, 'reviews_count', Review, 'title'),
+        (Review, 'comments_count', Comment, 'review'),
+    ):
+        model.objects.update(**{counter: Coalesce(
+            Subquery(
+                related_model.objects.filter(**{field: OuterRef('pk')})
+                .order_by()
+                .values(field)
+                .annotate(count=Count('pk'))
+                .values('count')
+            ),
+            0,
+        )})
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reviews', '0004_change_feed'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='review',
+            name='comments_count',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='Количество комментариев'),
+        ),
+        migrations.AddField(
+            model_name='title',
+            name='reviews_count',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='Количество отзывов'),
+        ),
+        migrations.RunPython(fill_counters, migrations.RunPython.noop),
+    ]
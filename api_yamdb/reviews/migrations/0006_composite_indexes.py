@@ -0,0 +1,43 @@
+# Generated by Django 3.2 on 2026-10-19 12:29
+
+from django.db import migrations, models
+from django.db.models import Min
+
+
+def delete_duplicate_genre_titles(apps, schema_editor):
+    GenreTitle = apps.get_model('reviews', 'GenreTitle')
+    kept_ids = (
+        GenreTitle.objects.values('title', 'genre')
+        .annotate(kept_id=Min('id'))
+        .values('kept_id')
+    )
+    GenreTitle.objects.exclude(id__in=kept_ids).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reviews', '0005_counters'),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            delete_duplicate_genre_titles, migrations.RunPython.noop
+        ),
+        migrations.AddIndex(
+            model_name='comment',
+            index=models.Index(fields=['review', '-pub_date'], name='comment_review_pub_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='genretitle',
+            index=models.Index(fields=['genre', 'title'], name='genretitle_genre_title_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='review',
+            index=models.Index(fields=['title', 'pub_date'], name='review_title_pub_date_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='genretitle',
+            constraint=models.UniqueConstraint(fields=('title', 'genre'), name='unique_genre_title'),
+        ),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 3.2 on 2026-10-19 12:32
+
+from collections import defaultdict
+
+from django.db import migrations, models
+
+
+def fill_genre_slugs(apps, schema_editor):
+    Title = apps.get_model('reviews', 'Title')
+    GenreTitle = apps.get_model('reviews', 'GenreTitle')
+    slugs = defaultdict(list)
+    for title_id, slug in GenreTitle.objects.values_list(
+        'title_id', 'genre__slug'
+    ).iterator():
+        slugs[title_id].append(slug)
+    for title_id, title_slugs in slugs.items():
+        Title.objects.filter(pk=title_id).update(
+            genre_slugs=',' + ','.join(sorted(title_slugs)) + ','
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reviews', '0007_admin_pub_date_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='title',
+            name='genre_slugs',
+            field=models.TextField(blank=True, default='', editable=False, help_text='Slug жанров через запятую, обновляется автоматически', verbose_name='Slug жанров'),
+        ),
+        migrations.RunPython(fill_genre_slugs, migrations.RunPython.noop),
+    ]
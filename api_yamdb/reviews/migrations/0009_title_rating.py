@@ -0,0 +1,38 @@
+# Generated by Django 3.2 on 2026-10-19 12:35
+
+from django.db import migrations, models
+from django.db.models import Avg, OuterRef, Subquery
+import reviews.validators
+
+
+def fill_rating(apps, schema_editor):
+    Title = apps.get_model('reviews', 'Title')
+    Review = apps.get_model('reviews', 'Review')
+    Title.objects.update(rating=Subquery(
+        Review.objects.filter(title=OuterRef('pk'))
+        .order_by()
+        .values('title')
+        .annotate(avg=Avg('score'))
+        .values('avg')
+    ))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reviews', '0008_title_genre_slugs'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='title',
+            name='rating',
+            field=models.FloatField(db_index=True, editable=False, help_text='Средняя оценка, обновляется автоматически', null=True, verbose_name='Рейтинг'),
+        ),
+        migrations.AlterField(
+            model_name='title',
+            name='year',
+            field=models.PositiveSmallIntegerField(db_index=True, help_text='Укажите год выхода', validators=[reviews.validators.validate_year], verbose_name='Год выхода'),
+        ),
+        migrations.RunPython(fill_rating, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 3.2 on 2026-10-19 13:39
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reviews', '0010_review_author_pub_date_index'),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name='title',
+            name='genre_slugs',
+        ),
+    ]
@@ -158,6 +158,7 @@ class Title(models.Model):
         verbose_name="Год выхода",
         null=False,
         blank=False,
+        db_index=True,
         validators=(validate_year,),
         help_text="Укажите год выхода",
     )
@@ -175,6 +176,23 @@ class Title(models.Model):
         verbose_name="Жанр",
         help_text="Укажите жанр",
     )
+    reviews_count = models.PositiveIntegerField(
+        verbose_name="Количество отзывов",
+        default=0,
+        editable=False,
+    )
+    rating = models.FloatField(
+        verbose_name="Рейтинг",
+        help_text="Средняя оценка, обновляется автоматически",
+        null=True,
+        db_index=True,
+        editable=False,
+    )
+    updated_at = models.DateTimeField(
+        auto_now=True,
+        db_index=True,
+        verbose_name="Дата изменения",
+    )
 
     class Meta:
         """Определяет настройки модели Title."""
@@ -211,6 +229,18 @@ class GenreTitle(models.Model):
 
         verbose_name = "Произведение и жанр"
         verbose_name_plural = "Произведения и жанры"
+        constraints = (
+            models.UniqueConstraint(
+                fields=("title", "genre"),
+                name="unique_genre_title",
+            ),
+        )
+        indexes = (
+            models.Index(
+                fields=("genre", "title"),
+                name="genretitle_genre_title_idx",
+            ),
+        )
 
     def __str__(self):
         """Определяет отображение модели GenreTitle."""
@@ -260,8 +290,19 @@ class Review(models.Model):
     )
     pub_date = models.DateTimeField(
         auto_now_add=True,
+        db_index=True,
         verbose_name="Дата публикации отзыва",
     )
+    comments_count = models.PositiveIntegerField(
+        verbose_name="Количество комментариев",
+        default=0,
+        editable=False,
+    )
+    updated_at = models.DateTimeField(
+        auto_now=True,
+        db_index=True,
+        verbose_name="Дата изменения отзыва",
+    )
 
     class Meta:
         """Определяет настройки модели Review."""
@@ -275,6 +316,16 @@ class Review(models.Model):
                 name="unique_review",
             ),
         )
+        indexes = (
+            models.Index(
+                fields=("title", "pub_date"),
+                name="review_title_pub_date_idx",
+            ),
+            models.Index(
+                fields=("author", "pub_date"),
+                name="review_author_pub_date_idx",
+            ),
+        )
 
     def __str__(self) -> str:
         """Определяет отображение модели Review."""
@@ -306,8 +357,14 @@ class Comment(models.Model):
     )
     pub_date = models.DateTimeField(
         auto_now_add=True,
+        db_index=True,
         verbose_name="Дата комментария",
     )
+    updated_at = models.DateTimeField(
+        auto_now=True,
+        db_index=True,
+        verbose_name="Дата изменения комментария",
+    )
 
     class Meta:
         """Определяет настройки модели Comment."""
@@ -315,7 +372,50 @@ class Comment(models.Model):
         verbose_name = "Комментарий"
         verbose_name_plural = "Комментарии"
         ordering = ("-pub_date",)
+        indexes = (
+            models.Index(
+                fields=("review", "-pub_date"),
+                name="comment_review_pub_date_idx",
+            ),
+        )
 
     def __str__(self) -> str:
         """Определяет отображение модели Comment."""
         return self.text[:15]
+
+
+class Tombstone(models.Model):
+    """Модель удалённых записей для ленты изменений."""
+
+    MODEL_TITLE = "title"
+    MODEL_REVIEW = "review"
+    MODEL_COMMENT = "comment"
+
+    model_name = models.CharField(
+        verbose_name="Тип записи",
+        max_length=7,
+        choices=(
+            (MODEL_TITLE, MODEL_TITLE),
+            (MODEL_REVIEW, MODEL_REVIEW),
+            (MODEL_COMMENT, MODEL_COMMENT),
+        ),
+    )
+    object_id = models.BigIntegerField(
+        verbose_name="Идентификатор удалённой записи",
+    )
+    deleted_at = models.DateTimeField(
+        auto_now_add=True,
+        db_index=True,
+        verbose_name="Дата удаления",
+    )
+
+    class Meta:
+        """Определяет настройки модели Tombstone."""
+
+        verbose_name = "Удалённая запись"
+        verbose_name_plural = "Удалённые записи"
+        ordering = ("deleted_at", "id")
+
+    def __str__(self) -> str:
+        """Определяет отображение модели Tombstone."""
+        return f"{self.model_name} {self.object_id}"
@@ -0,0 +1,54 @@
+"""Модуль содержит обработчики сигналов приложения reviews."""
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from reviews.counters import (
+    change_comments_count,
+    change_reviews_count,
+    refresh_rating,
+)
+from reviews.models import Comment, Review, Title
+from reviews.models import Tombstone
+
+
+@receiver(post_delete, sender=Title)
+@receiver(post_delete, sender=Review)
+@receiver(post_delete, sender=Comment)
+def create_tombstone(sender, instance, **kwargs):
+    """Сохраняет отметку об удалении записи для ленты изменений."""
+    Tombstone.objects.create(
+        model_name=sender._meta.model_name,
+        object_id=instance.pk,
+    )
+
+
+@receiver(post_save, sender=Review)
+def increase_reviews_count(sender, instance, created, **kwargs):
+    """Увеличивает счётчик отзывов и пересчитывает рейтинг произведения."""
+    if not instance.title_id:
+        return
+    if created:
+        change_reviews_count(instance.title_id, 1)
+    else:
+        refresh_rating(instance.title_id)
+
+
+@receiver(post_delete, sender=Review)
+def decrease_reviews_count(sender, instance, **kwargs):
+    """Уменьшает счётчик отзывов и пересчитывает рейтинг произведения."""
+    if instance.title_id:
+        change_reviews_count(instance.title_id, -1)
+
+
+@receiver(post_save, sender=Comment)
+def increase_comments_count(sender, instance, created, **kwargs):
+    """Увеличивает счётчик комментариев отзыва."""
+    if created and instance.review_id:
+        change_comments_count(instance.review_id, 1)
+
+
+@receiver(post_delete, sender=Comment)
+def decrease_comments_count(sender, instance, **kwargs):
+    """Уменьшает счётчик комментариев отзыва."""
+    if instance.review_id:
+        change_comments_count(instance.review_id, -1)
@@ -0,0 +1,75 @@
+import csv
+import json
+from http import HTTPStatus
+
+import pytest
+
+from tests.utils import create_reviews, create_titles
+
+
+@pytest.mark.django_db(transaction=True)
+class Test08ExportAPI:
+
+    def test_01_export_permissions(self, client, user_client, admin_client):
+        url = '/api/v1/export/titles.csv'
+        response = client.get(url)
+        assert response.status_code == HTTPStatus.UNAUTHORIZED, (
+            f'Проверьте, что GET-запрос неавторизованного пользователя к '
+            f'`{url}` возвращает ответ со статусом 401.'
+        )
+        response = user_client.get(url)
+        assert response.status_code == HTTPStatus.FORBIDDEN, (
+            f'Проверьте, что GET-запрос пользователя с ролью `user` к '
+            f'`{url}` возвращает ответ со статусом 403.'
+        )
+        response = admin_client.get('/api/v1/export/unknown.csv')
+        assert response.status_code == HTTPStatus.NOT_FOUND, (
+            'Проверьте, что выгрузка неизвестного ресурса возвращает '
+            'ответ со статусом 404.'
+        )
+
+    def test_02_export_titles_csv(self, admin_client):
+        titles, categories, _ = create_titles(admin_client)
+        url = '/api/v1/export/titles.csv'
+        response = admin_client.get(url)
+        assert response.status_code == HTTPStatus.OK, (
+            f'Проверьте, что GET-запрос администратора к `{url}` '
+            'возвращает ответ со статусом 200.'
+        )
+        assert response.streaming, (
+            f'Проверьте, что `{url}` отдаёт потоковый ответ.'
+        )
+        content = b''.join(response.streaming_content).decode()
+        rows = list(csv.DictReader(content.splitlines()))
+        assert list(rows[0].keys()) == [
+            'id', 'name', 'year', 'category', 'description'
+        ], (
+            'Проверьте, что колонки выгрузки совпадают с '
+            '`static/data/titles.csv` и включают описание.'
+        )
+        assert [int(row['id']) for row in rows] == [
+            title['id'] for title in titles
+        ]
+        assert rows[0]['name'] == titles[0]['name']
+        assert rows[0]['description'] == titles[0]['description']
+
+    def test_03_export_reviews_ndjson(self, admin_client, admin, user_client,
+                                      user, moderator_client, moderator):
+        author_map = {
+            admin: admin_client,
+            user: user_client,
+            moderator: moderator_client
+        }
+        reviews, _ = create_reviews(admin_client, author_map)
+        url = '/api/v1/export/review.ndjson'
+        response = admin_client.get(url)
+        assert response.status_code == HTTPStatus.OK
+        lines = b''.join(response.streaming_content).decode().splitlines()
+        rows = [json.loads(line) for line in lines]
+        assert len(rows) == len(reviews), (
+            f'Проверьте, что `{url}` выгружает все отзывы.'
+        )
+        assert set(rows[0].keys()) == {
+            'id', 'title_id', 'text', 'author', 'score', 'pub_date'
+        }
+        assert rows[0]['author'] == admin.id
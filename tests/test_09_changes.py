@@ -0,0 +1,102 @@
+from http import HTTPStatus
+
+import pytest
+
+from tests.utils import create_reviews, create_titles
+
+
+@pytest.mark.django_db(transaction=True)
+class Test09ChangesAPI:
+    url = '/api/v1/changes/'
+
+    def test_01_changes_pagination(self, client, admin_client):
+        titles, _, _ = create_titles(admin_client)
+        response = client.get(self.url, {'limit': 1})
+        assert response.status_code == HTTPStatus.OK, (
+            f'Проверьте, что GET-запрос к `{self.url}` возвращает ответ со '
+            'статусом 200.'
+        )
+        data = response.json()
+        assert data['has_more'] is True
+        assert [change['id'] for change in data['results']] == [
+            titles[0]['id']
+        ]
+        response = client.get(self.url, {'since': data['next']})
+        data = response.json()
+        assert data['has_more'] is False
+        assert [change['id'] for change in data['results']] == [
+            titles[1]['id']
+        ], (
+            f'Проверьте, что `{self.url}` отдаёт только изменения после '
+            'переданного курсора.'
+        )
+        assert data['results'][0]['data']['name'] == titles[1]['name']
+
+        response = client.get(self.url, {'since': data['next']})
+        assert response.json()['results'] == []
+
+    def test_02_changes_updates_and_deletes(self, client, admin_client,
+                                             admin):
+        reviews, titles = create_reviews(admin_client, {admin: admin_client})
+        cursor = client.get(self.url).json()['next']
+
+        admin_client.patch(
+            f'/api/v1/titles/{titles[1]["id"]}/', data={'name': 'Новое имя'}
+        )
+        admin_client.delete(f'/api/v1/titles/{titles[0]["id"]}/')
+        changes = client.get(self.url, {'since': cursor}).json()['results']
+        actions = [
+            (change['type'], change['id'], change['action'])
+            for change in changes
+        ]
+        assert actions[0] == ('title', titles[1]['id'], 'update'), (
+            f'Проверьте, что `{self.url}` отдаёт изменения записей в '
+            'порядке их появления.'
+        )
+        assert set(actions[1:]) == {
+            ('review', reviews[0]['id'], 'delete'),
+            ('title', titles[0]['id'], 'delete'),
+        }, (
+            f'Проверьте, что `{self.url}` отдаёт удаления записей, в том '
+            'числе каскадные.'
+        )
+
+    def test_03_changes_invalid_cursor(self, client):
+        for cursor in (
+            'broken',
+            '99999999999999999999999.title.1',
+            '-1.title.1',
+            f'0.title.{2 ** 64}',
+        ):
+            response = client.get(self.url, {'since': cursor})
+            assert response.status_code == HTTPStatus.BAD_REQUEST, (
+                f'Проверьте, что курсор `{cursor}` возвращает ответ со '
+                'статусом 400.'
+            )
+        response = client.get(self.url, {'limit': 0})
+        assert response.status_code == HTTPStatus.BAD_REQUEST
+
+    def test_04_changes_counters(self, client, admin_client, admin,
+                                 user_client):
+        reviews, titles = create_reviews(admin_client, {admin: admin_client})
+        cursor = client.get(self.url).json()['next']
+
+        admin_client.post(
+            f'/api/v1/titles/{titles[0]["id"]}/reviews/'
+            f'{reviews[0]["id"]}/comments/',
+            data={'text': 'Комментарий'}
+        )
+        user_client.post(
+            f'/api/v1/titles/{titles[1]["id"]}/reviews/',
+            data={'text': 'Отзыв', 'score': 7}
+        )
+        changes = client.get(self.url, {'since': cursor}).json()['results']
+        changed = {(change['type'], change['id']) for change in changes}
+        assert ('review', reviews[0]['id']) in changed, (
+            f'Проверьте, что `{self.url}` отдаёт отзыв после изменения '
+            'счётчика его комментариев.'
+        )
+        assert ('title', titles[1]['id']) in changed, (
+            f'Проверьте, что `{self.url}` отдаёт произведение после '
+            'изменения счётчика его отзывов.'
+        )
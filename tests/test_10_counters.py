@@ -0,0 +1,47 @@
+import pytest
+from django.core.management import call_command
+
+from reviews.models import Review, Title
+from tests.utils import create_comments
+
+
+@pytest.mark.django_db(transaction=True)
+class Test10Counters:
+
+    def test_01_counters_in_responses(self, client, admin_client, admin,
+                                      user_client, user):
+        author_map = {admin: admin_client, user: user_client}
+        comments, reviews, titles = create_comments(admin_client, author_map)
+        title_url = f'/api/v1/titles/{titles[0]["id"]}/'
+        review_url = f'{title_url}reviews/{reviews[0]["id"]}/'
+
+        assert client.get(title_url).json()['reviews_count'] == 2, (
+            f'Проверьте, что ответ `{title_url}` содержит поле '
+            '`reviews_count` с количеством отзывов.'
+        )
+        assert client.get(review_url).json()['comments_count'] == 2, (
+            f'Проверьте, что ответ `{review_url}` содержит поле '
+            '`comments_count` с количеством комментариев.'
+        )
+
+        admin_client.delete(f'{review_url}comments/{comments[0]["id"]}/')
+        assert client.get(review_url).json()['comments_count'] == 1
+        admin_client.delete(review_url)
+        assert client.get(title_url).json()['reviews_count'] == 1, (
+            'Проверьте, что счётчик отзывов уменьшается при удалении отзыва.'
+        )
+
+    def test_02_reconcile_counters(self, admin_client, admin):
+        _, reviews, titles = create_comments(
+            admin_client, {admin: admin_client}
+        )
+        Title.objects.update(reviews_count=10)
+        Review.objects.update(comments_count=0)
+
+        call_command('reconcile_counters', '--dry-run')
+        assert Title.objects.get(pk=titles[0]['id']).reviews_count == 10
+
+        call_command('reconcile_counters')
+        assert Title.objects.get(pk=titles[0]['id']).reviews_count == 1
+        assert Title.objects.get(pk=titles[1]['id']).reviews_count == 0
+        assert Review.objects.get(pk=reviews[0]['id']).comments_count == 1
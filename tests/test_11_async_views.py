@@ -0,0 +1,48 @@
+import asyncio
+import json
+import time
+from http import HTTPStatus
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.core import mail
+from django.test import RequestFactory, override_settings
+
+from api.async_views import async_read_view
+from api.mail import dispatch_confirmation_code, get_outbox_depth
+from api.views import TitleViewSet
+from tests.utils import create_titles
+
+
+@pytest.mark.django_db(transaction=True)
+class Test11AsyncViews:
+
+    def test_01_async_read_view(self, admin_client):
+        titles, _, _ = create_titles(admin_client)
+        view = async_read_view(TitleViewSet.as_view({'get': 'list'}))
+        assert asyncio.iscoroutinefunction(view), (
+            'Проверьте, что `async_read_view` возвращает async view.'
+        )
+        response = async_to_sync(view)(
+            RequestFactory().get('/api/v1/titles/')
+        )
+        assert response.status_code == HTTPStatus.OK
+        data = json.loads(response.content)
+        assert data['count'] == len(titles)
+
+    def test_02_async_write_view(self, admin):
+        view = async_read_view(TitleViewSet.as_view({'post': 'create'}))
+        response = async_to_sync(view)(
+            RequestFactory().post('/api/v1/titles/', data={})
+        )
+        assert response.status_code == HTTPStatus.UNAUTHORIZED
+
+    @override_settings(EMAIL_ASYNC_DISPATCH=True)
+    def test_03_email_dispatch(self):
+        outbox_before_count = len(mail.outbox)
+        dispatch_confirmation_code('valid@yamdb.fake', 'code')
+        while get_outbox_depth():
+            time.sleep(0.01)
+        assert len(mail.outbox) == outbox_before_count + 1, (
+            'Проверьте, что письмо с confirmation code отправляется в фоне.'
+        )
@@ -0,0 +1,52 @@
+import pytest
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from api.permissions import IsAdminOnly, IsAuthorOrStaffOrReadOnly
+from reviews.models import Review, Title
+
+
+def make_request(user, method='patch'):
+    request = Request(getattr(APIRequestFactory(), method)('/'))
+    request.user = user
+    return request
+
+
+@pytest.mark.django_db(transaction=True)
+class Test12Permissions:
+
+    @pytest.fixture
+    def review(self, user):
+        title = Title.objects.create(name='Терминатор', year=1984)
+        review_id = Review.objects.create(
+            text='review', score=5, author=user, title=title
+        ).pk
+        return Review.objects.get(pk=review_id)
+
+    def test_01_object_permission_without_queries(
+            self, django_assert_num_queries, review, user, moderator, admin,
+            django_user_model):
+        other = django_user_model.objects.create_user(
+            username='OtherUser', email='other@yamdb.fake'
+        )
+        permission = IsAuthorOrStaffOrReadOnly()
+        expected = ((user, True), (moderator, True), (admin, True),
+                    (other, False))
+        for current_user, allowed in expected:
+            request = make_request(current_user)
+            with django_assert_num_queries(0):
+                assert permission.has_object_permission(
+                    request, None, review
+                ) is allowed, (
+                    'Проверьте, что `IsAuthorOrStaffOrReadOnly` корректно '
+                    'проверяет доступ к объекту без запросов к БД.'
+                )
+
+    def test_02_role_cached_per_request(self, admin, user):
+        request = make_request(admin, 'get')
+        assert IsAdminOnly().has_permission(request, None)
+        admin.role = user.ROLE_USER
+        assert IsAdminOnly().has_permission(request, None), (
+            'Проверьте, что роль пользователя вычисляется один раз за запрос.'
+        )
+        assert not IsAdminOnly().has_permission(make_request(user), None)
@@ -0,0 +1,61 @@
+import re
+
+import pytest
+from django.db import IntegrityError, connection
+
+from reviews.models import Comment, Genre, GenreTitle, Review, Title
+
+pytestmark = pytest.mark.skipif(
+    connection.vendor != 'sqlite',
+    reason='Проверка плана запроса рассчитана на EXPLAIN QUERY PLAN SQLite.'
+)
+
+
+def assert_no_table_scan(queryset, index_name=None):
+    plan = queryset.explain()
+    scans = re.findall(r'SCAN (?:TABLE )?(\w+)\s*$', plan, re.MULTILINE)
+    assert not scans, (
+        f'Запрос выполняет полный просмотр таблиц {scans}:\n{plan}'
+    )
+    if index_name:
+        assert index_name in plan, (
+            f'Запрос не использует индекс `{index_name}`:\n{plan}'
+        )
+
+
+@pytest.mark.django_db(transaction=True)
+class Test13Indexes:
+
+    def test_01_review_by_title(self):
+        assert_no_table_scan(
+            Review.objects.filter(title_id=1).order_by('pub_date'),
+            'review_title_pub_date_idx',
+        )
+
+    def test_02_review_by_author(self):
+        assert_no_table_scan(
+            Review.objects.filter(author_id=1).order_by('-pub_date'),
+            'review_author_pub_date_idx',
+        )
+
+    def test_03_comment_by_review(self):
+        assert_no_table_scan(
+            Comment.objects.filter(review_id=1).order_by('-pub_date'),
+            'comment_review_pub_date_idx',
+        )
+
+    def test_04_genre_title_joins(self):
+        assert_no_table_scan(
+            Title.objects.filter(genre__slug='drama'),
+            'genretitle_genre_title_idx',
+        )
+        assert_no_table_scan(
+            Genre.objects.filter(genretitle__title_id__in=(1, 2))
+        )
+
+    def test_05_genre_title_unique(self):
+        title = Title.objects.create(name='Терминатор', year=1984)
+        genre = Genre.objects.create(name='Драма', slug='drama')
+        GenreTitle.objects.create(title=title, genre=genre)
+        with pytest.raises(IntegrityError):
+            GenreTitle.objects.create(title=title, genre=genre)
@@ -0,0 +1,49 @@
+from http import HTTPStatus
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from reviews.models import Comment, Review, Title
+
+
+def create_reviews(django_user_model, start, stop):
+    title = Title.objects.create(name='Терминатор', year=1984)
+    for index in range(start, stop):
+        author = django_user_model.objects.create_user(
+            username=f'author{index}', email=f'author{index}@yamdb.fake'
+        )
+        review = Review.objects.create(
+            text='review', score=5, author=author, title=title
+        )
+        Comment.objects.create(text='comment', author=author, review=review)
+
+
+@pytest.mark.django_db(transaction=True)
+class Test14Admin:
+
+    @pytest.mark.parametrize('url', (
+        '/admin/reviews/review/',
+        '/admin/reviews/comment/',
+    ))
+    def test_01_changelist_queries(self, client, django_user_model, url):
+        client.force_login(django_user_model.objects.create_superuser(
+            username='TestStaff', email='teststaff@yamdb.fake', role='admin'
+        ))
+        create_reviews(django_user_model, 0, 2)
+        with CaptureQueriesContext(connection) as small:
+            response = client.get(url)
+        assert response.status_code == HTTPStatus.OK
+
+        create_reviews(django_user_model, 2, 10)
+        with CaptureQueriesContext(connection) as large:
+            response = client.get(url)
+        assert response.status_code == HTTPStatus.OK
+        assert len(large) == len(small), (
+            f'Проверьте, что количество запросов страницы `{url}` не '
+            'зависит от количества строк.'
+        )
+
+        response = client.get(url, {'q': 'author3'})
+        assert response.status_code == HTTPStatus.OK
+        assert response.context['cl'].result_count == 1
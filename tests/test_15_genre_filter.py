@@ -0,0 +1,21 @@
+import pytest
+
+from reviews.models import Genre, Title
+
+
+@pytest.mark.django_db(transaction=True)
+class Test15GenreFilter:
+
+    def test_01_genre_filter_exact(self, client):
+        title = Title.objects.create(name='Терминатор', year=1984)
+        title.genre.add(
+            Genre.objects.create(name='Драма', slug='drama'),
+            Genre.objects.create(name='Комедия', slug='comedy'),
+        )
+        Genre.objects.create(name='Драма 2', slug='Drama')
+        response = client.get('/api/v1/titles/', {'genre': 'drama'})
+        assert response.json()['count'] == 1
+        response = client.get('/api/v1/titles/', {'genre': 'Drama'})
+        assert response.json()['count'] == 0, (
+            'Проверьте, что фильтр по жанру учитывает регистр slug.'
+        )
@@ -0,0 +1,51 @@
+from http import HTTPStatus
+
+import pytest
+
+from tests.utils import create_titles
+
+
+@pytest.mark.django_db(transaction=True)
+class Test16Facets:
+    url = '/api/v1/titles/'
+
+    def test_01_facets(self, client, admin_client):
+        titles, categories, genres = create_titles(admin_client)
+        response = client.get(self.url, {'facets': 'genre,category,year'})
+        assert response.status_code == HTTPStatus.OK
+        facets = response.json()['facets']
+        assert facets['year'] == [
+            {'value': 1984, 'count': 1}, {'value': 1988, 'count': 1}
+        ], (
+            f'Проверьте, что `{self.url}?facets=year` возвращает количество '
+            'произведений по годам.'
+        )
+        assert {item['value'] for item in facets['genre']} == {
+            genre['slug'] for genre in genres
+        }
+        assert {item['value'] for item in facets['category']} == {
+            category['slug'] for category in categories
+        }
+
+        response = client.get(
+            self.url, {'facets': 'genre', 'category': categories[1]['slug']}
+        )
+        assert response.json()['facets'] == {
+            'genre': [{'value': genres[2]['slug'], 'count': 1}]
+        }, (
+            'Проверьте, что фасеты считаются по отфильтрованному списку.'
+        )
+
+    def test_02_facets_cache_invalidation(self, client, admin_client):
+        titles, _, _ = create_titles(admin_client)
+        params = {'facets': 'year'}
+        assert len(client.get(self.url, params).json()['facets']['year']) == 2
+        admin_client.delete(f'{self.url}{titles[0]["id"]}/')
+        assert client.get(self.url, params).json()['facets']['year'] == [
+            {'value': 1988, 'count': 1}
+        ], 'Проверьте, что кеш фасетов сбрасывается при изменении каталога.'
+
+    def test_03_invalid_facets(self, client):
+        response = client.get(self.url, {'facets': 'name'})
+        assert response.status_code == HTTPStatus.BAD_REQUEST
+        assert 'facets' not in client.get(self.url).json()
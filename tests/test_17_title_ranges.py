@@ -0,0 +1,62 @@
+import pytest
+from django.core.management import call_command
+from django.db import connection
+
+from reviews.models import Title
+from tests.utils import create_single_review, create_titles
+
+
+@pytest.mark.django_db(transaction=True)
+class Test17TitleRanges:
+    url = '/api/v1/titles/'
+
+    def get_ids(self, client, params):
+        return [item['id'] for item in client.get(self.url, params).json()[
+            'results'
+        ]]
+
+    def test_01_year_range(self, client, admin_client):
+        titles, _, _ = create_titles(admin_client)
+        assert self.get_ids(client, {'year_min': 1985}) == [titles[1]['id']]
+        assert self.get_ids(client, {'year_max': 1985}) == [titles[0]['id']]
+        assert self.get_ids(
+            client, {'year_min': 1980, 'year_max': 1990}
+        ) == [titles[0]['id'], titles[1]['id']], (
+            f'Проверьте, что `{self.url}` фильтрует по диапазону лет.'
+        )
+
+    def test_02_rating_range_and_ordering(self, client, admin_client,
+                                          user_client):
+        titles, _, _ = create_titles(admin_client)
+        create_single_review(admin_client, titles[0]['id'], 'text', 9)
+        create_single_review(user_client, titles[0]['id'], 'text', 6)
+        create_single_review(admin_client, titles[1]['id'], 'text', 4)
+
+        response = client.get(f'{self.url}{titles[0]["id"]}/')
+        assert response.json()['rating'] == 7
+
+        assert self.get_ids(client, {'rating_min': 7}) == [titles[0]['id']]
+        assert self.get_ids(client, {'rating_max': 5}) == [titles[1]['id']]
+        assert self.get_ids(client, {'ordering': '-rating'}) == [
+            titles[0]['id'], titles[1]['id']
+        ]
+        assert self.get_ids(client, {'ordering': 'rating'}) == [
+            titles[1]['id'], titles[0]['id']
+        ], f'Проверьте, что `{self.url}` поддерживает сортировку по рейтингу.'
+
+    def test_03_reconcile_rating(self, admin_client):
+        titles, _, _ = create_titles(admin_client)
+        create_single_review(admin_client, titles[0]['id'], 'text', 8)
+        Title.objects.update(rating=1)
+        call_command('reconcile_counters')
+        assert Title.objects.get(pk=titles[0]['id']).rating == 8
+        assert Title.objects.get(pk=titles[1]['id']).rating is None
+
+    @pytest.mark.skipif(connection.vendor != 'sqlite',
+                        reason='Проверка плана запроса для SQLite.')
+    def test_04_range_uses_index(self):
+        for queryset in (
+            Title.objects.filter(year__gte=2000, year__lte=2010),
+            Title.objects.filter(rating__gte=8),
+        ):
+            assert 'USING INDEX' in queryset.explain()
@@ -0,0 +1,46 @@
+from http import HTTPStatus
+
+import pytest
+
+from tests.utils import create_single_review, create_titles
+
+
+@pytest.mark.django_db(transaction=True)
+class Test18UserReviews:
+
+    def test_01_user_reviews(self, client, admin_client, admin,
+                             django_assert_num_queries):
+        titles, _, _ = create_titles(admin_client)
+        for title in titles:
+            create_single_review(admin_client, title['id'], 'text', 5)
+
+        url = f'/api/v1/users/{admin.username}/reviews/'
+        with django_assert_num_queries(3):
+            response = client.get(url)
+        assert response.status_code == HTTPStatus.OK, (
+            f'Проверьте, что GET-запрос к `{url}` возвращает ответ со '
+            'статусом 200.'
+        )
+        results = response.json()['results']
+        assert [review['title'] for review in results] == [
+            {'id': title['id'], 'name': title['name'], 'year': title['year']}
+            for title in reversed(titles)
+        ], (
+            f'Проверьте, что `{url}` возвращает отзывы пользователя от новых '
+            'к старым с кратким описанием произведения.'
+        )
+
+        response = client.get('/api/v1/users/unknown/reviews/')
+        assert response.status_code == HTTPStatus.NOT_FOUND
+
+    def test_02_me_reviews(self, client, admin_client, user_client):
+        titles, _, _ = create_titles(admin_client)
+        create_single_review(admin_client, titles[0]['id'], 'text', 5)
+        create_single_review(user_client, titles[1]['id'], 'text', 5)
+
+        url = '/api/v1/users/me/reviews/'
+        assert client.get(url).status_code == HTTPStatus.UNAUTHORIZED
+        results = user_client.get(url).json()['results']
+        assert [review['title']['id'] for review in results] == [
+            titles[1]['id']
+        ], f'Проверьте, что `{url}` возвращает только свои отзывы.'
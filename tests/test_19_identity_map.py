@@ -0,0 +1,93 @@
+from collections import Counter
+from http import HTTPStatus
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from tests.utils import create_single_review, create_titles
+
+
+def assert_no_repeated_selects(request, url, expected_status):
+    with CaptureQueriesContext(connection) as context:
+        response = request()
+    assert response.status_code == expected_status, (
+        f'Проверьте, что запрос к `{url}` возвращает ответ со статусом '
+        f'{expected_status}.'
+    )
+    repeated = [
+        sql for sql, count in Counter(
+            query['sql'] for query in context.captured_queries
+            if query['sql'].startswith('SELECT')
+        ).items()
+        if count > 1
+    ]
+    assert not repeated, (
+        f'Проверьте, что запрос к `{url}` не загружает одну и ту же запись '
+        f'повторно:\n' + '\n'.join(repeated)
+    )
+    return response
+
+
+@pytest.mark.django_db(transaction=True)
+class Test19IdentityMap:
+
+    @pytest.fixture
+    def titles(self, admin_client):
+        titles, _, _ = create_titles(admin_client)
+        return titles
+
+    @pytest.fixture
+    def title_id(self, titles):
+        return titles[0]['id']
+
+    def test_01_review_requests(self, user_client, title_id):
+        url = f'/api/v1/titles/{title_id}/reviews/'
+        review = assert_no_repeated_selects(
+            lambda: user_client.post(url, data={'text': 'text', 'score': 5}),
+            url,
+            HTTPStatus.CREATED,
+        ).json()
+
+        detail_url = f'{url}{review["id"]}/'
+        response = assert_no_repeated_selects(
+            lambda: user_client.get(detail_url), detail_url, HTTPStatus.OK
+        )
+        assert response.json()['author'] == 'TestUser'
+        response = assert_no_repeated_selects(
+            lambda: user_client.patch(detail_url, data={'score': 7}),
+            detail_url,
+            HTTPStatus.OK,
+        )
+        assert response.json()['score'] == 7
+
+    def test_02_comment_requests(self, user_client, title_id):
+        review_id = create_single_review(
+            user_client, title_id, 'text', 5
+        ).json()['id']
+        url = f'/api/v1/titles/{title_id}/reviews/{review_id}/comments/'
+        comment = assert_no_repeated_selects(
+            lambda: user_client.post(url, data={'text': 'text'}),
+            url,
+            HTTPStatus.CREATED,
+        ).json()
+
+        detail_url = f'{url}{comment["id"]}/'
+        response = assert_no_repeated_selects(
+            lambda: user_client.get(detail_url), detail_url, HTTPStatus.OK
+        )
+        assert response.json()['author'] == 'TestUser'
+        assert_no_repeated_selects(
+            lambda: user_client.patch(detail_url, data={'text': 'new'}),
+            detail_url,
+            HTTPStatus.OK,
+        )
+
+    def test_03_comment_on_other_title(self, user_client, titles,
+                                       title_id):
+        review_id = create_single_review(
+            user_client, title_id, 'text', 5
+        ).json()['id']
+        other_id = titles[1]['id']
+        url = f'/api/v1/titles/{other_id}/reviews/{review_id}/comments/'
+        assert user_client.get(url).status_code == HTTPStatus.NOT_FOUND
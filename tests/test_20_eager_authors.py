@@ -0,0 +1,82 @@
+from http import HTTPStatus
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from reviews.models import Comment, Review, Title
+
+
+def count_queries(client, url, expected_count):
+    with CaptureQueriesContext(connection) as context:
+        response = client.get(url)
+    assert response.status_code == HTTPStatus.OK, (
+        f'Проверьте, что GET-запрос к `{url}` возвращает ответ со '
+        'статусом 200.'
+    )
+    results = response.json()['results']
+    assert len(results) == expected_count
+    assert all(item['author'] for item in results), (
+        f'Проверьте, что `{url}` возвращает автора каждой записи.'
+    )
+    return len(context.captured_queries)
+
+
+@pytest.mark.django_db(transaction=True)
+class Test20EagerAuthors:
+
+    @pytest.fixture
+    def authors(self, django_user_model):
+        return [
+            django_user_model.objects.create_user(
+                username=f'author{index}',
+                email=f'author{index}@yamdb.fake',
+            )
+            for index in range(5)
+        ]
+
+    def test_01_reviews_list(self, client, authors):
+        small = Title.objects.create(name='Мало отзывов', year=2000)
+        large = Title.objects.create(name='Много отзывов', year=2000)
+        for author in authors[:2]:
+            Review.objects.create(
+                title=small, author=author, text='text', score=5
+            )
+        for author in authors:
+            Review.objects.create(
+                title=large, author=author, text='text', score=5
+            )
+
+        small_queries = count_queries(
+            client, f'/api/v1/titles/{small.id}/reviews/', 2
+        )
+        large_queries = count_queries(
+            client, f'/api/v1/titles/{large.id}/reviews/', len(authors)
+        )
+        assert small_queries == large_queries, (
+            'Проверьте, что количество запросов к списку отзывов не зависит '
+            'от количества отзывов на странице.'
+        )
+
+    def test_02_comments_list(self, client, authors):
+        title = Title.objects.create(name='Терминатор', year=1984)
+        small = Review.objects.create(
+            title=title, author=authors[0], text='text', score=5
+        )
+        large = Review.objects.create(
+            title=title, author=authors[1], text='text', score=5
+        )
+        for author in authors[:2]:
+            Comment.objects.create(review=small, author=author, text='text')
+        for author in authors:
+            Comment.objects.create(review=large, author=author, text='text')
+
+        url = f'/api/v1/titles/{title.id}/reviews/{{}}/comments/'
+        small_queries = count_queries(client, url.format(small.id), 2)
+        large_queries = count_queries(
+            client, url.format(large.id), len(authors)
+        )
+        assert small_queries == large_queries, (
+            'Проверьте, что количество запросов к списку комментариев '
+            'не зависит от количества комментариев на странице.'
+        )
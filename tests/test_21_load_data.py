@@ -0,0 +1,181 @@
+import csv
+import shutil
+from datetime import datetime, timezone
+
+import pytest
+from django.conf import settings
+from django.core.management import CommandError, call_command
+
+from reviews.importer import IdSet
+from reviews.models import Comment, GenreTitle, Review, Title, User
+
+DATA_DIR = settings.BASE_DIR / 'static' / 'data'
+
+
+def count_rows(filename):
+    with open(DATA_DIR / filename, encoding='utf-8') as csv_file:
+        return sum(1 for _ in csv.DictReader(csv_file))
+
+
+def append_rows(path, filename, rows):
+    with open(path / filename, 'a', encoding='utf-8', newline='') as file:
+        file.write('\n')
+        csv.writer(file, lineterminator='\n').writerows(rows)
+
+
+@pytest.mark.django_db(transaction=True)
+class Test21LoadData:
+
+    @pytest.fixture
+    def data_dir(self, tmp_path):
+        shutil.copytree(DATA_DIR, tmp_path, dirs_exist_ok=True)
+        return tmp_path
+
+    def test_01_load_is_idempotent(self):
+        call_command('load_data', workers=2)
+        call_command('load_data', workers=2)
+        for model, filename in (
+            (User, 'users.csv'),
+            (Title, 'titles.csv'),
+            (GenreTitle, 'genre_title.csv'),
+            (Review, 'review.csv'),
+            (Comment, 'comments.csv'),
+        ):
+            assert model.objects.count() == count_rows(filename), (
+                'Проверьте, что повторный запуск `load_data` не создаёт '
+                f'дубликаты записей `{model.__name__}`.'
+            )
+
+    def test_02_stats_and_dates(self):
+        call_command('load_data', workers=1)
+        review = Review.objects.get(pk=1)
+        assert review.pub_date == datetime(
+            2019, 9, 24, 21, 8, 21, 567000, tzinfo=timezone.utc
+        ), 'Проверьте, что `load_data` сохраняет дату публикации из файла.'
+        title = Title.objects.get(pk=review.title_id)
+        assert title.reviews_count == title.reviews.count(), (
+            'Проверьте, что `load_data` пересчитывает счётчики отзывов.'
+        )
+        assert title.genre.exists(), (
+            'Проверьте, что `load_data` загружает жанры произведений.'
+        )
+
+    def test_03_only_and_skip(self):
+        call_command('load_data', workers=1, skip=('comments',))
+        assert not Comment.objects.exists(), (
+            'Проверьте, что `load_data --skip` пропускает этап.'
+        )
+        call_command('load_data', workers=1, only=('comments',))
+        assert Comment.objects.count() == count_rows('comments.csv'), (
+            'Проверьте, что `load_data --only` загружает выбранный этап.'
+        )
+
+    def test_04_dry_run(self):
+        call_command('load_data', workers=1, dry_run=True)
+        assert not User.objects.exists(), (
+            'Проверьте, что `load_data --dry-run` не изменяет базу данных.'
+        )
+
+    def test_05_invalid_rows(self, data_dir, caplog):
+        append_rows(data_dir, 'review.csv', (
+            (1000, 1, 'text', 999, 5, '2020-01-01T00:00:00Z'),
+            (1001, 2, 'text', 100, 11, '2020-01-01T00:00:00Z'),
+        ))
+        append_rows(data_dir, 'comments.csv', (
+            (1, 1, 'text', 100, '2020-01-01T00:00:00Z'),
+        ))
+        with pytest.raises(CommandError):
+            call_command('load_data', workers=1, path=str(data_dir))
+        errors = [
+            record.getMessage() for record in caplog.records
+            if record.levelname == 'ERROR'
+        ]
+        assert any(
+            error.startswith('review.csv:') and 'author=999' in error
+            for error in errors
+        ), 'Проверьте, что `load_data` сообщает о ссылке на автора.'
+        assert any(
+            error.startswith('review.csv:') and 'score' in error
+            for error in errors
+        ), 'Проверьте, что `load_data` проверяет оценку отзыва.'
+        assert any(
+            error.startswith('comments.csv:') and 'id: 1' in error
+            for error in errors
+        ), 'Проверьте, что `load_data` сообщает о повторяющемся id.'
+        assert not Title.objects.exists(), (
+            'Проверьте, что `load_data` не загружает данные при ошибках.'
+        )
+
+    def test_06_references_to_loaded_rows(self, data_dir):
+        call_command('load_data', workers=1, skip=('comments',))
+        append_rows(data_dir, 'comments.csv', (
+            (1000, 1, 'text', 100, '2020-01-01T00:00:00Z'),
+        ))
+        call_command(
+            'load_data', workers=1, path=str(data_dir), only=('comments',)
+        )
+        assert Comment.objects.filter(pk=1000).exists(), (
+            'Проверьте, что `load_data` проверяет ссылки на записи, '
+            'загруженные ранее.'
+        )
+
+    def test_07_staff_from_role(self, django_user_model):
+        call_command('load_data', workers=1, only=('users',))
+        staff = dict(django_user_model.objects.values_list(
+            'username', 'is_staff'
+        ))
+        assert staff['capt_obvious'] and staff['angry'], (
+            'Проверьте, что `load_data` выставляет is_staff администраторам '
+            'и модераторам.'
+        )
+        assert not staff['bingobongo']
+        User.objects.filter(username='bingobongo').update(
+            is_superuser=True, is_staff=True
+        )
+        call_command('load_data', workers=1, only=('users',))
+        assert User.objects.get(username='bingobongo').is_staff, (
+            'Проверьте, что `load_data` не снимает is_staff '
+            'с суперпользователей.'
+        )
+
+    def test_08_sparse_ids(self, data_dir):
+        ids = IdSet((1, 2 ** 16, 4000000000))
+        assert all(pk in ids for pk in (1, 2 ** 16, 4000000000))
+        assert not any(pk in ids for pk in (0, 2, 4000000001, 2 ** 40))
+        assert sum(len(chunk) for chunk in ids.chunks.values()) < 2 ** 16, (
+            'Проверьте, что память множества id не зависит от '
+            'величины id.'
+        )
+        append_rows(data_dir, 'users.csv', (
+            (4000000000, 'far', 'far@yamdb.fake', 'user', '', '', ''),
+        ))
+        call_command(
+            'load_data', workers=1, path=str(data_dir), only=('users',)
+        )
+        assert User.objects.filter(pk=4000000000).exists()
+
+    def test_09_unique_values_in_database(
+        self, data_dir, caplog, django_user_model
+    ):
+        django_user_model.objects.create(
+            username='taken', email='taken@yamdb.fake'
+        )
+        append_rows(data_dir, 'users.csv', (
+            (5000, 'taken', 'other@yamdb.fake', 'user', '', '', ''),
+        ))
+        with pytest.raises(CommandError):
+            call_command(
+                'load_data', workers=1, path=str(data_dir), only=('users',)
+            )
+        errors = [
+            record.getMessage() for record in caplog.records
+            if record.levelname == 'ERROR'
+        ]
+        assert any(
+            error.startswith('users.csv:') and 'username=taken' in error
+            for error in errors
+        ), (
+            'Проверьте, что `load_data` сверяет уникальные значения '
+            'с записями в базе данных.'
+        )
+        assert not User.objects.filter(pk=5000).exists()
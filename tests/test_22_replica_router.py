@@ -0,0 +1,155 @@
+import sqlite3
+from contextlib import contextmanager
+
+import pytest
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import DEFAULT_DB_ALIAS, connections, router
+from django.http import HttpResponse
+from django.test import RequestFactory
+
+from api_yamdb.routers import PIN_COOKIE_NAME, ReplicaRoutingMiddleware
+from reviews.models import Title
+
+
+def route(request):
+    response = HttpResponse()
+    response.db_alias = router.db_for_read(Title)
+    return response
+
+
+@contextmanager
+def sqlite_files(tmp_path):
+    """Переносит тестовую БД в файл основной БД и файл реплики."""
+    default = connections[DEFAULT_DB_ALIAS]
+    default.ensure_connection()
+    primary = sqlite3.connect(tmp_path / 'primary.sqlite3')
+    default.connection.backup(primary)
+    primary.close()
+    memory = default.connection, default.settings_dict['NAME']
+    default.connection = None
+    default.settings_dict['NAME'] = str(tmp_path / 'primary.sqlite3')
+    replica = tmp_path / 'replica.sqlite3'
+    connections.databases['replica_0'] = {
+        **default.settings_dict, 'NAME': str(replica)
+    }
+    try:
+        call_command('replicate_sqlite', once=True, target=[str(replica)])
+        yield replica
+    finally:
+        connections['replica_0'].close()
+        del connections['replica_0']
+        del connections.databases['replica_0']
+        default.close()
+        default.connection, default.settings_dict['NAME'] = memory
+
+
+def count_categories(path, slug):
+    replica = sqlite3.connect(path)
+    try:
+        return replica.execute(
+            'SELECT COUNT(*) FROM reviews_category WHERE slug = ?', (slug,)
+        ).fetchone()[0]
+    finally:
+        replica.close()
+
+
+class Test22ReplicaRouter:
+
+    @pytest.fixture(autouse=True)
+    def replicas(self, settings):
+        settings.REPLICA_DATABASES = ('replica_0',)
+        settings.REPLICA_PIN_SECONDS = 5
+
+    def request(self, method, cookies=None):
+        factory = RequestFactory()
+        for name, value in (cookies or {}).items():
+            factory.cookies[name] = value
+        middleware = ReplicaRoutingMiddleware(route)
+        return middleware(getattr(factory, method)('/api/v1/titles/'))
+
+    def test_01_reads_and_writes(self):
+        assert self.request('get').db_alias == 'replica_0', (
+            'Проверьте, что GET-запрос читает данные из реплики.'
+        )
+        assert self.request('post').db_alias == 'default', (
+            'Проверьте, что POST-запрос работает с основной БД.'
+        )
+        assert router.db_for_read(Title) == 'default', (
+            'Проверьте, что вне запроса чтение идёт из основной БД.'
+        )
+        assert router.db_for_write(Title) == 'default'
+
+    def test_02_read_after_write(self):
+        cookies = {
+            name: morsel.value
+            for name, morsel in self.request('patch').cookies.items()
+        }
+        assert self.request('get', cookies).db_alias == 'default', (
+            'Проверьте, что после записи клиент читает из основной БД.'
+        )
+        assert self.request('get').db_alias == 'replica_0', (
+            'Проверьте, что запись одного клиента не закрепляет '
+            'за основной БД других клиентов.'
+        )
+        forged = {PIN_COOKIE_NAME: '1'}
+        assert self.request('get', forged).db_alias == 'replica_0', (
+            'Проверьте, что закрепление за основной БД подписывается.'
+        )
+
+    def test_03_one_replica_per_request(self, settings):
+        settings.REPLICA_DATABASES = tuple(
+            f'replica_{index}' for index in range(5)
+        )
+
+        def route_many(request):
+            response = HttpResponse()
+            response.aliases = {router.db_for_read(Title) for _ in range(20)}
+            return response
+
+        middleware = ReplicaRoutingMiddleware(route_many)
+        for _ in range(10):
+            aliases = middleware(RequestFactory().get('/')).aliases
+            assert len(aliases) == 1, (
+                'Проверьте, что все чтения одного запроса идут в одну '
+                'реплику.'
+            )
+
+    def test_04_without_replicas(self, settings):
+        settings.REPLICA_DATABASES = ()
+        assert self.request('get').db_alias == 'default', (
+            'Проверьте, что без реплик чтение идёт из основной БД.'
+        )
+
+    @pytest.mark.django_db(transaction=True)
+    def test_05_sqlite_files(self, settings, tmp_path, client, admin_client,
+                             user_client):
+        settings.CATALOG_CACHE_ENABLED = True
+        url = '/api/v1/categories/'
+        with sqlite_files(tmp_path) as replica:
+            admin_client.post(url, data={'name': 'Игра', 'slug': 'game'})
+            # Закрепление не должно зависеть от кеша процесса.
+            cache.clear()
+            slugs = [
+                category['slug']
+                for category in admin_client.get(url).json()['results']
+            ]
+            assert 'game' in slugs, (
+                'Проверьте, что после записи клиент читает из основной БД.'
+            )
+            assert count_categories(replica, 'game') == 0
+            slugs = [
+                category['slug']
+                for category in user_client.get(url).json()['results']
+            ]
+            assert 'game' not in slugs, (
+                'Проверьте, что другие клиенты читают из реплики.'
+            )
+            response = client.get(url)
+            assert response['X-Catalog-Cache'] == 'MISS'
+            assert 'game' in [
+                category['slug'] for category in response.json()['results']
+            ], (
+                'Проверьте, что ответ для кеша каталога читается '
+                'из основной БД.'
+            )
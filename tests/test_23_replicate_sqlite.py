@@ -0,0 +1,73 @@
+import re
+import sqlite3
+
+import pytest
+from django.core.management import CommandError, call_command
+from django.db import connection
+
+from reviews.models import Category
+
+pytestmark = pytest.mark.skipif(
+    connection.vendor != 'sqlite',
+    reason='Репликация рассчитана на SQLite.'
+)
+
+
+def count_categories(path):
+    replica = sqlite3.connect(path)
+    try:
+        return replica.execute(
+            'SELECT COUNT(*) FROM reviews_category'
+        ).fetchone()[0]
+    finally:
+        replica.close()
+
+
+@pytest.mark.django_db(transaction=True)
+class Test23ReplicateSqlite:
+
+    def test_01_replicate_once(self, tmp_path):
+        targets = [str(tmp_path / 'first.sqlite3'),
+                   str(tmp_path / 'second.sqlite3')]
+        Category.objects.create(name='Фильм', slug='movie')
+        call_command('replicate_sqlite', once=True, target=targets)
+        for target in targets:
+            assert count_categories(target) == 1, (
+                'Проверьте, что `replicate_sqlite` копирует данные '
+                'основной БД на реплики.'
+            )
+
+        Category.objects.create(name='Книга', slug='book')
+        call_command('replicate_sqlite', once=True, target=targets, pages=1)
+        assert count_categories(targets[0]) == 2, (
+            'Проверьте, что `replicate_sqlite` заменяет снимок реплики.'
+        )
+        assert sorted(path.name for path in tmp_path.iterdir()) == [
+            'first.sqlite3', 'second.sqlite3'
+        ], 'Проверьте, что `replicate_sqlite` удаляет временные файлы.'
+
+    def test_02_no_targets(self, settings):
+        settings.REPLICA_DATABASES = ()
+        with pytest.raises(CommandError):
+            call_command('replicate_sqlite', once=True)
+
+    def test_03_lag_from_snapshot_start(self, tmp_path, caplog):
+        target = str(tmp_path / 'replica.sqlite3')
+        call_command('replicate_sqlite', once=True, target=[target])
+        seconds = {
+            name: float(value)
+            for name, value in re.findall(
+                r'(снимок|копирование|отставание) ([\d.]+) с',
+                caplog.records[-1].getMessage(),
+            )
+        }
+        assert seconds.keys() == {'снимок', 'копирование', 'отставание'}, (
+            'Проверьте, что `replicate_sqlite` выводит время снимка, '
+            'копирования и отставание реплики.'
+        )
+        assert seconds['отставание'] >= (
+            seconds['снимок'] + seconds['копирование'] - 0.002
+        ), (
+            'Проверьте, что отставание считается от начала снимка '
+            'до замены файла реплики.'
+        )
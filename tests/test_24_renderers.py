@@ -0,0 +1,88 @@
+import io
+from datetime import datetime, timezone
+from decimal import Decimal
+from http import HTTPStatus
+
+import pytest
+from rest_framework.exceptions import ParseError
+from rest_framework.renderers import JSONRenderer
+
+from api.renderers import FastJSONParser, FastJSONRenderer, PreEncodedJSON
+
+DATA = {
+    'results': [
+        {
+            'id': 1,
+            'name': 'Терминатор ',
+            'rating': 7.5,
+            'score': Decimal('9.50'),
+            'pub_date': datetime(2020, 1, 1, tzinfo=timezone.utc).isoformat(),
+            'genre': [{'name': 'Драма', 'slug': 'drama'}],
+            'description': None,
+        },
+    ],
+    'count': 1,
+}
+
+
+class Test24Renderers:
+
+    def test_01_same_output_as_json_renderer(self):
+        assert FastJSONRenderer().render(DATA) == JSONRenderer().render(
+            DATA
+        ), (
+            'Проверьте, что `FastJSONRenderer` возвращает тот же JSON, '
+            'что и `JSONRenderer`.'
+        )
+        assert FastJSONRenderer().render(None) == b''
+
+    def test_02_pre_encoded_fragments(self):
+        fragment = PreEncodedJSON.encode({'genre': [{'value': 'drama'}]})
+        content = FastJSONRenderer().render(
+            {'count': 1, 'facets': fragment, 'other': fragment}
+        )
+        assert content == (
+            b'{"count":1,"facets":{"genre":[{"value":"drama"}]},'
+            b'"other":{"genre":[{"value":"drama"}]}}'
+        ), (
+            'Проверьте, что `FastJSONRenderer` вставляет закодированные '
+            'фрагменты без изменений.'
+        )
+        assert fragment.decode() == {'genre': [{'value': 'drama'}]}
+
+    def test_03_indent_only_in_debug(self, settings):
+        renderer = FastJSONRenderer()
+        context = {'indent': 4}
+        settings.DEBUG = False
+        assert b'\n' not in renderer.render(DATA, renderer_context=context), (
+            'Проверьте, что без DEBUG ответ не форматируется отступами.'
+        )
+        settings.DEBUG = True
+        assert b'\n' in renderer.render(DATA, renderer_context=context), (
+            'Проверьте, что в режиме DEBUG ответ форматируется отступами.'
+        )
+
+    def test_04_parser(self):
+        parser = FastJSONParser()
+        assert parser.parse(
+            io.BytesIO('{"text": "Отзыв", "score": 5}'.encode())
+        ) == {'text': 'Отзыв', 'score': 5}
+        for content in (b'{"score": NaN}', b'{"score": '):
+            with pytest.raises(ParseError):
+                parser.parse(io.BytesIO(content))
+
+    @pytest.mark.django_db(transaction=True)
+    def test_05_api_json(self, admin_client):
+        response = admin_client.post(
+            '/api/v1/categories/',
+            data={'name': 'Фильм', 'slug': 'movie'},
+            format='json',
+        )
+        assert response.status_code == HTTPStatus.CREATED, (
+            'Проверьте, что API принимает тело запроса в формате JSON.'
+        )
+        response = admin_client.get('/api/v1/categories/')
+        assert response['Content-Type'] == 'application/json'
+        assert response.json()['results'] == [
+            {'name': 'Фильм', 'slug': 'movie'}
+        ]
@@ -0,0 +1,110 @@
+from http import HTTPStatus
+
+import pytest
+
+from api.msgpack_codec import MessagePackError, packb, unpackb
+from api.renderers import msgpack_dumps, msgpack_loads
+from tests.utils import create_single_review, create_titles
+
+MESSAGEPACK = 'application/msgpack'
+
+
+class Test25MessagePackCodec:
+
+    @pytest.mark.parametrize('value, expected', (
+        (None, b'\xc0'),
+        (True, b'\xc3'),
+        (127, b'\x7f'),
+        (-32, b'\xe0'),
+        (255, b'\xcc\xff'),
+        (-129, b'\xd1\xff\x7f'),
+        (1.5, b'\xcb?\xf8\x00\x00\x00\x00\x00\x00'),
+        ('a', b'\xa1a'),
+        ('a' * 32, b'\xd9 ' + b'a' * 32),
+        ([1, 2], b'\x92\x01\x02'),
+        ({'a': 1}, b'\x81\xa1a\x01'),
+    ))
+    def test_01_known_encoding(self, value, expected):
+        assert packb(value) == expected, (
+            f'Проверьте, что `{value!r}` кодируется по спецификации '
+            'MessagePack.'
+        )
+        assert unpackb(expected) == value
+
+    def test_02_round_trip(self):
+        value = {
+            'count': 70000,
+            'results': [
+                {'id': -2 ** 40, 'text': 'Отзыв ' * 20000, 'score': None},
+                list(range(20)),
+                {str(index): index for index in range(20)},
+            ],
+            'bytes': b'\x00' * 300,
+        }
+        assert unpackb(packb(value)) == value
+        assert msgpack_loads(msgpack_dumps(value)) == value
+
+    def test_03_invalid_data(self):
+        for content in (b'\x92\x01', b'\xc1', b'\x01\x02', b'\xa2\xff\xfe'):
+            with pytest.raises(MessagePackError):
+                unpackb(content)
+        with pytest.raises(MessagePackError):
+            packb(object())
+        assert unpackb(b'\x91' * 64 + b'\xc0') is not None
+        for content in (b'\x91' * 65 + b'\xc0', b'\x81\x01' * 5000):
+            with pytest.raises(MessagePackError):
+                unpackb(content)
+
+
+@pytest.mark.django_db(transaction=True)
+class Test25MessagePackApi:
+
+    def test_01_same_schema_as_json(self, admin_client):
+        titles, _, _ = create_titles(admin_client)
+        create_single_review(admin_client, titles[0]['id'], 'text', 5)
+        for url in (
+            '/api/v1/titles/?facets=genre,year',
+            f'/api/v1/titles/{titles[0]["id"]}/',
+            f'/api/v1/titles/{titles[0]["id"]}/reviews/',
+        ):
+            response = admin_client.get(url, HTTP_ACCEPT=MESSAGEPACK)
+            assert response['Content-Type'] == MESSAGEPACK, (
+                f'Проверьте, что `{url}` отдаёт MessagePack, если он указан '
+                'в заголовке Accept.'
+            )
+            assert msgpack_loads(response.content) == (
+                admin_client.get(url).json()
+            ), (
+                f'Проверьте, что `{url}` возвращает в MessagePack те же '
+                'данные, что и в JSON.'
+            )
+
+    def test_02_messagepack_body(self, admin_client):
+        titles, _, _ = create_titles(admin_client)
+        url = f'/api/v1/titles/{titles[0]["id"]}/reviews/'
+        response = admin_client.post(
+            url,
+            data=msgpack_dumps({'text': 'Отзыв', 'score': 7}),
+            content_type=MESSAGEPACK,
+            HTTP_ACCEPT=MESSAGEPACK,
+        )
+        assert response.status_code == HTTPStatus.CREATED, (
+            f'Проверьте, что `{url}` принимает тело запроса в MessagePack.'
+        )
+        assert msgpack_loads(response.content)['score'] == 7
+
+        response = admin_client.post(
+            url, data=b'\xc1', content_type=MESSAGEPACK
+        )
+        assert response.status_code == HTTPStatus.BAD_REQUEST
+
+    def test_03_deeply_nested_body(self, client):
+        response = client.post(
+            '/api/v1/auth/signup/',
+            data=b'\x91' * 5000,
+            content_type=MESSAGEPACK,
+        )
+        assert response.status_code == HTTPStatus.BAD_REQUEST, (
+            'Проверьте, что слишком глубоко вложенное тело MessagePack '
+            'возвращает ответ со статусом 400.'
+        )
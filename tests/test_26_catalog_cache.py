@@ -0,0 +1,103 @@
+import gzip
+
+import pytest
+from django.core.cache import cache
+
+from reviews.models import Title
+from tests.utils import create_titles
+
+URL = '/api/v1/titles/'
+
+
+@pytest.mark.django_db(transaction=True)
+class Test26CatalogCache:
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self, settings):
+        settings.CATALOG_CACHE_ENABLED = True
+        cache.clear()
+
+    def test_01_cached_response(self, client, admin_client,
+                                django_assert_num_queries):
+        create_titles(admin_client)
+        first = client.get(URL)
+        assert first['X-Catalog-Cache'] == 'MISS'
+        with django_assert_num_queries(0):
+            second = client.get(URL)
+        assert second['X-Catalog-Cache'] == 'HIT', (
+            'Проверьте, что повторный запрос к каталогу отдаётся из кеша.'
+        )
+        assert second.content == first.content
+        assert second['Content-Type'] == 'application/json'
+        assert 'Accept-Encoding' in second['Vary']
+
+        admin_client.post(
+            '/api/v1/categories/', data={'name': 'Игра', 'slug': 'game'}
+        )
+        response = client.get('/api/v1/categories/')
+        assert response['X-Catalog-Cache'] == 'MISS', (
+            'Проверьте, что изменение каталога сбрасывает кеш ответов.'
+        )
+        assert 'game' in [
+            category['slug'] for category in response.json()['results']
+        ]
+
+    def test_02_gzip_variant(self, client, admin_client, settings):
+        settings.CATALOG_CACHE_GZIP_MIN_LENGTH = 100
+        create_titles(admin_client)
+        plain = client.get(URL)
+        for status in ('HIT', 'HIT'):
+            response = client.get(URL, HTTP_ACCEPT_ENCODING='gzip, br')
+            assert response['X-Catalog-Cache'] == status
+            assert response['Content-Encoding'] == 'gzip', (
+                'Проверьте, что при `Accept-Encoding: gzip` каталог '
+                'отдаётся сжатым.'
+            )
+            assert gzip.decompress(response.content) == plain.content
+            assert response['Content-Length'] == str(len(response.content))
+
+        settings.CATALOG_CACHE_GZIP_MIN_LENGTH = 10 ** 6
+        response = client.get(
+            '/api/v1/genres/', HTTP_ACCEPT_ENCODING='gzip'
+        )
+        response = client.get(
+            '/api/v1/genres/', HTTP_ACCEPT_ENCODING='gzip'
+        )
+        assert response['X-Catalog-Cache'] == 'HIT'
+        assert not response.has_header('Content-Encoding'), (
+            'Проверьте, что ответы меньше порога не сжимаются.'
+        )
+
+    def test_03_not_cached(self, client, admin_client):
+        titles, _, _ = create_titles(admin_client)
+        for _ in range(2):
+            response = admin_client.get(URL)
+        assert not response.has_header('X-Catalog-Cache'), (
+            'Проверьте, что запросы с токеном не кешируются.'
+        )
+        url = f'/api/v1/titles/{titles[0]["id"]}/reviews/'
+        client.get(url)
+        assert not client.get(url).has_header('X-Catalog-Cache')
+        client.get(URL, HTTP_ACCEPT='application/msgpack')
+        response = client.get(URL)
+        assert response['X-Catalog-Cache'] == 'MISS', (
+            'Проверьте, что ключ кеша учитывает заголовок Accept.'
+        )
+
+    def test_04_process_local_cache(self, client, admin_client, settings):
+        settings.CATALOG_CACHE_ENABLED = False
+        titles, _, _ = create_titles(admin_client)
+        client.get(URL, {'facets': 'year'})
+        # Изменение в другом воркере не меняет версию в кеше процесса.
+        Title.objects.filter(pk=titles[0]['id']).update(
+            name='Новое имя', year=2000
+        )
+        response = client.get(URL, {'facets': 'year'})
+        assert not response.has_header('X-Catalog-Cache'), (
+            'Проверьте, что без общего кеша ответы каталога не кешируются.'
+        )
+        data = response.json()
+        assert 'Новое имя' in [title['name'] for title in data['results']]
+        assert {'value': 2000, 'count': 1} in data['facets']['year'], (
+            'Проверьте, что без общего кеша фасеты не кешируются.'
+        )
@@ -0,0 +1,80 @@
+import pstats
+from http import HTTPStatus
+from io import StringIO
+
+import pytest
+from django.core.management import CommandError, call_command
+
+URL = '/api/v1/titles/'
+
+
+@pytest.mark.django_db(transaction=True)
+class Test27Profiling:
+
+    @pytest.fixture(autouse=True)
+    def profiling_dir(self, settings, tmp_path):
+        settings.PROFILING_DIR = tmp_path
+        settings.PROFILING_SAMPLE_RATE = 0
+        settings.PROFILING_MAX_FILES = 3
+        return tmp_path
+
+    def test_01_admin_header(self, client, admin_client, user_client,
+                             profiling_dir):
+        assert not client.get(URL).has_header('X-Profile')
+        assert not user_client.get(
+            URL, HTTP_X_PROFILE='1'
+        ).has_header('X-Profile'), (
+            'Проверьте, что профиль по заголовку доступен только '
+            'администратору.'
+        )
+        response = admin_client.get(URL, HTTP_X_PROFILE='1')
+        assert response.status_code == HTTPStatus.OK
+        profile = response['X-Profile']
+        assert profile.startswith('titles-list/'), (
+            'Проверьте, что профиль сохраняется в каталог имени url.'
+        )
+        stats = pstats.Stats(str(profiling_dir / profile))
+        assert stats.total_calls > 0
+
+    def test_02_sample_rate_and_retention(self, client, settings,
+                                          profiling_dir):
+        settings.PROFILING_SAMPLE_RATE = 1
+        for _ in range(5):
+            assert client.get(URL).has_header('X-Profile')
+        assert len(list((profiling_dir / 'titles-list').iterdir())) == 3, (
+            'Проверьте, что для url хранится не больше '
+            '`PROFILING_MAX_FILES` профилей.'
+        )
+
+    def test_03_download(self, client, admin_client, user_client):
+        profile = admin_client.get(URL, HTTP_X_PROFILE='1')['X-Profile']
+        url_name, name = profile.split('/')
+        response = admin_client.get('/api/v1/profiles/')
+        assert response.json() == {url_name: [name]}
+        url = f'/api/v1/profiles/{profile}'
+        assert user_client.get(url).status_code == HTTPStatus.FORBIDDEN
+        assert client.get(url).status_code == HTTPStatus.UNAUTHORIZED
+        response = admin_client.get(url)
+        assert response.status_code == HTTPStatus.OK, (
+            'Проверьте, что администратор может скачать профиль.'
+        )
+        assert b''.join(response.streaming_content)
+        for url in (
+            '/api/v1/profiles/titles-list/missing.prof',
+            '/api/v1/profiles/../secret.prof',
+        ):
+            assert admin_client.get(url).status_code == HTTPStatus.NOT_FOUND
+
+    def test_04_profile_stats(self, admin_client):
+        with pytest.raises(CommandError):
+            call_command('profile_stats')
+        for _ in range(2):
+            admin_client.get(URL, HTTP_X_PROFILE='1')
+        output = StringIO()
+        call_command(
+            'profile_stats', url_name=['titles-list'], limit=5, stdout=output
+        )
+        assert 'Профилей: 2' in output.getvalue(), (
+            'Проверьте, что `profile_stats` объединяет профили url.'
+        )
+        assert 'cumulative' in output.getvalue()
@@ -0,0 +1,120 @@
+import json
+from http import HTTPStatus
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.test import AsyncClient
+from django.urls import path
+
+from api.async_views import async_read_view
+from api.slow_queries import normalize_sql, slow_queries
+from api.views import TitleViewSet
+from tests.utils import create_titles
+
+URL = '/api/v1/slow-queries/'
+
+# URLconf теста под ASGI: список произведений выполняется в пуле потоков.
+urlpatterns = [
+    path(
+        'api/v1/titles/',
+        async_read_view(TitleViewSet.as_view({'get': 'list'})),
+        name='titles-list',
+    ),
+]
+
+
+def asgi_get(url):
+    async def get():
+        return await AsyncClient().get(url)
+
+    return async_to_sync(get)()
+
+
+@pytest.mark.django_db(transaction=True)
+class Test28SlowQueries:
+
+    @pytest.fixture(autouse=True)
+    def log_file(self, settings, tmp_path):
+        settings.SLOW_QUERY_THRESHOLD_MS = 0
+        settings.SLOW_QUERY_LOG_FILE = tmp_path / 'slow.log'
+        slow_queries.clear()
+        yield settings.SLOW_QUERY_LOG_FILE
+        slow_queries.clear()
+
+    def test_01_normalize_sql(self):
+        sql = normalize_sql(
+            "SELECT * FROM t WHERE name = 'a''b' AND id IN (%s, %s, %s)\n"
+            'LIMIT 21'
+        )
+        assert sql == 'SELECT * FROM t WHERE name = ? AND id IN (...) LIMIT ?'
+
+    def test_02_call_site(self, admin_client, log_file):
+        titles, _, _ = create_titles(admin_client)
+        slow_queries.clear()
+        response = admin_client.post(
+            f'/api/v1/titles/{titles[0]["id"]}/reviews/',
+            data={'text': 'Отзыв', 'score': 5},
+        )
+        assert response.status_code == HTTPStatus.CREATED
+        entries = [
+            entry for entry in admin_client.get(URL).json()
+            if entry['method'] == 'POST'
+        ]
+        assert entries and all(
+            entry['url_name'] == 'reviews-list' for entry in entries
+        )
+        call_sites = [entry['call_site'] or '' for entry in entries]
+        assert any(
+            'api.serializers.ReviewSerializer.validate' in call_site
+            for call_site in call_sites
+        ), (
+            'Проверьте, что для запроса указывается место вызова '
+            'в коде проекта.'
+        )
+        assert all('%s' not in entry['sql'] for entry in entries)
+        lines = log_file.read_text(encoding='utf-8').splitlines()
+        assert len(lines) >= len(entries), (
+            'Проверьте, что медленные запросы записываются в лог-файл.'
+        )
+        assert json.loads(lines[0])['method'] == 'POST'
+
+    def test_03_threshold(self, client, settings):
+        settings.SLOW_QUERY_THRESHOLD_MS = 10 ** 6
+        client.get('/api/v1/titles/')
+        assert not slow_queries, (
+            'Проверьте, что быстрые запросы не записываются.'
+        )
+
+    def test_04_admin_only(self, client, user_client, admin_client):
+        assert client.get(URL).status_code == HTTPStatus.UNAUTHORIZED
+        assert user_client.get(URL).status_code == HTTPStatus.FORBIDDEN
+        response = admin_client.get(URL, {'limit': 1})
+        assert response.status_code == HTTPStatus.OK
+        assert len(response.json()) == 1
+        response = admin_client.get(URL, {'limit': 0})
+        assert response.status_code == HTTPStatus.BAD_REQUEST
+
+    def test_05_asgi_thread_pool(self, settings, admin_client):
+        create_titles(admin_client)
+        settings.ROOT_URLCONF = __name__
+        slow_queries.clear()
+        response = asgi_get('/api/v1/titles/')
+        assert response.status_code == HTTPStatus.OK
+        assert any(
+            entry['url_name'] == 'titles-list' for entry in slow_queries
+        ), (
+            'Проверьте, что под ASGI записываются SQL-запросы view, '
+            'выполненных в пуле потоков.'
+        )
+
+    def test_06_streaming_response(self, admin_client):
+        create_titles(admin_client)
+        response = admin_client.get('/api/v1/export/titles.csv')
+        slow_queries.clear()
+        b''.join(response.streaming_content)
+        assert any(
+            entry['url_name'] == 'export' for entry in slow_queries
+        ), (
+            'Проверьте, что записываются SQL-запросы, выполненные при '
+            'чтении потокового ответа.'
+        )
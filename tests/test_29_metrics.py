@@ -0,0 +1,166 @@
+import json
+import os
+import re
+from http import HTTPStatus
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.core.cache import cache
+from django.test import AsyncClient
+from django.urls import path
+
+from api.async_views import async_read_view
+from api.metrics import make_key, store
+from api.views import TitleViewSet
+from tests.utils import create_titles
+
+URL = '/metrics'
+
+# URLconf теста под ASGI: список произведений выполняется в пуле потоков.
+urlpatterns = [
+    path(
+        'api/v1/titles/',
+        async_read_view(TitleViewSet.as_view({'get': 'list'})),
+        name='titles-list',
+    ),
+]
+
+
+def asgi_get(url):
+    async def get():
+        return await AsyncClient().get(url)
+
+    return async_to_sync(get)()
+
+
+def get_value(content, sample):
+    match = re.search(rf'^{re.escape(sample)} (\S+)$', content, re.M)
+    assert match, f'Проверьте, что в метриках есть `{sample}`.'
+    return float(match.group(1))
+
+
+@pytest.mark.django_db(transaction=True)
+class Test29Metrics:
+
+    @pytest.fixture(autouse=True)
+    def metrics_dir(self, settings, tmp_path):
+        settings.METRICS_DIR = tmp_path
+        cache.clear()
+        store.clear()
+        yield tmp_path
+        store.clear()
+
+    def test_01_admin_only(self, client, user_client, admin_client):
+        assert client.get(URL).status_code == HTTPStatus.UNAUTHORIZED
+        assert user_client.get(URL).status_code == HTTPStatus.FORBIDDEN
+        response = admin_client.get(URL)
+        assert response.status_code == HTTPStatus.OK
+        assert response['Content-Type'].startswith('text/plain'), (
+            'Проверьте, что метрики отдаются в текстовом формате Prometheus.'
+        )
+
+    def test_02_requests_and_queries(self, settings, client, admin_client):
+        settings.CATALOG_CACHE_ENABLED = True
+        for _ in range(3):
+            client.get('/api/v1/titles/')
+        client.get('/api/v1/titles/', {'facets': 'genre'})
+        content = admin_client.get(URL).content.decode()
+        assert get_value(
+            content,
+            'yamdb_http_requests_total{action="list",status="200",'
+            'view="titles-list"}'
+        ) == 4, (
+            'Проверьте, что запросы считаются по действию viewset.'
+        )
+        assert get_value(
+            content,
+            'yamdb_http_request_duration_seconds_bucket{action="list",'
+            'view="titles-list",le="+Inf"}'
+        ) == 4
+        assert get_value(
+            content,
+            'yamdb_db_queries_total{action="list",alias="default",'
+            'view="titles-list"}'
+        ) > 0
+        assert get_value(
+            content, 'yamdb_cache_hit_ratio{cache="catalog_response"}'
+        ) == 0.5, (
+            'Проверьте, что считается доля попаданий в кеш каталога.'
+        )
+        assert get_value(content, 'yamdb_email_outbox_depth') == 0
+        assert re.search(
+            r'^yamdb_process_resident_memory_bytes\{pid="\d+"\} \d+$',
+            content,
+            re.M,
+        )
+
+    def test_03_other_processes(self, client, admin_client, metrics_dir):
+        # pid не может превышать pid_max, поэтому процесса с ним нет.
+        dead_pid = 2 ** 22
+        labels = {'action': 'list', 'status': '200', 'view': 'genres-list'}
+        (metrics_dir / f'{dead_pid}.json').write_text(json.dumps({
+            'pid': dead_pid,
+            'started': 0,
+            'counters': [['yamdb_http_requests_total', labels, 5]],
+            'histograms': [],
+            'gauges': [['yamdb_email_outbox_depth', {}, 7]],
+        }))
+        client.get('/api/v1/genres/')
+        content = admin_client.get(URL).content.decode()
+        assert get_value(
+            content,
+            'yamdb_http_requests_total{action="list",status="200",'
+            'view="genres-list"}'
+        ) == 6, (
+            'Проверьте, что метрики суммируются по всем процессам.'
+        )
+        assert get_value(content, 'yamdb_email_outbox_depth') == 0, (
+            'Проверьте, что показатели завершившихся процессов '
+            'не учитываются.'
+        )
+        assert not (metrics_dir / f'{dead_pid}.json').exists(), (
+            'Проверьте, что файлы завершившихся процессов объединяются.'
+        )
+        assert (metrics_dir / 'aggregate.json').exists()
+        content = admin_client.get(URL).content.decode()
+        assert get_value(
+            content,
+            'yamdb_http_requests_total{action="list",status="200",'
+            'view="genres-list"}'
+        ) == 6, (
+            'Проверьте, что счётчики завершившихся процессов сохраняются '
+            'после объединения.'
+        )
+
+    def test_04_fork(self, client, metrics_dir):
+        client.get('/api/v1/genres/')
+        started = store.started
+        pid = os.fork()
+        if pid == 0:
+            store.flush_at_exit()
+            os._exit(int(
+                bool(store.counters) or store.started == started
+            ))
+        _, status = os.waitpid(pid, 0)
+        assert os.waitstatus_to_exitcode(status) == 0, (
+            'Проверьте, что после fork дочерний процесс начинает '
+            'метрики заново.'
+        )
+        assert not (metrics_dir / f'{pid}.json').exists(), (
+            'Проверьте, что процесс без запросов не создаёт файл метрик.'
+        )
+
+    def test_05_asgi_thread_pool(self, settings, admin_client):
+        create_titles(admin_client)
+        settings.ROOT_URLCONF = __name__
+        store.clear()
+        response = asgi_get('/api/v1/titles/')
+        assert response.status_code == HTTPStatus.OK
+        key = make_key(
+            'yamdb_db_queries_total',
+            {'action': 'list', 'alias': 'default', 'view': 'titles-list'},
+        )
+        assert store.counters.get(key, 0) >= 2, (
+            'Проверьте, что под ASGI учитываются SQL-запросы view, '
+            'выполненных в пуле потоков.'
+        )
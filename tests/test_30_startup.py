@@ -0,0 +1,63 @@
+import logging
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.urls import get_resolver
+
+from api.metrics import store
+from api_yamdb.startup import warm_up
+from reviews.management.commands.profile_startup import parse_import_times
+
+
+class Test30Startup:
+
+    def test_01_parse_import_times(self):
+        stderr = '\n'.join((
+            'import time: self [us] | cumulative | imported package',
+            'import time:       100 |        100 | early',
+            'startup-phase: setup',
+            'import time:        50 |         50 |   django.apps',
+            'import time:       120 |        170 | django',
+            'startup-phase: urlconf',
+            'import time:        30 |         30 | api.views',
+        ))
+        assert parse_import_times(stderr) == {
+            'setup': [('  django.apps', 50), ('django', 170)],
+            'urlconf': [('api.views', 30)],
+        }, (
+            'Проверьте, что импорты относятся к этапам по маркерам.'
+        )
+
+    def test_02_profile_startup(self):
+        output = StringIO()
+        call_command(
+            'profile_startup', path='/redoc/', limit=3, stdout=output
+        )
+        output = output.getvalue()
+        assert 'Статус первого запроса: 200 OK' in output
+        for phase in ('setup', 'handler', 'urlconf', 'first_request'):
+            assert f'{phase}: ' in output, (
+                f'Проверьте, что `profile_startup` измеряет этап {phase}.'
+            )
+
+    @pytest.mark.django_db(transaction=True)
+    def test_03_warm_up(self, settings, caplog, tmp_path):
+        settings.WARM_UP_PATHS = ('/api/v1/genres/', '/api/v1/missing/')
+        settings.PROFILING_SAMPLE_RATE = 1
+        settings.PROFILING_DIR = tmp_path / 'profiles'
+        settings.METRICS_DIR = tmp_path / 'metrics'
+        store.clear()
+        with caplog.at_level(logging.INFO, logger='api_yamdb.startup'):
+            warm_up()
+        assert 'Прогрев /api/v1/genres/: 200 OK' in caplog.text, (
+            'Проверьте, что прогрев выполняет запросы к `WARM_UP_PATHS`.'
+        )
+        assert 'Прогрев /api/v1/missing/: 404 Not Found' in caplog.text
+        assert get_resolver()._populated
+        assert not store.counters and not store.histograms, (
+            'Проверьте, что запросы прогрева не учитываются в метриках.'
+        )
+        assert not settings.PROFILING_DIR.exists(), (
+            'Проверьте, что запросы прогрева не профилируются.'
+        )
@@ -0,0 +1,168 @@
+from http import HTTPStatus
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from reviews.models import (
+    Comment,
+    Genre,
+    GenreTitle,
+    Review,
+    Title,
+    Tombstone,
+)
+
+
+def create_title(django_user_model, name, authors):
+    title = Title.objects.create(name=name, year=1984)
+    title.genre.add(Genre.objects.get_or_create(name='Драма', slug='drama')[0])
+    for index in range(authors):
+        author, _ = django_user_model.objects.get_or_create(
+            username=f'author{index}', email=f'author{index}@yamdb.fake'
+        )
+        review = Review.objects.create(
+            text='review', score=index % 10 + 1, author=author, title=title
+        )
+        Comment.objects.create(text='comment', author=author, review=review)
+    return title
+
+
+@pytest.mark.django_db(transaction=True)
+class Test31BulkDelete:
+
+    @pytest.fixture(autouse=True)
+    def chunk_size(self, settings):
+        settings.DELETION_CHUNK_SIZE = 2
+
+    def test_01_delete_title(self, admin_client, django_user_model):
+        title = create_title(django_user_model, 'Терминатор', 5)
+        other = create_title(django_user_model, 'Чужой', 1)
+        review_ids = list(title.reviews.values_list('pk', flat=True))
+        response = admin_client.delete(f'/api/v1/titles/{title.pk}/')
+        assert response.status_code == HTTPStatus.NO_CONTENT
+        assert not Title.objects.filter(pk=title.pk).exists()
+        assert not Review.objects.filter(pk__in=review_ids).exists()
+        assert not Comment.objects.filter(review_id__in=review_ids).exists()
+        assert not GenreTitle.objects.filter(title_id=title.pk).exists()
+        assert Review.objects.filter(title=other).count() == 1, (
+            'Проверьте, что удаляются только записи удаляемого произведения.'
+        )
+        assert Tombstone.objects.filter(
+            model_name=Tombstone.MODEL_REVIEW, object_id__in=review_ids
+        ).count() == 5, (
+            'Проверьте, что для удалённых отзывов создаются отметки удаления.'
+        )
+        assert Tombstone.objects.filter(
+            model_name=Tombstone.MODEL_COMMENT
+        ).count() == 5
+        assert Tombstone.objects.filter(
+            model_name=Tombstone.MODEL_TITLE, object_id=title.pk
+        ).exists()
+
+    def test_02_queries_do_not_grow(self, settings, admin_client,
+                                    django_user_model):
+        settings.DELETION_CHUNK_SIZE = 100
+        small = create_title(django_user_model, 'Терминатор', 2)
+        large = create_title(django_user_model, 'Чужой', 12)
+        query_counts = []
+        for title in (small, large):
+            with CaptureQueriesContext(connection) as queries:
+                admin_client.delete(f'/api/v1/titles/{title.pk}/')
+            query_counts.append(len(queries))
+        assert query_counts[0] == query_counts[1], (
+            'Проверьте, что количество запросов при удалении произведения '
+            'не зависит от количества отзывов.'
+        )
+
+    def test_03_delete_user(self, admin_client, django_user_model):
+        title = create_title(django_user_model, 'Терминатор', 3)
+        author = django_user_model.objects.get(username='author0')
+        other_review = Review.objects.get(
+            title=title, author__username='author1'
+        )
+        Comment.objects.create(
+            text='чужой', author=author, review=other_review
+        )
+        response = admin_client.delete(f'/api/v1/users/{author.username}/')
+        assert response.status_code == HTTPStatus.NO_CONTENT
+        assert not django_user_model.objects.filter(pk=author.pk).exists()
+        assert not Review.objects.filter(author_id=author.pk).exists()
+        assert not Comment.objects.filter(author_id=author.pk).exists()
+        title.refresh_from_db()
+        other_review.refresh_from_db()
+        assert title.reviews_count == 2, (
+            'Проверьте, что после удаления пользователя пересчитывается '
+            'счётчик отзывов произведения.'
+        )
+        assert title.rating == 2.5
+        assert other_review.comments_count == 1, (
+            'Проверьте, что после удаления пользователя пересчитывается '
+            'счётчик комментариев отзыва.'
+        )
+
+    def test_04_delete_review(self, admin_client, django_user_model):
+        title = create_title(django_user_model, 'Терминатор', 2)
+        review = title.reviews.get(author__username='author1')
+        for _ in range(3):
+            Comment.objects.create(text='comment', review=review)
+        response = admin_client.delete(
+            f'/api/v1/titles/{title.pk}/reviews/{review.pk}/'
+        )
+        assert response.status_code == HTTPStatus.NO_CONTENT
+        assert not Comment.objects.filter(review_id=review.pk).exists()
+        title.refresh_from_db()
+        assert (title.reviews_count, title.rating) == (1, 1.0)
+
+    def test_05_admin(self, client, django_user_model):
+        client.force_login(django_user_model.objects.create_superuser(
+            username='TestStaff', email='teststaff@yamdb.fake', role='admin'
+        ))
+        title = create_title(django_user_model, 'Терминатор', 3)
+        url = f'/admin/reviews/title/{title.pk}/delete/'
+        response = client.get(url)
+        assert response.status_code == HTTPStatus.OK
+        content = response.content.decode()
+        assert 'Отзывы: 3' in content and 'Комментарии: 3' in content, (
+            'Проверьте, что админка показывает количество зависимых записей.'
+        )
+        client.post(url, {'post': 'yes'})
+        assert not Title.objects.exists()
+        assert not Comment.objects.exists()
+
+        titles = [
+            create_title(django_user_model, name, 2)
+            for name in ('Чужой', 'Хищник')
+        ]
+        response = client.post('/admin/reviews/title/', {
+            'action': 'delete_selected',
+            '_selected_action': [title.pk for title in titles],
+            'post': 'yes',
+        })
+        assert response.status_code == HTTPStatus.FOUND
+        assert not Title.objects.exists()
+        assert not Review.objects.exists()
+
+    def test_06_admin_lists_limited(self, settings, client,
+                                    django_user_model):
+        settings.ADMIN_DELETED_OBJECTS_LIMIT = 1
+        client.force_login(django_user_model.objects.create_superuser(
+            username='TestStaff', email='teststaff@yamdb.fake', role='admin'
+        ))
+        titles = [
+            create_title(django_user_model, name, 1)
+            for name in ('Терминатор', 'Чужой', 'Хищник')
+        ]
+        response = client.post('/admin/reviews/title/', {
+            'action': 'delete_selected',
+            '_selected_action': [title.pk for title in titles],
+        })
+        assert response.status_code == HTTPStatus.OK
+        content = response.content.decode()
+        listed = [title.name for title in titles if title.name in content]
+        assert 'и ещё 2' in content and len(listed) == 1, (
+            'Проверьте, что админка перечисляет не больше '
+            '`ADMIN_DELETED_OBJECTS_LIMIT` удаляемых записей.'
+        )
+        assert Title.objects.count() == 3
+